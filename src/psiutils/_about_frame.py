@@ -1,15 +1,17 @@
 """Display About and History for a project."""
 import tkinter as tk
 from tkinter import ttk
-from tkinterweb import HtmlFrame
 from pathlib import Path
-import markdown
+from typing import TYPE_CHECKING
 
 from psiutils.constants import PAD, Pad
-from psiutils.utilities import window_resize
+from psiutils.utilities import geometry, window_resize
 
 from psiutils.text import Text
 
+if TYPE_CHECKING:
+    from tkinterweb import HtmlFrame
+
 txt = Text()
 
 DEFAULT_GEOMETRY = '400x200'
@@ -54,10 +56,7 @@ class AboutFrame():
 
     def show(self) -> None:
         root = self.root
-        try:
-            root.geometry(self.config.geometry[Path(__file__).stem])
-        except KeyError:
-            root.geometry(DEFAULT_GEOMETRY)
+        root.geometry(geometry(self.config, __file__, DEFAULT_GEOMETRY))
         root.title(f'About - {self.app_name.get()}')
         root.transient(self.parent.root)
 
@@ -164,10 +163,7 @@ class HistoryFrame():
 
     def show(self) -> None:
         root = self.root
-        try:
-            root.geometry(self.config.geometry['history'])
-        except KeyError:
-            root.geometry(HISTORY_GEOMETRY)
+        root.geometry(geometry(self.config, 'history', HISTORY_GEOMETRY))
         root.title(f'{self.app_name.get()} - History')
         root.transient(self.parent.root)
 
@@ -196,6 +192,8 @@ class HistoryFrame():
         frame.rowconfigure(0, weight=1)
         frame.columnconfigure(0, weight=1)
 
+        # tkinterweb and markdown are slow to import: load them on show
+        from tkinterweb import HtmlFrame
         self.html_frame = HtmlFrame(
             frame, horizontal_scrollbar='auto', messages_enabled=False)
         self.html_frame.grid(row=0, column=0, sticky=tk.NSEW)
@@ -212,7 +210,8 @@ class HistoryFrame():
         return frame
 
     def display_html(
-            self, html_frame: HtmlFrame, text: str) -> None:
+            self, html_frame: 'HtmlFrame', text: str) -> None:
+        import markdown
         html = markdown.markdown(text)
         page = f"""
             <!DOCTYPE html>
@@ -230,7 +229,7 @@ class HistoryFrame():
         return page
 
     def _write_html_file(
-            self, html_frame: HtmlFrame, file: str, text: str) -> None:
+            self, html_frame: 'HtmlFrame', file: str, text: str) -> None:
         temp_path = Path(self.data_dir, file)
         path = str(temp_path)
         with open(path, 'w') as f_html:
@@ -0,0 +1,64 @@
+"""
+Pre-render the psiutils icons into _icon_atlas.
+
+Run after adding or changing an icon:
+
+    python -m psiutils._build_icons
+"""
+import base64
+import io
+from pathlib import Path
+from PIL import Image
+
+from psiutils._images import ICON_DIR, ICON_SIZE, HIDPI_SCALE
+from psiutils.treeview import CHECK_BOX_SIZE
+
+ATLAS = Path(__file__).parent / '_icon_atlas.py'
+CHECK_BOXES = ('checkbox_checked', 'checkbox_unchecked')
+LINE_LENGTH = 64
+
+HEADER = '''"""
+The psiutils icons as base64 PNG data, at the sizes psiutils uses.
+
+Generated by `python -m psiutils._build_icons`: do not edit.
+"""
+# (icon, size in pixels) -> base64 PNG
+ICONS = {
+'''
+
+
+def icon_sizes(icon: str) -> list[int]:
+    size = CHECK_BOX_SIZE[0] if icon in CHECK_BOXES else ICON_SIZE[0]
+    return [size, size * HIDPI_SCALE]
+
+
+def render(path: Path, size: int) -> str:
+    """Return the image at path resized to size as base64 PNG."""
+    with Image.open(path) as image:
+        image = image.convert('RGBA').resize((size, size), Image.LANCZOS)
+        data = io.BytesIO()
+        image.save(data, 'PNG', optimize=True)
+    return base64.b64encode(data.getvalue()).decode('ascii')
+
+
+def build() -> str:
+    lines = [HEADER]
+    for path in sorted(ICON_DIR.glob('*.png')):
+        for size in icon_sizes(path.stem):
+            data = render(path, size)
+            lines.append(f'    ({path.stem!r}, {size}): (\n')
+            lines.extend(
+                f"        '{data[start:start + LINE_LENGTH]}'\n"
+                for start in range(0, len(data), LINE_LENGTH))
+            lines.append('    ),\n')
+    lines.append('}\n')
+    return ''.join(lines)
+
+
+def main() -> None:
+    ATLAS.write_text(build(), encoding='utf-8')
+    print(f'Wrote {ATLAS}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Infer the type of a Treeview column and build its sort keys."""
+import re
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import islice
+
+NUMBER = 'number'
+ISO_DATE = 'iso_date'
+DMY_DATE = 'dmy_date'  # as date_picker.DATE_FORMAT: '%d/%m/%Y'
+DATE = 'date'  # anything dateutil can parse
+TEXT = 'text'
+
+SAMPLE_SIZE = 50
+MIN_DATE_LENGTH = 8
+PARSE_CACHE_SIZE = 65_536
+
+_DMY_RE = re.compile(
+    r'(\d{1,2})/(\d{1,2})/(\d{4})(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}))?)?$')
+
+
+def infer_type(values) -> str:
+    """Return the type of the first SAMPLE_SIZE non-blank values."""
+    sample = list(islice(
+        (text for text in (_text(value) for value in values) if text),
+        SAMPLE_SIZE))
+    if not sample:
+        return TEXT
+    for kind in (NUMBER, ISO_DATE, DMY_DATE, DATE):
+        if all(_converts(kind, text) for text in sample):
+            return kind
+    return TEXT
+
+
+def typed_keys(values: list, kind: str) -> list | None:
+    """
+    Return a sort key for each value as kind.
+
+    Blank values sort first. Returns None if a value cannot be
+    converted, i.e. kind does not fit the column.
+    """
+    if kind == TEXT:
+        return [str(value) for value in values]
+
+    convert, blank = _CONVERTERS[kind]
+    keys = []
+    try:
+        for value in values:
+            text = _text(value)
+            keys.append(convert(text) if text else blank)
+    except (ValueError, OverflowError):
+        return None
+    return keys
+
+
+def sort_keys(values: list, kind: str = '') -> tuple[str, list]:
+    """
+    Return the kind of values and their sort keys.
+
+    kind, e.g. the type remembered from an earlier load, is tried
+    first; the type is only inferred again if it no longer fits.
+    """
+    if kind:
+        keys = typed_keys(values, kind)
+        if keys is not None:
+            return (kind, keys)
+    kind = infer_type(values)
+    keys = typed_keys(values, kind)
+    if keys is None:
+        kind, keys = TEXT, typed_keys(values, TEXT)
+    return (kind, keys)
+
+
+def _text(value) -> str:
+    if value is None:
+        return ''
+    return value.strip() if isinstance(value, str) else str(value)
+
+
+def _converts(kind: str, text: str) -> bool:
+    if kind == DATE and len(text) < MIN_DATE_LENGTH:
+        return False
+    try:
+        _PARSERS[kind](text)
+    except (ValueError, OverflowError):
+        return False
+    return True
+
+
+def _naive(date: datetime) -> datetime:
+    """Make dates comparable: convert aware dates to naive UTC."""
+    if date.tzinfo is None:
+        return date
+    return date.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _iso_date(text: str) -> datetime:
+    return _naive(datetime.fromisoformat(text))
+
+
+def _dmy_date(text: str) -> datetime:
+    match = _DMY_RE.match(text)
+    if not match:
+        raise ValueError(f'Not a dd/mm/yyyy date: {text}')
+    day, month, year, hour, minute, second = match.groups()
+    return datetime(int(year), int(month), int(day),
+                    int(hour or 0), int(minute or 0), int(second or 0))
+
+
+def _any_date(text: str, dayfirst: bool = False) -> datetime:
+    # dateutil is the slow path: only imported when a fast path fails
+    from dateutil.parser import parse  # type: ignore
+    return _naive(parse(text, dayfirst=dayfirst))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date(text: str, kind: str) -> datetime:
+    """Parse text with the fast path for kind, falling back to dateutil."""
+    try:
+        return _PARSERS[kind](text)
+    except ValueError:
+        return _any_date(text, dayfirst=kind == DMY_DATE)
+
+
+# Strict parsers used to infer the type of a column
+_PARSERS = {
+    NUMBER: float,
+    ISO_DATE: _iso_date,
+    DMY_DATE: _dmy_date,
+    DATE: _any_date,
+}
+
+# Key functions and the key for a blank value
+_CONVERTERS = {
+    NUMBER: (float, float('-inf')),
+    ISO_DATE: (partial(_parse_date, kind=ISO_DATE), datetime.min),
+    DMY_DATE: (partial(_parse_date, kind=DMY_DATE), datetime.min),
+    DATE: (partial(_parse_date, kind=DATE), datetime.min),
+}
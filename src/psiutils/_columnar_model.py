@@ -0,0 +1,471 @@
+"""Column-oriented (array-backed) row storage for psiutils Treeviews."""
+from array import array
+
+from psiutils._column_types import SAMPLE_SIZE, sort_keys, typed_keys
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional: fall back to the array module
+    np = None
+
+STR = 'str'
+INT = 'int'
+FLOAT = 'float'
+
+# array typecodes: strings are stored as codes into their categories
+_TYPECODES = {STR: 'q', INT: 'q', FLOAT: 'd'}
+_CONVERTERS = {INT: int, FLOAT: float}
+
+
+class ColumnarModel():
+    """
+    Hold the rows of a Treeview column by column.
+
+    Each column is one array: numbers as int64 or float64 and strings
+    dictionary-encoded, i.e. stored once each in `categories` with an
+    array of codes per row. Compared with a list of row tuples this
+    takes a fraction of the memory, and sorting and filtering are
+    whole-column operations (vectorized when numpy is installed).
+
+    Rows are identified by their index in the columns (a row id), as
+    in RowModel, and `order` holds the row ids in display order.
+
+    Usage:
+
+        model = ColumnarModel(
+            [names, scores], [STR, FLOAT])
+        model.sort(1)
+        model.filter(model.mask(0, lambda name: name.startswith('a')))
+    """
+    def __init__(self, columns: list = None, dtypes: list[str] = ()) -> None:
+        """
+        :param columns: a sequence of values (a list, array.array or
+            numpy array) for each column.
+        :param dtypes: the type of each column: STR, INT or FLOAT.
+            Columns without a dtype are STR.
+        """
+        self.dtypes = list(dtypes)
+        self.columns: list[_Column] = []
+        self._mask = None
+        self._clear_sort()
+        self.order = _arange(0)
+        if columns is not None:
+            self.load_columns(columns)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def rows(self) -> '_Rows':
+        """All the rows in row id order, built as they are read."""
+        return _Rows(self)
+
+    @property
+    def row_count(self) -> int:
+        """The number of rows, including those hidden by filter."""
+        return len(self.columns[0]) if self.columns else 0
+
+    def row_ids(self) -> range:
+        """Return the ids of all the rows, including those hidden by filter."""
+        return range(self.row_count)
+
+    def load_columns(self, columns: list) -> None:
+        """Replace the rows with columns of values."""
+        columns = list(columns)
+        if len({len(values) for values in columns}) > 1:
+            raise ValueError('Columns must all be the same length')
+        self.columns = [
+            _Column(values, self._dtype(column))
+            for column, values in enumerate(columns)
+        ]
+        self._reset()
+
+    def load(self, rows: list[tuple]) -> None:
+        """Replace the rows with rows of values."""
+        self.load_columns(self._transpose(rows))
+
+    def extend(self, rows: list[tuple], mask=None) -> None:
+        """
+        Add rows, keeping the sort and the filter. mask holds one bool
+        per new row, whether the filter shows it; by default the new
+        rows are shown.
+        """
+        rows = list(rows)
+        if mask is not None and len(mask) != len(rows):
+            raise ValueError('The mask must have one value per new row')
+        if not self.columns:
+            self.load(rows)
+            if mask is not None:
+                self.filter(mask)
+            return
+        start = self.row_count
+        old_mask = self._mask
+        sort_column, reverse = self.sort_column, self.sort_reverse
+        ascending = self._ascending.get(sort_column)
+        kind = self.columns[sort_column].kind if ascending is not None else ''
+        for column, values in zip(self.columns, self._transpose(rows)):
+            column.extend(values)
+
+        if mask is not None or old_mask is not None:
+            if old_mask is None:
+                old_mask = _array([True] * start, '?')
+            if mask is None:
+                mask = [True] * (self.row_count - start)
+            self._mask = _concatenate(old_mask, _array(mask, '?'))
+        # The cached orders are out of date
+        self._clear_sort()
+        if sort_column is not None:
+            column = self.columns[sort_column]
+            # Infer the type again while the sample is smaller than
+            # the one load would use
+            keys = column.sort_keys(infer=start < SAMPLE_SIZE)
+            if ascending is not None and column.kind == kind:
+                # The old rows are in order already: merge in the new
+                ascending = _merge(ascending, keys, start)
+            else:
+                ascending = _argsort(keys)
+            self._ascending[sort_column] = ascending
+            self.sort_column = sort_column
+            self.sort_reverse = reverse
+        self._apply()
+
+    def _transpose(self, rows: list[tuple]) -> list[list]:
+        rows = list(rows)
+        width = max([len(self.dtypes), len(self.columns)]
+                    + [len(row) for row in rows])
+        return [[_cell(row, column) for row in rows]
+                for column in range(width)]
+
+    def _dtype(self, column: int) -> str:
+        return self.dtypes[column] if column < len(self.dtypes) else STR
+
+    def _reset(self) -> None:
+        self._mask = None
+        self._clear_sort()
+        self.order = _arange(self.row_count)
+
+    def _clear_sort(self) -> None:
+        self._ascending: dict[int, object] = {}
+        self.sort_column: int | None = None
+        self.sort_reverse = False
+        self._positions = None
+
+    def add_index(self, column: int) -> None:
+        """Columns are always indexed: strings by their encoding."""
+
+    def row(self, position: int) -> tuple:
+        """Return the row displayed at position."""
+        return self._take_rows([self.order[position]])[0]
+
+    def row_id(self, position: int) -> int:
+        """Return the row id of the row displayed at position."""
+        return int(self.order[position])
+
+    def window(self, start: int, count: int) -> list[tuple]:
+        """Return count rows in display order, starting at start."""
+        return self._take_rows(self.order[start:start+count])
+
+    def _take_rows(self, row_ids) -> list[tuple]:
+        return list(zip(*[column.take(row_ids) for column in self.columns]))
+
+    def position(self, row_id: int) -> int | None:
+        """Return the display position of row_id, None if filtered out."""
+        if self._positions is None:
+            self._positions = _inverse(self.order, self.row_count)
+        position = self._positions[row_id]
+        return None if position < 0 else int(position)
+
+    def values(self, row_ids) -> list[tuple]:
+        """
+        Return the rows with the given ids, in display order.
+
+        Rows hidden by filter follow, in row id order.
+        """
+        hidden = self.row_count
+
+        def display_order(row_id: int) -> tuple[int, int]:
+            position = self.position(row_id)
+            return (hidden if position is None else position, row_id)
+
+        return self._take_rows(sorted(row_ids, key=display_order))
+
+    def lookup(self, column: int, values: list) -> list[int]:
+        """Return the ids of the rows whose value in column is in values."""
+        return _nonzero(self.columns[column].isin(values))
+
+    def find(self, column: int, value: object) -> int | None:
+        """Return the display position of the first row matching value."""
+        positions = [
+            position for position in map(
+                self.position, self.lookup(column, [value]))
+            if position is not None
+        ]
+        return min(positions, default=None)
+
+    def sort(self, column: int, reverse: bool = False) -> None:
+        """
+        Sort the display order on column.
+
+        The ascending order of each column is an argsort of its keys,
+        cached until the rows change. Reversing the current sort costs
+        a reverse of the order.
+        """
+        if column == self.sort_column:
+            if reverse != self.sort_reverse:
+                self.order = self.order[::-1]
+                self.sort_reverse = reverse
+                self._positions = None
+            return
+
+        if column not in self._ascending:
+            self._ascending[column] = _argsort(
+                self.columns[column].sort_keys())
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self._apply()
+
+    def filter(self, mask=None) -> None:
+        """
+        Show only the rows where mask, a sequence of one bool per row
+        id, is true. A mask of None shows all the rows.
+        """
+        if mask is not None:
+            if len(mask) != self.row_count:
+                raise ValueError('The mask must have one value per row')
+            mask = _array(mask, '?')
+        self._mask = mask
+        self._apply()
+
+    def mask(self, column: int, predicate) -> object:
+        """
+        Return a filter mask of the rows for which predicate(value) is
+        true. The predicate is called once per distinct value.
+        """
+        return self.columns[column].mask(predicate)
+
+    def _apply(self) -> None:
+        """Rebuild the display order from the sort and the filter."""
+        if self.sort_column is None:
+            order = _arange(self.row_count)
+        else:
+            order = self._ascending[self.sort_column]
+        if self.sort_reverse:
+            order = order[::-1]
+        if self._mask is not None:
+            order = _select(order, self._mask)
+        self.order = order
+        self._positions = None
+
+
+class _Column():
+    """The values of one column: numbers, or dictionary-encoded strings."""
+    def __init__(self, values, dtype: str) -> None:
+        self.dtype = dtype
+        self.kind = ''  # of the strings: see sort_keys
+        self._category_keys: list | None = None
+        self._ranked: list[int] = []  # the categories in key order
+        self.categories: list[str] = []
+        self._codes: dict[str, int] = {}
+        self.data = self._encode(values)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def _encode(self, values) -> object:
+        if self.dtype != STR:
+            if not _is_ndarray(values):
+                convert = _CONVERTERS[self.dtype]
+                values = [convert(value) for value in values]
+            return _array(values, _TYPECODES[self.dtype])
+
+        codes = self._codes
+        categories = self.categories
+        encoded = []
+        for value in values:
+            text = str(value)
+            code = codes.get(text)
+            if code is None:
+                code = codes[text] = len(categories)
+                categories.append(text)
+            encoded.append(code)
+        return _array(encoded, _TYPECODES[STR])
+
+    def extend(self, values) -> None:
+        self.data = _concatenate(self.data, self._encode(values))
+
+    def take(self, row_ids) -> list:
+        """Return the values of row_ids as Python objects."""
+        values = _tolist(_take(self.data, row_ids))
+        if self.dtype == STR:
+            categories = self.categories
+            return [categories[code] for code in values]
+        return values
+
+    def sort_keys(self, infer: bool = False) -> object:
+        """
+        Return an array of sort keys, one per row. The keys of a string
+        column are the ranks of its categories, which are typed (see
+        sort_keys) so dates and numbers held as strings sort as such.
+
+        The keys and the order of the categories are kept, so only the
+        categories added since are typed, and merged in. infer infers
+        the type of the strings again.
+        """
+        if self.dtype != STR:
+            return self.data
+        categories = self.categories
+        keys = None if infer else self._category_keys
+        if keys is not None and len(keys) < len(categories):
+            new_keys = typed_keys(categories[len(keys):], self.kind)
+            if new_keys is None:
+                keys = None
+            else:
+                keys.extend(new_keys)
+        if keys is None:
+            if infer:
+                self.kind = ''
+            self.kind, keys = sort_keys(categories, self.kind)
+            self._category_keys = keys
+            self._ranked = []
+        # The categories ranked before are in order: the sort is a merge
+        self._ranked = sorted(
+            [*self._ranked, *range(len(self._ranked), len(keys))],
+            key=keys.__getitem__)
+        return _take(_inverse(self._ranked, len(keys)), self.data)
+
+    def isin(self, values) -> object:
+        if self.dtype == STR:
+            wanted = {self._codes.get(str(value)) for value in values}
+            wanted.discard(None)
+        else:
+            convert = _CONVERTERS[self.dtype]
+            wanted = set()
+            for value in values:
+                try:
+                    wanted.add(convert(value))
+                except (TypeError, ValueError):
+                    continue
+        if np is not None:
+            return np.isin(self.data, list(wanted))
+        return [value in wanted for value in self.data]
+
+    def mask(self, predicate) -> object:
+        if self.dtype == STR:
+            truth = _array([bool(predicate(category))
+                            for category in self.categories], '?')
+            return _take(truth, self.data)
+        if np is not None:
+            distinct, inverse = np.unique(self.data, return_inverse=True)
+            truth = np.array([bool(predicate(value))
+                              for value in distinct.tolist()], dtype=bool)
+            return truth[inverse]
+        truth = {value: bool(predicate(value)) for value in set(self.data)}
+        return [truth[value] for value in self.data]
+
+
+class _Rows():
+    """The rows of a ColumnarModel as a read-only sequence of tuples."""
+    def __init__(self, model: ColumnarModel) -> None:
+        self._model = model
+
+    def __len__(self) -> int:
+        return self._model.row_count
+
+    def __getitem__(self, index: int | slice) -> tuple | list[tuple]:
+        row_ids = range(len(self))[index]
+        if isinstance(index, slice):
+            return self._model._take_rows(row_ids)
+        return self._model._take_rows([row_ids])[0]
+
+    def __iter__(self):
+        step = 1_000
+        for start in range(0, len(self), step):
+            yield from self[start:start + step]
+
+
+def _cell(row: tuple, column: int) -> object:
+    return row[column] if column < len(row) else ''
+
+
+# Array operations: numpy when installed, else the array module.
+# '?' (bool) is numpy only; without numpy masks are lists of bool.
+
+def _is_ndarray(values) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _array(values, typecode: str) -> object:
+    if np is not None:
+        return np.asarray(values, dtype=np.dtype(typecode))
+    if typecode == '?':
+        return [bool(value) for value in values]
+    return array(typecode, values)
+
+
+def _arange(count: int) -> object:
+    if np is not None:
+        return np.arange(count)
+    return array('q', range(count))
+
+
+def _concatenate(first, second) -> object:
+    if np is not None:
+        return np.concatenate([first, second])
+    return first + second
+
+
+def _take(data, indices) -> object:
+    if np is not None:
+        return data[np.asarray(indices, dtype=np.intp)]
+    if isinstance(data, list):
+        return [data[index] for index in indices]
+    return array(data.typecode, [data[index] for index in indices])
+
+
+def _tolist(data) -> list:
+    return data.tolist() if hasattr(data, 'tolist') else list(data)
+
+
+def _argsort(keys) -> object:
+    if np is not None:
+        return np.argsort(keys, kind='stable')
+    return array('q', sorted(range(len(keys)), key=keys.__getitem__))
+
+
+def _merge(order, keys, start: int) -> object:
+    """
+    Return order, the ids of the rows before start sorted on keys, with
+    the rows from start merged in. Ties keep row id order.
+    """
+    if np is not None:
+        new = np.arange(start, len(keys))
+        new = new[np.argsort(keys[start:], kind='stable')]
+        at = np.searchsorted(keys[order], keys[new], side='right')
+        return np.insert(order, at, new)
+    # Two sorted runs: the sort is a merge
+    return array('q', sorted(
+        [*order, *range(start, len(keys))], key=keys.__getitem__))
+
+
+def _select(order, mask) -> object:
+    if np is not None:
+        return order[mask[order]]
+    return array('q', [row_id for row_id in order if mask[row_id]])
+
+
+def _nonzero(mask) -> list[int]:
+    if np is not None:
+        return np.flatnonzero(mask).tolist()
+    return [row_id for row_id, selected in enumerate(mask) if selected]
+
+
+def _inverse(order, count: int) -> object:
+    """Return the position of each row id in order, -1 if absent."""
+    if np is not None:
+        positions = np.full(count, -1)
+        positions[order] = np.arange(len(order))
+        return positions
+    positions = array('q', [-1]) * count
+    for position, row_id in enumerate(order):
+        positions[row_id] = position
+    return positions
@@ -0,0 +1,175 @@
+"""Write-behind persistence of window geometry."""
+import atexit
+import contextlib
+import os
+import tkinter as tk
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from psiconfig import TomlConfig
+
+SAVE_DELAY_MS = 500  # after the last change of geometry
+
+
+class GeometryWriter():
+    """
+    Save the geometry of the windows of one config file.
+
+    Changes are held in memory, and in the config's geometry table,
+    and written once the window has stopped moving for SAVE_DELAY_MS,
+    when the window is destroyed or when the program exits. The file is
+    written from its latest contents (see load_document), so that other
+    settings saved since it was loaded are kept, and replaced
+    atomically.
+    """
+    def __init__(self, config: 'TomlConfig') -> None:
+        self.config = config
+        self.pending: dict[str, str] = {}
+        self._job = None
+        self._widget = None
+        self._roots: set[str] = set()
+
+    def set(self, root: tk.Misc, key: str, geometry: str) -> None:
+        """Record the geometry of the window key, shown in root."""
+        saved = self.config.geometry
+        if self.pending.get(key, saved.get(key)) == geometry:
+            return  # e.g. <Configure> of a child widget
+        saved[key] = geometry
+        self.pending[key] = geometry
+
+        self._cancel()
+        self._widget = root
+        self._job = root.after(SAVE_DELAY_MS, self.flush)
+        if str(root) not in self._roots:
+            self._roots.add(str(root))
+            root.bind('<Destroy>', self._on_destroy, add='+')
+
+    def flush(self) -> None:
+        """Write the pending geometry now."""
+        self._cancel()
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, {}
+        path = Path(self.config.path).resolve()
+        document = load_document(path)
+        if document is None:
+            document = self.config.config
+        geometry = {**document.get('geometry', {}), **pending}
+        document = {**document, 'geometry': geometry}
+        save_atomic(path, document)
+        _remember(path, document)
+
+    def _cancel(self) -> None:
+        if self._job is not None:
+            with contextlib.suppress(tk.TclError):
+                self._widget.after_cancel(self._job)
+            self._job = None
+            self._widget = None
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if str(event.widget) in self._roots:
+            self._roots.discard(str(event.widget))
+            self.flush()
+
+
+# Config file path -> writer
+_writers: dict[Path, GeometryWriter] = {}
+# Config file path -> (mtime, size, contents)
+_documents: dict[Path, tuple[int, int, dict]] = {}
+
+
+def geometry_writer(config: 'TomlConfig') -> GeometryWriter:
+    """Return the writer for the file of config, shared by its windows."""
+    path = Path(config.path).resolve()
+    writer = _writers.get(path)
+    if writer is None:
+        writer = _writers[path] = GeometryWriter(config)
+    elif writer.config is not config:
+        config.geometry.update(writer.pending)
+        writer.config = config
+    return writer
+
+
+def saved_geometry(config: 'TomlConfig | str | Path') -> dict[str, str]:
+    """
+    Return the geometry table of a config file, including the changes
+    not yet written. config is a TomlConfig or the path of its file.
+    """
+    path = Path(getattr(config, 'path', config)).resolve()
+    document = load_document(path)
+    if document is not None:
+        table = dict(document.get('geometry', {}))
+    else:
+        table = dict(getattr(config, 'geometry', {}))
+    writer = _writers.get(path)
+    if writer is not None:
+        table.update(writer.pending)
+    return table
+
+
+def load_document(path: Path) -> dict | None:
+    """
+    Return the contents of the toml file at path; None if it cannot
+    be read.
+
+    The contents are cached for the process and the file is parsed
+    again only when its modification time or size changes, so windows
+    opening together cost one parse, and a file saved by another
+    process is read on next use. The contents must not be modified.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _documents.pop(path, None)
+        return None
+    cached = _documents.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    from psi_toml.parser import TomlParser
+    try:
+        with open(path, encoding='utf-8') as file:
+            document = TomlParser().load(file)
+    except Exception:  # as TomlConfig, treat a bad file as missing
+        _documents.pop(path, None)
+        return None
+    _documents[path] = (stat.st_mtime_ns, stat.st_size, document)
+    return document
+
+
+def _remember(path: Path, document: dict) -> None:
+    """Cache the contents just written to path."""
+    with contextlib.suppress(OSError):
+        stat = os.stat(path)
+        _documents[path] = (stat.st_mtime_ns, stat.st_size, document)
+
+
+@atexit.register
+def flush_all() -> None:
+    """Write the pending geometry of every config file."""
+    for writer in _writers.values():
+        writer.flush()
+
+
+def save_atomic(path: Path, data: dict) -> None:
+    """
+    Write data to the toml file at path, as TomlConfig.save does, via a
+    temporary file, so the file is never left half-written.
+    """
+    import tempfile
+    from psi_toml.parser import TomlParser
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8') as file:
+            TomlParser().dump(data, file)
+        with contextlib.suppress(OSError):
+            os.chmod(temp_path, os.stat(path).st_mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
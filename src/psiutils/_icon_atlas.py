@@ -0,0 +1,1213 @@
+"""
+The psiutils icons as base64 PNG data, at the sizes psiutils uses.
+
+Generated by `python -m psiutils._build_icons`: do not edit.
+"""
+# (icon, size in pixels) -> base64 PNG
+ICONS = {
+    ('backup', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABRUlEQVR42qXTz0pV'
+        'URgF8N8595pZoJJYOqgcqVBCzZo7EiUa+AY9QO/SAzjqIRo2aOKkZiWOlCa3QhC7'
+        'ClH3HifryPZgoHTgg7P3Wnt9//nPr+qcl/EQfzv343An8A37LVAXIovYxAhNHrV2'
+        'O9wRtsK9CKAVWMHGPyJ9ian8b4YLVb8gnWAJC/E2LrCPmIk9wqcyhW5NRkXoTWwW'
+        'vWCX3pSHaRziJwb4ge+xNQyDHYYLuik8xny8tZVv8AGTeBDO57Z29TVaXeN+BIY4'
+        'w68IV9dJYYBnOI73JWxjDuNe0cZbeIGDiN3B3dgeXqVD7yO2hdN+J9wm+ddF+GOs'
+        'Zwp3Cu5XvOlfkcLgijo8wbuIt+0+xW63C6spUjsDNf4EvxcHE5mHCl96hcAQRxma'
+        'JoTWjvE8tTgL/hpvqxts7tPsylGW6zd2zwE4z1C8FDR2LAAAAABJRU5ErkJggg=='
+    ),
+    ('backup', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAC5klEQVR42s2XTYhN'
+        'YRjHf++5587Mde+1wEKUlEJqVop8ZCG2FiyQooxiM3YsRBFbyWpI2fgak1Fko8jI'
+        'jmJho0QxN40NFob7eY7N/6230/maO0e89XbOeT+e53mf5/n/3+fAP24mY84UpCdU'
+        '//+aSRgLgaXAPqCib9PHqQ3wC7gLzDiyEw2wbl8AXAcawDRQynChAXy994BAYz1g'
+        'BbAMGJExqeHw9FwNTBTo6QnJdHWAY3Vc6wB14Hec6yLhqgHngYXATeCZZHcVwk6S'
+        'Ej/D8sBxZ1oImsBjKfuoPV1nP/0YUAZmc7q4CTyKMR7JKOc1IFSMGpo7CLwG2nJz'
+        '23FrS8lpE6+icJWk8CcwAKyXrGnJDrM8EEpgSfNNfVuXdjQedW9HBg5qbUfzvmT1'
+        '8pCRi4I7BTGhB4wnocDLIJKKjPAcjnC7Ha8CF4CrwBaHFwwwlJaIfh9MmQTZKRnS'
+        'cA6QKcPPUD4bERbnJRT7J5G5noMCMxcUGOCz6Pgw8ELCajppR6FpOyEMNNZUwpWE'
+        'Ag/YprlPcXziFUi3FhVhQghN3ox1UVDUjXsbWCP5/lxQUM2JgjowJqN3RJTYtS2H'
+        'okt5URDmnG9JeRl4LyXLgQPAOmAYuAi8Eye8jWPFaAjG55Ej+3Ujnga2AitFyceB'
+        'p8Ap6x2TgPsycA94ADwXCuo6WUtZ3Y3srajqGQE2A6PAhxjjasA1eeOcn1LddAW1'
+        'IT0t/5fVAyeWlvPXAsd02q+6jLoOvC08DwEPge1FV0SjwAnHi2ncswu44WXQa1VG'
+        'lfRM6nXgMnBElGwcJiSGIQ3wCljl5eCFPD0QFTeB7znR8w24X3QIxoANDkdkXnJJ'
+        'FdEXvV/SvZCnLA+U/W+Al9oTpBSyi4BNWT8me3Up5fkxaQFLhIDdugV9JxesVwZV'
+        'O+xJgOm82xmx4kDKmkkd6mSRP6d2fRc4C2wErigcP0RAw8BRhXUKmDH8vbZT9cRi'
+        '5UNbVfMkcMsu+gOxocTjf1K/6wAAAABJRU5ErkJggg=='
+    ),
+    ('build', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABG0lEQVR42p3TvS6E'
+        'URDG8d/77i4SloRk10dENBTiAmg0rkAhQWQL0Ss1LsE9oFNLKCRuAqXQ+IhKaDZk'
+        'l2ZW3hX2xZRznjlz/s/MIT/SToeFnOIE76Ebi9zrV0Gnzk3MYg59GMV25Jt5nRMM'
+        'Ywsj2IwL2pqnOdxzOEIvXnCHCnZRhmIOexL8N1hCDV14RD+eO3WvYAczmbMpVAOn'
+        'B0nyzVQawVzDXuSH8IZuLOIUF0i/jvEd41jDIeqRX0cJAzjBdQszyfCWMI/pMK7l'
+        'zyr28fCNR9KMUctYCIT7EK7gIIqLofsszi5SFRu4xBMmgvcYt5ml+tHxenQeDMMm'
+        'cR7FxU5bV4hL6iGaifFd4Sye2vCHKAfOvyL95Sdriw9jijY7GyghlQAAAABJRU5E'
+        'rkJggg=='
+    ),
+    ('build', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACXElEQVR42s3XzYvO'
+        'URQH8M/zPDOT0aBpJOMlQlYKMYaalJeF7EisiCwkhD9gSlKysJCFUDJ5SVHEBitp'
+        'ZDSJaKbMQknsUGbFvNmcR7enGTK/3zPj7u69v9/5nnO+33vOvUzyKFTZ5shEBlNE'
+        '6V8DLOUEXsJwRDwdszCEnxNBQTHAN+AAZqIfS/AMRzBYDToKSQbP4Al2YipW4R02'
+        'xnfV0Npv8BO4F5mA1ehFS0WWi3kLDpbhOWpj3oLXaI15zd/AixmP2n7cwECsrQiH'
+        'XoRTg+HEMNpwMS/tlQ08wPJkvijWyt+kmelDDxpSG8WMNNTiayi8gA8BsCXWBrAW'
+        'V7E7nGhMjdRkEOAgvmAhPoatAVzGURzCp9DDPryMGvEta/rLTq8JwbVE9JXZXBwa'
+        'WRnz7biVtQCWwVvxBpvj7FfSUhglY51RF8btQAreE9xCM/b84b8G3MXJPMFbK/Zm'
+        'Y1fQ0Yb5kfpj6EJ7lmOfcp6CL8WMxOgmvMJNPMR9nI3aMC7wUgV4bwLeiG3hhKDj'
+        'bUJLpq5b2TzaKsDhIOoTWtL9UmKjlKXW7EUHupPImgLcGJqoyXrGi2HkOq4Ef7UV'
+        '+03VAi/z1I7zqMPtEFQHpiTU5A5eNlyPx5iDRziMeTgXTsC6vMFTB+ZG0VgQN5z0'
+        'KD6NotKdN+fp+B5Z+BFXq/WJ6j9H4+mLfl8TDSmXxjISGujH+6hqO3AnnBrBVlwK'
+        'aorVumQWQuWdOB5UNEdnu4BrY3S+3F5GheRufzocGIrsdOFU8k/VXj2pU9PiFNRN'
+        'xpuxNIpeCtWM9r96aE7Y+AVMMnDP9+PT3QAAAABJRU5ErkJggg=='
+    ),
+    ('cancel', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABKklEQVR42o3Sv05U'
+        'URAG8N+9NzYUhhiNWUIFQd5hKzRxWbel2FAsBWxFA7wErdTGzvgOPoG1hW+ghfUm'
+        'Via7NN+Fk8v+cZLJmXznmzkz3xwerc5ZWW1Vh/vE9tcUqToc0KTaAn2cYxs/C1wR'
+        'j3GCGX6hrjHHIUa4wWtMgjfxebBeOKPkzNsOZniJHXzFO7zBj7w8yf0dBviL71h0'
+        'Z53iN77hGn+C9/ARQ+zi8zIBW2UvcJz4Mi7YdNMWmpxneIvn8aNgJWdtpX/RYBY/'
+        'DLbW2sqTKN3gQ7wJNul20RSfpF3Vi6g9xCtsRcQvGavdTlWO8Syf5CoXg0KwUtgq'
+        'nHFy6vb1PXxKR++L5KbocprCTbj7XSH7uMXpEoHb+DSc/qolHNhsKzm1/7cH7j0A'
+        '8DGjyTlmCgAAAABJRU5ErkJggg=='
+    ),
+    ('cancel', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACTUlEQVR42s2XS08U'
+        'QRSFv55HAishDg4ZHDTRnYIuCbCArRgXgpOIUYLCD4DfB5uesJPh0UjEBRvhX0Di'
+        '5lRy0/ajuqdDppPKVFdXnXOn7r2nbsEIPwFQrwCnLqzC5BZgGPIkTK9FHWBN/UYJ'
+        'crdmDZjx/TNuwhMgBP4AmxprFiB3czeFEQoz0wi3RW0g0uKnwC9gq4ARbs434FIY'
+        'n4XZTnNHoPZC1n7R+C7QBQbAtocR7tu21swKA2GG4gjiRrhteQ/cAGN6rwE9YE6L'
+        'dzKMcGM/NHce+CQMhPlXHImuqBm/RcCU3ieBJWAFOEgxwvV3NGdFayY13jJutVyp'
+        'kbsFnBkjusBrAYfAd0Nstz0EVjW3a8hPTRw1fIMobkQHWADeAMcG0AXcAHirOR2N'
+        'T8XIm0XTyBnhUmgcWAeeKcI39H4JPFd/bFjyPCOQC7rAT+3GrHFLJeR57giUHa/U'
+        'eiatWlWRJxlhs+ORIn1JfRvtlZHHjfioYHPaPhPrDxQH3uRFD5ma2r1+b834nfle'
+        '6WNF5kgK14sRWcU8ylHM0uRJCvdYzVcxS5FnKdyJWstDMUuRZylcZIQo8lDMZhny'
+        'Cw+Fy1PMiyJGNBLO8zyF81FMW080slIM4CvQTzjPsxQuTTFtdvSFnXgcu+LgA3AF'
+        'LALLsfM8T17jRrRMdiwL87c4/itIXIn0Uim0D0yU0Pa0nZgA9oBDcQRpdSHAtHy2'
+        'IY0/H6IojYSxLszpvDtC3VTGfeDaFKhly/JrYbWL3g2qupi8K3IxGYmr2UhcTh/s'
+        '+QdqcnhpOQDBjwAAAABJRU5ErkJggg=='
+    ),
+    ('check', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABCElEQVR42qXTvS5E'
+        'URQF4O/O3BkjkYiJRCEKhcYrKL2Jx1HoFEhMSUWnU/EIOoWaMIjG71yFfZPr3Dt+'
+        'Mqc5Odlr7b322vvwdTL/P1lKnMU8ih8SlrFbPJYJMvSxgasA/VZ5GfsY5kHo4xKn'
+        'mMPrGHIX91gPzl0egQ+0sYAbvDT1i05g2sGRJ8A3PMddjJH/TV1rDKhI4j1sYTE1'
+        'udUwxhHWQuYIM9jFeZjcriZpNVR/xyo2sYQdHOIoTCyaWigqdw97uMABtnESfo2S'
+        'naiZWE4kwwDHeKgoq3mWJuiEgnLBnjBdqTwVmFqCcq7XySJlSc/dwJR7Iw/QECvx'
+        '/usqnyGb+DOZ9Dt/AtMNPquvaPL2AAAAAElFTkSuQmCC'
+    ),
+    ('check', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACWElEQVR42s2XvYoU'
+        'QRSFv+ppR3aWnQH3JxDB1FjQQBBEI3ENDHyFDfYFfAUfwMhHENFIMBEEDdxFhA0N'
+        'TAWH/WFnwWHanmmTU8ulrSm6p2d2rKSautX3nrp1z6kqWHJzNcebtqLKpGSBC06q'
+        'rnQLuDTn4H+AfgxAAkyAZ8A2MJxjNibACvAOeG5i/QNkC9gHOgtIfwfYAzZtzLQ0'
+        'qQ0cA7+BdaAH5ECmFWQqpMvKUFv/xewpcAocASeynbc0UKWp0PWAq3IyADbUA3Tl'
+        'cE1zBwJs7YfqM40dy3cRA2CB5EL7oWHqH8hXkIJp5MdMqUu0yiIA0gW+bV0V8pFN'
+        'CxIDsKK0T0JVGxCWwgR2pvo3tF3MkoFBHQUzq7bzB8DoIlQvUeAO8Aq4rfFW7KdY'
+        'BtqqYqsTbspWtICx5n8UO37JtlamXlUAQ1EJk9YiUJA++BXgk7buJnCmuX35qr0F'
+        'PgM+tU+AF/r2zPDBN6VyZ8Ad9Z7zXSNYM9eAA34CO8BLbUOq4NeAb7LfM2fIuIrj'
+        'KiyYaKV7wC2dFTmwC1zX+AHwsERZZ1jQSAesRB8Ad4HPOq4fAV+Bx6UT1VJybjqQ'
+        'a/6+QHwBXgNPS8JTFqaoDqQ1uZ6b7bgB/Kh73WqiAz7AWKn+HrCFVLHbVAc85ZKA'
+        '+JTPgDKARD6Gs2agN0X56tx4e0YVKwNwso2A+xKWdfVF5EISso/EGFcFgDOXh1P1'
+        'YzHi0FRz6Eo2zd4SQM8kFwOQSdNXtYKjOZ6Wq/KdhQB4fe8Db4D3C7qWv1WMc8Fa'
+        '+sPkv32aLfVxeqHtL1cMtgSmUTz3AAAAAElFTkSuQmCC'
+    ),
+    ('checkbox_checked', 20): (
+        'iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAABO0lEQVR42rXVsS4F'
+        'URAG4O/sLgrR6Ch4ANVNeABvIPEGCo1W5Rk0CgrvIPEQGkFEoVRo6CUKrms1c+Nk'
+        's7s2wiSTOdkz55+Zf+acTb4lofA7+UTtPySF1ljC9i8iJZzhGSmhxAR7eMI9qgHA'
+        'BcZYwzKOUVaZQ42bsLMDABPe48zy9GPVcJrHBx4j6y4pw642q6kaEevQSQ9gir0i'
+        '8085D30cFR0N3MRMGy3VD7M1Bf4MO8EhFnGRZ9YHmAJgPdZXkc0YR1jATlcyRQ9P'
+        'Y5xgI9anmAuw1FVWW5Q6uniH3SjxBQ/Yj73Oq1b08FfiFge4DrDip3vb15RJlHYZ'
+        'mrJGGQJYZ6NRNqpILXNZNkapNcPXsCsDr95baCuHBUYRpMwGu0vL8B3lOM3nayvj'
+        'bohMJ+J8+nz9ywP7p7+AL1NVSg9mf5YhAAAAAElFTkSuQmCC'
+    ),
+    ('checkbox_checked', 40): (
+        'iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAClElEQVR42u2Yv4oT'
+        'URTGf3cySSwWQdaXsN1SfAELhYiVlYLFFgqyK/4BXWVXhRX/bWljY6m4WvkAWoov'
+        'YGmbRQgRjWtmbL6B4zWTzGTuDRZ7YJhMknvud7773XPOXDiwZuZm/OYWhCPXFQT4'
+        'QslyJc85cBQ4AmQRAedAAnwD+t78AKQlg3rAOrAvBzEtA9rAY2DXJ8N5nwvmdoE3'
+        'wHvgEDCOBK4F/AROAmdETN9g+YvB4stlMfca+Log/X0HTmnuUoC+Lg7rvqIBY2Ck'
+        '/3R1b/Lc0lyfzVz/7OR0hjYy43hJWimWhobPQ6DjzUMdgIWNFeHHwMt6Qks71aoA'
+        '/KVIE11ZQ2CFj335bgzQLjkBANbyUQVg12ioKXN+iunWHRQ7IWdNo5pkowaJ2hn2'
+        '14ENb/ONYjFYtdNpCcgV4JFyahKawUkanNUeOfn+DVwDngKvgHNmNaJo0JlxbkpH'
+        'lEtvt4Ft4CVwAfhRd8PV1WCmCV7osqXR97cFbALPgYtKys74iqLBRI6/AOeBZybx'
+        'Wl/bwC1gB1hVQnbz9Jbz5EEH3Nd9SwxeNZPvAJeBh8B1s6GyefJgWpPB3DB5T8V/'
+        'Q0u1qaZzVcDvGFbnrj5pRQ22J4B0AtEBbgCngWNa2gdms+RTmpBRaAYtyEJLNxXA'
+        'JWBNKcUPhpgMltXi3GyQu8A705K5CuCiaLCsKxkCH0IyF7oWuzk6nuAaTGYElFcM'
+        'OAmtwY42QUbYZrUt340BtoABcNwr9DR8HjQFaJe0oxfskK+dnSrSSUsEnynCDPi0'
+        'gG57UFan0wmpYU/6OAu8Ne+uMSxRI9HTnH0/TZX1cj1VheGCDo+WgCfm8Civevy2'
+        'HJE9y+Je2fFbrcPEyObqAvmvj4APrKr9AQjmr9Zizu1KAAAAAElFTkSuQmCC'
+    ),
+    ('checkbox_unchecked', 20): (
+        'iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAAyklEQVR42u3VT0pD'
+        'QQwG8F/ePNx4AruwB3DVmwgeo+fpMQQv4tIDuLEncOGfOt3k4WMoZSjtSj8IYYbk'
+        'yyTwZcIvAoPT8IPqEoi0ihs8nFAp8IgtIlCwwxpveMHYQTzgC3dYYIMyzgIqntNf'
+        'dRAGPjNnMV2OTdA1vvGarz6GgmXbzdhUrGm7DkKz+JjP4az4J/wLhK1SJm2XjtzS'
+        '7IKDSnlPf9spvY+0gy0PWGWRkudjVjJ2Nedp19d9Si46R1aT+GlaXxdZsGf9AvZk'
+        '+il0f+fgYQAAAABJRU5ErkJggg=='
+    ),
+    ('checkbox_unchecked', 40): (
+        'iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAABoElEQVR42u2Yz0rD'
+        'QBDGf/nT1EMRpD6JR/EFPHhQfBJ9Dn0Ssd58gR7Fl/DaIhQF29KNlwlMV7dN3E2s'
+        'sgMh2aSZ+Xbmy9D5IJqfJVueJR3hKOUIArzTZCWOdQkcAgeAaRFwCaTAKzCx4gOQ'
+        'O146B66BpTho0wzQA26AkZ2MxLquMjcC7oFHYA9YtQQuAz6AU+BCEjNRWNYyWN0c'
+        'SubugJeO+PcOnElsJ0CbF/tyPpIXVsBcftOXs886k1jPKtaXLznfwg2jHA+EK1Vp'
+        '8Fy/AYUVhyYAK1vJDseBy3oipd1odQAuZKepHMYTWOVjKb69AeqSEwBgIx91elxf'
+        'cSh0i+mHAPirVgfgvKVGrdvW/85g5GDkYORg5GDkYOTgH+Zg3nAzaUdJaQSwkFnC'
+        'BP6z2hPf3gAzYAYcq1Jnqkw/Xc98AeqSFjJghxw7izrUyR16jZEdGuCpg4915tKA'
+        'cmtgB5gKPy6BBzW7ttVFFiJ59ERVWBOPvlO3KvHoSobrLsSjAXCrxKONAFEi0rDF'
+        '7OksTnHIby7bWQHTfrazEnC0uvYJeYZxlrsy9GYAAAAASUVORK5CYII='
+    ),
+    ('clear', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAA+ElEQVR42q3Tv0oD'
+        'QRAG8N9tLoFYWIiWooVgYSdWiiBWYucj+GS+QZ5BEK1sLUTEP4goiJ2gnrmzmYVD'
+        'TECTgWXZ2Z3vm5lvlgmt+HFOv/hGWYN6HNifMkiBtovZQC/GMCe84qREB0PsYBWX'
+        '8aCJu7pFkIM/sY67MoKXsYEBHsMHFbqxd2IVmMMiUkIfBzjGM94joIqSKmyjF8wf'
+        'Ad5Dk3CIC1zhLRgy0zxOsRlZlS2lGhRpUhUSjrCGFcwE8jD2F2zhLLL6ajWzQJOd'
+        'T9jHffQgl3EdTbyJoG6U0ccSHrKMtzjH3ggZc81tGRdQTzxIUxvlqXymf9k30p9G'
+        'sJxprvsAAAAASUVORK5CYII='
+    ),
+    ('clear', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACB0lEQVR42u3WzatN'
+        'URgG8N/58DWQr66UwkDuSMyUGMh1mcjgXKX8CUqMkIGUwtBA0UUhJpRQykhhdMvI'
+        'SBndIeGmTDjnbJN337Zt77PlnuMYnHey1l7vWns963me9cEoRjHkqPXI1ZEMcN7u'
+        '3wIbOAMNdDCB8/jWR0BJMHsND1GvFdDexSY8wTG8z7SnoJOCuop8OtcYpjGJuWZu'
+        'YC0YuINzeIUjmA0QK/EBK6LvHNZGqSKfYDWe4SOW5wE00MZVvIyOU1F2M/R1ohTt'
+        'jQw7VfltWIxFaVsKoBmTH8VmHMIOzOBrHz23JhYyL1sz0LYxjlM4gA2BcDanf9l2'
+        'rcXKlXijyAu/DF6CuzgRrt+K1zn6slLBSVyJfAd78RhLY7Jazv3CC4WLuYkzoc3h'
+        'DDu9VjwZP76MnfHj6QBYzwFI6y0sw3Osl1nJ/XDwPqzKmKgX7bAdn0PCC7lcUUwE'
+        '2/MA6hm6uhmKkz4f65VxC6eDntYAJZgqkqARtMxgT0jQyhmulwnTyJqwjJHdeQmy'
+        'mo3jLdZhC3b9gaZpvlEhR/p9MM9AusebeIdLuB37X9wJ3QoA3dwZoMBDSVku1bkd'
+        '9Xuh51lcxP5weRITLfQo/pS5c34zWic6H8cLvMGjAVxG3/EjBVF2HW/E05LreKFv'
+        'jzHciF30ZVgPkut40MvgQ32S/ReP0lGM4p/FT8YJkvUd4CwhAAAAAElFTkSuQmCC'
+    ),
+    ('code', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABWklEQVR42p3TPUsd'
+        'YRAF4GfvihqbNFFDLJQQJWrjBygRLsEyjSQkWgmmCzZioZWNv0DyB2LpH9BCsEsn'
+        'tn6gRUiKEAjBaIi5qNFrMyvrZUVwmndneM8578ycTd0dSU1eyifpHeAUl2jBG/zH'
+        'z9sIkhq1FBfowji+oRMv8AtH+ftJDVFG3Ic5PMSjqHVgHs0ZLgM340GOaASzqI98'
+        'EI3x/RrPoC4K7RiLAa2F2gA+xp0p9IdyEqSXGUEVQzjABhbiyXN4gkl8xhmacByY'
+        '60GVAvwy2lhGA97hKVawHyK7OEUvfuB31kIVJyijgtU4+/JqRVEXvbzFIRbxCW2h'
+        'vIf30UKlwFRKUdyKHU/HDA7xAd+xhOcYxr8Cv9xYY1OuPoqZnCcK15jmSE5wnjPS'
+        'l2hvAtv4iz9hpDI2UUkKXlKtsXI3XmEHj8Ns6/haNJOinwlaww897hGlWwYPrgD5'
+        'mUH19VQsZwAAAABJRU5ErkJggg=='
+    ),
+    ('code', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADFElEQVR42s3XO4hd'
+        'VRQG4O/ezEQnBgZMAkbRwQcGRBQVO0kcDKiYTFAh+EBJIBFBjZWC2GiVwUK0kKCF'
+        'WigYY5FEEUGFKGpQ0EoLsRK1sLBI4Sveudfm37A5nHvnkbnRC5dz9nOtvdb//2sf'
+        'Vv/X8R/+uo33s+rMmuq5pqV/5KLVML6AWbyCO7EJ3+J0NWcwjpNP5Hk3TuIWbMdL'
+        '+BB7x4WPThXBh/AFLsZ5uD791+F1vI+51XSkUwHuiZx0c9qX4uZGemfxHg5W6zuL'
+        'obkzYqwYn8cxrK823oRrq7klRVP4ADM1YyaGGOi3vBcDpX0ohnfj7+zVz8mnMmcQ'
+        'cJZo/Ia1w3hbG9yCc/M+UY0NssEbceaBGC/79IOBJrsWKswMRglHH/vwGt7CNehl'
+        'YT9OvYOf8XDWFGM93IYT2D/kgIsq2A58io24FV/iwYxdiI/wVAsL4BkcxdN4vgVL'
+        '63KoK9qcK6g8iaur/pmg92UcDt0KdkpqNuBI6DYVBhxaqgPdyoEBPsej1YQfsRP/'
+        'hNPHKud62Ibjidoe/InpBnCXzOvC7RfxdvJdy/VufIVdaR+I+GxNezJ77IgKLisC'
+        'g+r/OL5O6KeD4Mk4tTcAOxG1m8vpCwWXrfXDUHoKF4VuM0nBOfgumv9L2mdcXLqN'
+        'NAzwXPJ+Y0J2GFeG75N53p/wv5sU9M60/hdHDuLV5L1sthO/xqGS64KLbQHuY9Ve'
+        'u1aKAaHQC8n7AJfh3lSzedyVdBQqfhIcbK1oeGo5AtSMwB0tQrQnY1fhs6rdvPk8'
+        'G5quSIjqjn0J69FIcU3FC/Axnmw4Udbejp8SDY1ULupA3bml0oGJhhPTAd98Y12Z'
+        'dzluaqn7IzGgqmZdfI+/8t6rKlo3OZ7DJZHcTqUBXfxerdG4Dy40mdIWhn6Vu/6Q'
+        'Mbgv7TfDjIXKyB+NgrVQ1Y3TSxGiUarWrzZ/BD8ELxuzZj3Or0p4L1eyI/gm9aWz'
+        'GiJW3wsPhD2bcyG5YdyX0rZvi3uijrO5mo/9Wt7mxPZcWo5HHdeN4SNoSZ9ma8+m'
+        '4f/Nx+mK8vwv3wWvdZuHVcgAAAAASUVORK5CYII='
+    ),
+    ('compare', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABVUlEQVR42q3TvWpV'
+        'QRQF4O+ce80PxkRBCwNGQsBGUiTkAay0shF7Ozs7X8A2aONTCDY2CeQRBH9SJFWK'
+        'EMWLv8Ro4VWTHJt1ZLjcWwQyMJyZPWf22mvtNZx8VKM2nWLdYBYTOC5ie9nXbbxb'
+        'XDoq1udxD28xg7+Yxg08xOeAN22CCdwusl9K7B228s9FnMFNbOALqjqHlzGH99jE'
+        'Gl7gUVDhXKo5i8cB+M/7AiaxHZ4HGMN+qrmKl+hhB+OpYL8ueI9ndsLveyo7xt1Q'
+        '2A3Ap/ZSd0D5plD9AE+z/hZhvxZgRLBhfW4GYjN4jvu4gt+tBeohnmjC+xoeYAq/'
+        'sI5XodZtQeoRLpvDMu4E/RCreIOf8YVhFVQR8TWe4RY+xEQrWMicHxSxQh8/gtaO'
+        'P8X3eoTsJGmvTNDHUsxxWIhYx+KLeJLOjHxZs2lPNaQzfXwcODtyGuMfK3VLUWg+'
+        'wcgAAAAASUVORK5CYII='
+    ),
+    ('compare', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACtElEQVR42s3XO4hV'
+        'RxgH8N+5e101+MiuChJNQBAsAkJIEKOlWJjCxtZHoV3SpbWxtohIuiAKamEjiA8i'
+        'aieCghrshJBCfCtqRHfVXe+x+Q4Mk3PuPTe7ogPDcObe+eb//b/n8IlH8ZHPlJ9a'
+        'wc7HYGAMX7T432NMBYjeTAEUQecYruBufBcNtHewGttwHV1MD2PjfHZiXYmLLWR8'
+        'iX9wAz/GXretjcqa2Yt1qkFGDnRxXL4Hh7E+GPgPiG5G8UKc7KPZHKzChQCzE08x'
+        'gveJAtMYDxC7cAS7w3y1PlHZcgWuxto0x/EtXuEylsfZkUTOSlxK5H+Hm1iXM19n'
+        'l39xD1vxF+40MHEOp3AWP+FRwsRrfBVMdQLsApwI8JMV690+Nr2Pt4l9y2Sdg2U4'
+        'jnlx0ZYAXuA5NiThOhKgTkYkTVRsdfuE3OLQqsyyWrVOxHoID2LdFWcqEM8z2W+a'
+        'nHDY8QZrcTS0e4HvcQYbkwRUZkp12gCoDr3Eu4bfnkWSGY+9Lo7hIJbgYRLCfetC'
+        't092XIonDQz0cK1m/0n4R+siNCwDdc6aUjwa5hgPB56YcbUaMHoRdtWcxCb8GWDK'
+        'QWz0M8GiENJUvHpZ7cgz6YnYv41f/o8JnoZGTQ3GD7gVZqqAvcJe/Ixfw1mnEoAz'
+        'YmA0kk9VWveGw+2O2g9zcQCn8XeiQDEMA02JaRV+TzLiGnyNHdifMLQkmGnVb7SJ'
+        'gjKx5ebkf39E3fgtq4a9+C6zRGQ28kAqaF90Rvn+2wRMrtT72cqE4vLcuTr4Jvyl'
+        'qEnFY8P4wKAYrrtgfphkMssxlRlfxhwIoIhG43ES54Oa2iLCcHsSFQPfDN2GhrTE'
+        '+dCkbJHby6Tuj2Zy+j5WcgBpJzMdNHZaalPE2dc1vcNQD5O2D4+6MVHThHzeo5il'
+        '59pn9SAdanwAhhXImixs+/sAAAAASUVORK5CYII='
+    ),
+    ('convert', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABMElEQVR42qXTsS4F'
+        'YRAF4G/3XkSlIEElQbQkItF4ACFReQ2JwguIUKh0nkGl0SkVtFQiIlEh0RPZXc2s'
+        '/PfPvRIxxc7sZmbnnJkz9Frhj1ZkcYNZ7GEx3ku8YBt15FVtUTd8GckLuMEbriK5'
+        'wHv4OsmvUySd8Ge4/QXxPNazmp8/wiMOIh4NhMPRfRr3gXSrrSv7dCmj4Cu4fmES'
+        '10HxE+fYRN0dALXJ4g+cYAnLOI059cygExSOIu722dZ+5Mi3UCXfWuhF1qDBUDbA'
+        'qp3BCnYC6gx2MZZ1rxJqVUbTRsK1wTOmEh10wx8mFMr2UeIiVjOCB6ziNSB3wje5'
+        'ePoJaT3EMsjuQmw/NUW2/7bDUGxjPDo3WMNEoHtopZ2uqk6m3WAu5tAe0CWO8ZTd'
+        'hf9csG8ptUayyoPPuwAAAABJRU5ErkJggg=='
+    ),
+    ('convert', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACe0lEQVR42rWXP2tU'
+        'QRTFf/PiJv4BFUFFtNFuRcVOUD9AkIAglvoBRBIkhSDqRxARUm0rImKXykY7rUQr'
+        'Y6Osf0ATEYsNqMm679mcgesw7715u88Lw5udYWbOnDv33LuOdHPAlL5lVgB/aNkc'
+        'kPGfzCXMF+rvA84AB4BO5OYO+AHcD9ZNDG4auA30tWlVW9WarC3adwCPEw4e6bsS'
+        'AVDJ8pYKALluflFjb4A7wHNgWLLOj+eBCzMzlkz9EWCgha+AvQ1Z9CzsbOqWKX0X'
+        'hH4InNNYRxuVNRfssQi8Bbo1jP9j/oXfE4DvwC5tnhI1/pCr5m18Ak4G4GoB9LR4'
+        'LRJ2de6b19pcwlQAH4BjKSDGBeB9fMXcvDBACuCzYcK1CcAffsEcug5sqj8w/T6w'
+        'x4NoS2K9Er4EngE/gUvAV80/BG7pQfeAXwJdtOkCZyT7tPpr2mNJv2dThWgSFr6p'
+        'zZi5Gd34SZgn2s5yhUnbeTCeA1tD2rMKIYqNu0QQo5K5UdnrtX78HRGdzISWa5Oy'
+        'LIJ+Vt8NM74BnAL2tw0iMzffBlwHloEbqgP84XPAU+ABcDCxmGmU+53E4Z1uuCnx'
+        '8P11IzDnEx9wx4RhLwjx0hg+Ls228un7uTQ+NXoaAbCbdoH3psL1QK41pL4xABuC'
+        'J4CPJqQWjHClpOQM2K1UXgB3UwFYdeyqmFgMwLmaosQfMmdS8XxqLTBxOWXywWu5'
+        'bwAcLnNfWS7IdejAFKjeDkWo9Po+DZwVa0c1t6QU3KgwjZXUnoWVoBSvao+A7UG9'
+        'OLForSYc3AduGqbcuH/NYjRflmjFJHkIfAFeKCXT1t+0cRlzTXycanVaYN9Hrf0F'
+        '9VjLsNGFE8UAAAAASUVORK5CYII='
+    ),
+    ('copy_clipboard', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABH0lEQVR42oXTP0uD'
+        'QQwG8N+1b6UoWhChCsU/aMHBwS/hKPg5XZxd/AwuQkEogg46qODUYvvWJS+ch62B'
+        'QJJ78iSXy7FaTkOXSir8M2zjG7sYRPwFr+jgHQ9NQisjGeAy7Cv0cR3aj5jANMSp'
+        'nRH0w77FGHsY4iQ6usE9dvCJD6Qqa7/GWnQ1Di2lFZi6CVQFYBGHVQ4KaWMWGMsI'
+        'SqIytijPVhF0cRRVU7Q/xyYOw35eRbAWw3sqCM7xFk+6qFbsxyKqz7IB1lm8Ll+h'
+        'SVymrUhO+QJWRfI0QHNMMj8f3DQj+HWFOfZxHIAueljPqtY4wKiJpeKdL7AVFTvR'
+        '4Vc2E+HfxZY+pn9+4zA+Tyqu2osCo/THtuXAjRheKXXMYvID279JDizYSI0AAAAA'
+        'SUVORK5CYII='
+    ),
+    ('copy_clipboard', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACbElEQVR42s2XPW/U'
+        'QBCGn/XZF5DI6ZLwIYEQPRUNDaIBUdDwH/gL1KRMfkAkKCn4AVRIgILoKAGJhpIK'
+        'ic/ojvCl485emnfRZrN3ttcnwUgr27sz4/HMvO+uIU1Mw7kkR04yjZjNFFgBbgIW'
+        'uA9MgELPoVQay4la8hB4o/vzwI1lptICF4Drgd434ChwEXgHbGv+NnAGeAH8AlY1'
+        '77LxGHjt+T6Q5tjLB8AdpdSXTeAE8BLYAU5r7ACvtLYZ2BTAXQVl67LuFs8Cu5H1'
+        'Jw2yGtPZlc9DWc/nOKmkmOuaASXwFngEjPU11nNqgDXp5EBPftxXR5swr/mamRex'
+        'BW4Bl71u99ccOp7Lrgz6gJQACJxMgGctbGpRliegJqvRqeq+uksA1kvtUiTjH0ve'
+        'wda01DHe+NtXXQKwLXQyIcSGdqkBrADnRM0G6IuC+3qeiLKnasqfYsm+IDzSMCko'
+        'sF4A3zU3APZEtwbYBzYUYAX8AE4qCJeJUZcMlMAR4GlD/S3tnB+AayKqZBg6rI8i'
+        'TRXeGw+6hXrhK/A7FYbuBT3glNdUlXcN7yvPrgKOqz+SAvAzMG6BBl9vv0sGli6p'
+        'JciAYctjndMbCI6dSlACHxNL8EWc0QgFJkKnVk24FnR6U7o+kIF8gWEZoU7/XDCL'
+        'UeuCjJk2m9EUWBfbzeZQsdVJuMmGty6fh1CQzznFfAIeAPcUfRZhwj3Ra93hpCdf'
+        'rmc2gM9d0VMAVxIRdElHeeo2o2xBfYuEvyrrXW0TFFQLdsO+uvmq5oYqm+OGscrj'
+        '2HKoEgzVwKvA+y7/hj3gmJrJ/2/IgtqXkfVMdhP+B/kDlRCos1/lZkMAAAAASUVO'
+        'RK5CYII='
+    ),
+    ('copy_docs', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABSklEQVR42qXTu0pd'
+        'URAG4O9cjBqM0eANoklQEOxUsMsTWGiXPpWFL+A7JH3eIS8gWMYniG0qxcIbIioY'
+        'jOdsm3/LykGFkIHN7LXm9s8/s/h3aTx1aEZXaGEZ/TnXvr9wFN9uGSQX3QRMYTVB'
+        'fdFv8A0L8WtCO8HD+IzrGEewix9FgUkMYgUv8BPNOsEELvE98G8xE8dO0eIszrCF'
+        'DVy1YhzBKPYSfJf+XyZxFXS7qdzCBc5LDlrptR19gtexjWMeX4L2ppf5muUKf6I7'
+        '+B1+ZrCEdcwF5V/jnItxGl9TbRwD+VdwBZ/CxwOCRrJ+wFqqvQ8CGMo4T4vJKcfY'
+        'xSts42P6r+U4O3CQ8104aOjJVm/gSe6rfFdB9i72CouZ2EOCupVOUaWUhQTvR+/g'
+        'sHwLY9jMZaNn/yu8zQhvnntZ7WzeY1IvV+/b+X+5B9yCSVdnFxcpAAAAAElFTkSu'
+        'QmCC'
+    ),
+    ('copy_docs', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACrElEQVR42u3Xy4tU'
+        'RxQG8N/t6YwP8pABFVSYSECyENwICupCUVAQcSm68B8wSv4AkYRsgxEEt4qg4ANB'
+        'ENRRENzqWkUQBwQFH6NRGB17+mZzbiiaW913egK6SEFRt+vWPfXV+c756jRfuBVD'
+        'fNNuuK7E7Jc+YOu/9sA3OIilccIic3J4hCsBopszOJJB3dtHYrNlOIt7A8AvxKkA'
+        'fDuzz1DtuzhVE09dxwX82S922jWnX4+xHhcX4cZl+BGjMd+tobTEyhj34SqO49fw'
+        'xGwdgOrDMVzGnRqOu/H7HGYy3FZ2PsfYxW6cwTH8louJaqNVuDbAvWuwJRPllZ0V'
+        'eICdSX+JP2JNK0dBiQUxXyQRnRqfwg9YjOkMyCncwoHEexcjg47jdWW/nUmjTg2A'
+        'CsRLbMLjAJCuq8Zp/FJjexyL5iQUNeAK3MS2DMCiJ3YWRFa047mcD4A0IJ+FIKX0'
+        'lEk/go34FJHfqQE8FIACH8PoeOKV0Ui/8Ri34QZ29BOtdkM9LxP0VTrexx4swVus'
+        'xskE0Gp8jxPhib/rgLQbbN7N3BsFJkMd34X270jenw892IX3PUHaiIJK/TbgcA+/'
+        'VX8SGVEmwVfdG5eChsl+FAwCsD2J+JTf0Xj/Hg+xNgExG8+X8TyTzn0pqNAuwl/B'
+        '41qcTjY5FC4v8AHfRqp1MrFTNIlscbqJZG48JPX8gO/2R44Psj8Re/w7N4iCSWwN'
+        'PisNrwvGCWwepshpN1C9F8GnDJdl3I4zUYjMZhSylopWQ+lt9XnfijQcwU+Rep2e'
+        'Xs1N94JoN9T/coAsF7iLvXH/5w63LsD09UCVy3PtJY5GUZMrVH/Hm3SuzgOf5lHP'
+        'Pw0QM8MGYRk87hwSwM9YPkCAOv0ATIXyHWgqIDV1wqs+Bc3X14p5/PfLtY7/2xza'
+        'P7nBsZ4hVubyAAAAAElFTkSuQmCC'
+    ),
+    ('delete', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABHklEQVR42o3TS0oD'
+        'QRAG4G8yY0g0EgMKCoLewBsIegL3bj2Wh/AIulGXXiEgrgTxQRLzGjeV0BljYkHR'
+        '3dV///XqYlFq1ssCJlsCaKODQ1yE7QbPeMP7MoIsmE9wjhdsYhD3DfRwgFs8YYoy'
+        'Q44JrnCEO3wEYOagDAdtnKKLa+RFAOEex9jCTjxKCTKMYn0I+7Sa/yVaEb5Y030r'
+        'MHMpKrXYwB6G+I5IxL6DemDmkdUSgjIe5hHapKLTuBum6dUqEYyi4n9JIzCqBJJQ'
+        '1xEMVv28HporCJroLyMoY+0HqAjNQ2fnZjiZvykqHgZR7S+Mk287Dls90vzVxllV'
+        'uziLHzdK7sfRvn08Jl1bOkzb2E1Byf4Vn6tGNfvHOC9gfgAnuEMA1bmZogAAAABJ'
+        'RU5ErkJggg=='
+    ),
+    ('delete', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAC8klEQVR42r2Xv24T'
+        'QRDGf2vHPscBk0BCIElDHoIiDQU8RQoaSiREi0SLREeERIsEoqaihCoSKAheITQg'
+        'BIkdOyaJAfuO5ltpWN1fB7HS6u5mZ76b/WZ2dtcxXXNAXU+ABJjoWRloGr3klHqV'
+        'HKgBcSBrAveBFX1/AR4Av0rY/tVmSjgXA4tAS7RPgFvANeC5dG5K/tTonADdIEyl'
+        'GHCB8j3ghmbn9dvAUB3gLNABjszPGsBr4GEOdmarA2vAJrAtqptiIRK1LWBWz5Zk'
+        'kd6bstkWxpowcxnw7+eALeCiZnobWAe+AfPS62u8L5t54LtskXwZ2AWeAMcavwsM'
+        'bEhcSsJsAI+B65I15X1SQKVL0ZkodDHwBrgDvLXJaZMwltEH4BXwETiQxzYhwyzP'
+        'kydiZQF4IWxXtDJ8rLYUv9O2TeBRgJ27DJ1msAdc0vcGMAbeB7O+qvc0eR14J4x9'
+        'jbsyDiQC6Sp7EyVQbMa83l5g49+7JifOA59NiFNjldZ6KkAAZzQTz5AHuqAeypdl'
+        'gzB601TCrooLmuliSkXrZ9T9H7JHGN0qDiQGvGGYaqUstyhjKc4adhvG0aRMCKwD'
+        '3sFjw0ZiqJ4xOtaxjmy8TqYDeSHwDLSBUUCjBzrM2Gx6smkHDFCFgYGp/zGwmlK2'
+        'F1SGw6q6Khu/LwyqhMCDjYHf+slIs/UgHuhICRfK+7JZEMY46+xRKzgLDJT9Lmfr'
+        'rmXgOtkO8g4/RQ4MBTIR1VEwPqtuZZF0J7Id5jkwU1DHD836/5qRqGlJ6HWXTOgq'
+        'FSKX4sCSEuqn0ZtPqQGRzgq+Uh5OEwLfDpRIvro1g/GRenhgHZpVclB04iVnKe6r'
+        'qDgdMsN9fKweyk5k0wk2rMoM9FRMEuCyKHUmy5fUXZD5K7JpFzFQdCRfB3YEGqXE'
+        'sWH2C2vbkmM7wJVpVkGiGe3q7P9SRaceAMUpTPpr2hzwDPiUd0FxJZhIlExzFe5+'
+        'Tknbr3IXqJqo/8R22stp2Xaqmf+X9geqkcdNhobvbQAAAABJRU5ErkJggg=='
+    ),
+    ('diff', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABC0lEQVR42o2TzUrD'
+        'QBSFv0lHhYK6KIgUfAWpCG58gCL0JfssIrgRQbrQvXTVRatSFZJMN2fkcpnEDgyZ'
+        'nJx7cu7PQP8aAFUfITjyNXBksKWeY4P9Ak9Ag9SzyAUwNcKt25k3FRcgRKMcgWfg'
+        'Xm4a4BxIwIPBTsX9C8KJ3ACXQA08Cr/Ttxcf4wUSsAU2+lsr7EMOtnrvFMh1qQwx'
+        'GKwqkUudCa5DJazTQZDdfE59cxALwT/AWjVoTDqpJBZdAQ+BV22AM2Bk5qDdJ4UI'
+        'HKiNrdI5Fjb0dYjO/rcCa4OtgLkZpFmXQA1MNAOZ/K7UboUl4ApY2AuU16cGZWBy'
+        '/ZKLE8N7U40Se6zqv+u8AzJgPjk26fMVAAAAAElFTkSuQmCC'
+    ),
+    ('diff', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACSElEQVR42s2XMU8V'
+        'QRDHf+/eA1SIIRBjoZ1RVBJJbKgosLGm1cLKWGlvQ4zfQExMjJWNrQWFMRQUNPoB'
+        'BAJamwfGqJhH5HF3NjNms+7uzT14eUxyub3b2dnZmf9/ZxcGLI1EX6tibA6ckXYH'
+        'aFboH9ad5NCwgJvyXjPqmyMwBNwDzgGlp1cAGfBWJi1Ff8HpU9Gxu8BroOtPlEUc'
+        'mgAWDWlqGPoRWxMGe/86LwLLhgjOylMly2LzPwdiGCiB09KfBSKVAX+AH6LbBEYk'
+        'BXjpKsRWWReEpQFYow4jOhW2alNNQ3UJeOoASoG2BPx0UvHI6VPdReBLKu8tg9c7'
+        'wHPHqL63HGBtRXR2jhKBlGTAMDAp37/lX17XkCUF5yW8uqpcxr0C2qIzDdwXzDS9'
+        'FOxVUS806QVgxaA/LU+VrIhNMw3dTeo68NKLQFNWpzmeF6DmXgQeAOsBGpscUE5v'
+        'ygR+pLrAZWmvArcCYCu8d88YuOPRsAW8d8bfAG4LBlwavgG+pjCQDfo8YNkH2sCz'
+        'RAoAtoGNRAqOtBNOAS8CIHwCfOsnCNXrjQAIXRoqCOcMgO5pJ2xE/hWy2lwYENuI'
+        'PvdaC1LVTA2ekvYnqQW5Vwva/aoFavAXcCBPcdwsqEpLCYxJSb4CPIyU473jSEHq'
+        'aH4W+Ajc7ceBpOWsNhSBjvFIVjsCDWDfcCQbNx7J9mNOxBzoAjPA4win9V7wXSJw'
+        'NXIvUJkJ3QlIXKcOBFyjgYuJfm/KhJqCawndd8CHXpmSkrmKHfDkX04HLn8Bz9Gn'
+        '9LlkrkgAAAAASUVORK5CYII='
+    ),
+    ('done', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAA+klEQVR42rXTvUpD'
+        'QRAF4C83jVgZC28UAxb+kMJGG0HU2s43UCwEa0UhCnkXCwsfQ3wJrcRYCz6AxmYW'
+        'lqsxuYIDyy7MnDkzZ2apb404f7LGiPdEVsTdwlJK0qwB/sQsTrCNAd4m6S1nvsIW'
+        'uuhnvpG9pYAZ9LCDEmdYSLEJMB/OBMyZe9hFGxfo5BoUke0YG3jGO4YBPsUDHnGE'
+        'W7wGbpjY+ljDevTZxjSuo+w5XGbMRVW4FezjBsvYwxTu8YTDYB5kE/kmWjfEaWEz'
+        '1C6j58Uqc9XSPqziPOZdVgQrxq1mEx+R5CDKvMPLT2WPW9dOjPXXsv/lw9T+sl+o'
+        'PyIHieK74gAAAABJRU5ErkJggg=='
+    ),
+    ('done', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAABxklEQVR42u3WS0tV'
+        'URgG4AcvNOpCEZQVRfcsO02KiiJKDS2UhGwUDRwE4cBRk/5J/6VRdKUyKM3+TNHk'
+        '3bCScw7HrVuD/CZnrwVrf+9tffuwXf9J9aF/K5u3e96UGsjveczn+S8lmpSlH79w'
+        'Di8xjCG8DrDfGm4Op7CIu7iJV3jRtB1V8zP4ghkcwWj23+J5Uw6UzL9hIrI/yv4w'
+        '3mOyCRWq5qexgutoBQRcwjLGe2net0Z0VfOTaX45LFvZb2EJt7Me3Mh7W3r+HTcw'
+        'jePZH0nz0VVXs+u9nerxQCn7YuS+houF5z0zL5t/TYLHuxwsmS8m7YdxL/sX4nlP'
+        'zCuppyPjiUyvpeKFAx08b5f2kTqeP8BHHIiPV8NoBfcLEL2kvWfPSzYLuaM7ChYz'
+        '2IsfAWhV2q+sJ+3tVFjAG+wMsGORdV+smcLReLuutHcLYQViV/HiWziUD8nPzPba'
+        'ae9W1cF5vMPurCeixlmMZbZP1kn7WpR4lkzsz/ph5B/CbJ2011HiKT7gYNZjkb9W'
+        '2usqMYdPBQjFjLiz0cw7gXiSybgnn9rlqNEI804gHmfkfi5kH7RJVYGY3Uzm/9Tf'
+        '63Jsb1nz7Wqk/gB9pk1uyvFRigAAAABJRU5ErkJggg=='
+    ),
+    ('download', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABE0lEQVR42pXTTUoD'
+        'QRAF4K+TGMWFf6AoCAFBt15Dl7mbx8gNvEPAjQsRISAoCkHEuNCYdlODnUnCYEEz'
+        'VVM1r169rkn+LKEV/gzZvDXll9p5nJXWCeSMHk4ivsMj9oraY5xF7QNGSBWlA/Qx'
+        'rVGbxqksR9zHfsUgYytQh9F1soTtBPcYYwfbeO0UoqxhFy/4KgQT/hs+o3M3vtFZ'
+        'Qq/yc031cqxciqjW6Sco9vBe3MYIHzVmCwAZ7Zj3tLjCG9xGLjcBwDcGOIx4EM/1'
+        'JoBUm/eqlp9FzUqANjaKOesidqNmAaB6OY6rrJROxWgp6scleLXKz7jAZcyfVqx+'
+        'DhZHuEYqCzcjMWv4wVp4iqWaE++/luAXswJDS2ZOdL4AAAAASUVORK5CYII='
+    ),
+    ('download', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACuUlEQVR42uWXvWpU'
+        'QRTHf3P3uqvZgEYRXVBETOEDqKWVpYJoI7Y29j6EL2Bhs100VVASS19B0MJCEES0'
+        'iCHuatjsl5t7bf4jwzBzd250Kw8s9+7MnDPn/M/nhb8jo9//R5meN/Rz12pRHoE1'
+        'A8rAXuGcAbim52vPFVlEbuHLDSlQAgeJBowi68VhEDC6vAXcBVb1vwQawFegG3GF'
+        'Tw+AczLEBupHYAOYOHf9UcA4z8fAWeCNLrDWTGq4dgIMHCUL4BZwBXjkGpx70J8H'
+        'LgF3arghRGsRtDeEzBdrdO7BfxTYF+QXgIta70u5Vwn+zYCbumRFsj/Jhfu6I4iA'
+        'RSHT5i5wTJePgF4kM0JB/A7YA75Jid1YduUV6dIGzgDvtd5PhL8EPjs8l6X8KFQ1'
+        '84oSWwJjj6lMVMLlGYvPVFU0ApeMganzvwwIj13s8kwlK2hAVgFjC1iO7JkK1Hxa'
+        'lqwyFQHjCBsGzjeBmcebaa0ZkDl0lDapLrDl2C9UHeCZqmShdG3ofVV7HY8nl6yy'
+        'jguIpOc28EKFpqNU29P7mva2K5pZcjc0smwWaDDPJbwLfJB1XeCJ9vyAnEmWSU3D'
+        '0vHZUkTpdVW1dZ29D2xqb+adX3JiqqxTB9yG4pK1aBO4p7WtAGKWBk4HTHYBqtnN'
+        'iIIH8vOWE0ux5tWUrGGdSmhd0KqIn8IJ4qoG1aqoEdEYMIKuN2fyraqOdq0nWSY1'
+        'BuzBNnAiFjyJqYtktAN9ZS4CNqiuAz+Bkwqmqcrr0OGfKdoH8nlLlh/30nAuArYV'
+        'T4HvTsCN1NsL4JcuKTwXZOI7oveR5omGZE3FY0IKWKv7wCnNbm+BHS8mTFVAefme'
+        'qVbYtatCse/K8Gf5ArgNPHRK6r+gQoPuU+ClO+zGonsFOF1nvk+YE3eAH3U+uxb5'
+        'SRccnRb91XvYdF4s/QZ1ocofMgPpagAAAABJRU5ErkJggg=='
+    ),
+    ('edit', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAyElEQVR42qXTwUqC'
+        'QRTF8Z/zLYJy165oKQYu9AlcuCh8gjZZCwV1ERU+i08Q+Ai+h9C2Ze9gi6TNCENE'
+        '3E8PDAzM/d8zc7hDPSVHaA9flI2qIFxhhzm6uMIHdino/I0ZzvCeG5xHGqTsfIcW'
+        'Nuhhi0+kFIBHuMQC1/jCsjj/N7ARnvN+iPtIdiX8ggZuMK4Lv/4Bpwj8UFz7Ngo3'
+        '8nrENBfXdm5hhTYGmETHd1/whD7eCjg6qZpY59Q7xbPCOsHpr0wOUlX3y/4AUJUc'
+        'Uux3JtsAAAAASUVORK5CYII='
+    ),
+    ('edit', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAABnUlEQVR42uXXwYuN'
+        'YRTH8c/cUaZsGLlmisJOscBGbIjFKCulWYwYw0r+BxsJZTM7NlZjIbGchQZlxVCs'
+        'rP0JrKQJm99bTzeTjfPOYp66vbfT7f0+55zvfd/zsAnWWD4bssab74O+NzLIdQJT'
+        'fWe+JdcZvMJrPMpmylvSwS/hNw6mGot4OFKdMvgsVnAfTxrgGwwbOUvgc8m8Ay1i'
+        'CYfTim0Vbejg1wK5g6fpuVTiJ85VtKCDX49wx3Aat/EsDqykMqXwZZzBSUwmfg8/'
+        '4kT7+/8Kv5rMz+IQ9iY+lfhcJfwy3uMojmM68d34gIVq+CccwIVGuA5+pbrs77Cv'
+        'ybI3eGf7EVxsrO4NvhzhTmBH4sPA5yvhC+vYPsRqNfxfts/3Yfv+Pm0f30jbB03m'
+        'L1PyUdtXK+FjEewbXiS2fcT2Enh7w7u4gQd4nthOfKyEd0PCREo/jV24lUq8jRMl'
+        '8Fa8mQwVsAc38b36rdauWZzK/LaGzxmnvmaTa1Wnl87wL3iM89j6l3+Hyg1MNk+5'
+        'tjWDavB6PvzKhLs5DpIbsv4AaXFOTiaTzkMAAAAASUVORK5CYII='
+    ),
+    ('gear', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABVElEQVR42qXTT0uU'
+        'URQG8N+8kyaCMUKgCCmii3RdiwSRQISsL+AHCMGdfhEXrcJd0EKC3AoSFYRCi1q6'
+        'KSgi0BIbEvxHzuvmGZhkgmAuHDice+45z3mec+nwVNr4ffGPsZjYU/SixFFiZbsC'
+        'JZZRxRk+o8AoutHAakuu6hVEExjBM/zCPn7jG95hMgh+XoVdw2Oc4y1uYCoFSgxg'
+        'J8Wm0YM11IuWIhdYRx0P8TKxBjbwKHcv8KcJoEiHepL7MZNuc9iLzWEb95NzkTdl'
+        'FV1Ywm5GuIUTHGAzRN7EtSjxI/cP8LFoIbCI/Y/sZTNQzYzvM/cuhnAaNWoYw3gI'
+        '7MYX3MMTNJok9qfYUVSYwhYGY1t59AaHya2h0tyDHtzF7Uj3NcQdZ6w7eJ1m80Hy'
+        'AaeVNos0i+cYDuwi5H3HAl5lVP9a5ZX45/gUfwzXI99fq9zxZ+r4XAK1f1wiAmdA'
+        'vQAAAABJRU5ErkJggg=='
+    ),
+    ('gear', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAEFUlEQVR42sXXeYjV'
+        'VRQH8M97jmU5zuS4pCOBNaNYppkgiRgRmbSqaaREi1TkP/1hGlFEf4hQlC22GIiI'
+        'UVGQGGlQSgvZKi1IaIv2R1SgRmE6TZvpm/75vvgxvTdODtKFy7vv3nPPOb9zvme5'
+        'Jcc+SihnXUGX4zhKmceLvsfRr9u6PxowHKsyh2evfw36XjOvN7rQioH4Jeau4K6c'
+        'H8FkvFlwxQg0oeNozBt6OCuH4aW4I7SPohHTcB6uiAKbMRTvoxO34zAewmsFXjV9'
+        '1ZNyFazBVuzAY1lvwy7sw8loxum4ANOxFGfm/61R4HC9r6y111DQ+ocw2x6Gz+JL'
+        'jMZIXB76TjyOmfgEZ+dupRvP/zQW4HWcFb/OKvi3Lbhoxmk4AWNwNSZhfHCx4Gjh'
+        '0t3nl2FetJ+GGzA4gj7K+VVRamFA9wx2YgM2YkasNACr8XEiZQNeLWKiXFCkErQv'
+        'wdsx2UIMwx/4As/hRjwfAc04JWcv4KYosA3n4ncsTrRtDe/WyCrVw0BDvuZODArN'
+        'fryEtzA7yO4ohGRH9mZjS+Y7ccPP4bWjVtiXC7Fexh48ErQ3Z26P+VoKe9U7/TKr'
+        'abh6Pgjtwc/5wcfKhPGeyOrqboEqs0a8h0PZb8F3QXULNmERxuHXzHHZ2xSaiQnT'
+        '1rhnRHg2FuTUHWuTfGZG8yexG9fnvB3rcE0+oJz1ukSG0H6NJ5Kep4bf2p4Kx3As'
+        'C2JHJ7224GVclIS0BRN6UH5CaNbkzsaAdBLGhveyyPqnYFXNsQorEsvVS+1YXxBw'
+        'SRA+OPeqTPplb1toqh+2PvymxPxjImNV1e3lOsWnEtOV8v9YSmtXoVgNwEn1ynQt'
+        'F7Sn2Azpgwtm5O6QAHgUPq3lglogvDhFpRQgFUHYVgOE87PXXgDhbjyVvDIVc6JY'
+        '3VFtJq7F/YnnKSk4A0OzIhltUfL85EIvsChnK0LblCw6PaBeHt7VpuZf1fBIZmdq'
+        'QCnm2xvw7EhGnJX8/lUUG5j16pztTyZtxYHI2IsLw7sqR71asDQNxQF8n4vf4GBS'
+        '7sHCnSqzqi8Ppmv6KcImRfifuK23teCv5PAV+A3fJrPNCrA2piI2FTDQlL1XYvJ5'
+        'iYIBaUQeDEAP97Ycz8WPAc/N+cq2FKM5mRNTGeHpVMf1acvGJux24kV8EDxsOFqL'
+        'Vq8hOSdhNDfNR1PhtxFn4MRg5dLQtqWsz+9tQ1K0RHUewn2huzvoHZUUXYq7hgYv'
+        'HUH4rvB5ICa/JzWlUpg99oSVXKz2cqfGvJPxBm5JIulMwfksoBuP6/BuaD8PXbkb'
+        'z153xUVMLElCWZmwm54ccWVoNsfPH0axxRH4cF/a8uIYGVTvK+wtD9Ck9bq3cDai'
+        '0OAct6fZsMLTbNixPs3+98dpqY9K9fl5/jdHhQ+eCE8MFQAAAABJRU5ErkJggg=='
+    ),
+    ('new', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABDElEQVR42qXT7yoE'
+        'YRQG8N9Ms7ui1K5ENu5BuQEK9+HC3AeJGxDffEdkaYkif7LjgzPb27Q2256ant7z'
+        'PuffM+fl1zKTW1YPnMMyyjEJq7s7vFYJMsxjD9dBqiwPHNQqr2IfL0UELOIKh2jj'
+        'M8hvgbOBTTxhJ2Kei1qFJdzjI87rgeeBreAMY4rajF94jw6a2Ar/WfjK4AytGCHU'
+        'ICp1cBu+BTziu04uEmHyqLKBTdyEqLCNLk5wGdwsVdkE+5CN6qCM1hs4DdE62I37'
+        'g2SEbnDLvzTI4y/0sRK+fiKscSI2MJO0eZy03YqvMSpBpUWvtkgXge1kkXppTBHZ'
+        'H7AWM/93lY+QTf2YTPucfwCn7D7uC65jvAAAAABJRU5ErkJggg=='
+    ),
+    ('new', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACbklEQVR42tWXv24T'
+        'QRDGf3c5TByB/4iIgheAJ0AUICEokKDlDUBUUah4CdIgJEQBdLSU0CFFMUV4g/AE'
+        'EZYDzoXklNPZpvkOTVbrs31nx2Kl0+7t7M7Ofjvz7SwsuQQz9lcto2kGhQvccDjt'
+        'Ti8BzTkvfgj8KTIgBIbAY+A5kMwRjSFQB14Bn8xaZwwJgAbwHbi+APhvALtaI1+P'
+        'yHGQBtAHfgBXdAwZkGoHqcZdFEI1zS2SR4J/T3UDiH0G5EasSNgErklJDKyrRkp+'
+        'Ay3994G2I++pTtX3S7rPREJUEC6ZdvK1IvT3pcsbglHBxFSQhUJkZPxlBNwGbqlv'
+        'F/g2ZtyhQWEmA+qCfeh4bQQMgE3BCnAT2DEyG1XrwEEZ0knNmfrgS4AtfUkB68XA'
+        'aRkEXEMDZ84KcNW0I09UDSYpLjKgJi/GUZSpPjHHcqL+zKOnIWee2YBEoQZwB3hi'
+        'djqQd7+R/BHwUfJM8g9ARzqSsgjkcX5XSt9qTga8FLkAPJDT5rJnmtORjv1l3HxT'
+        'lUk80Fd7W0ew4RzBQ8m/iLDsEWwblizNA221O/pseQ+sqv0ZeDpGTxvolkUgNmFm'
+        'wzAD1swRrpkwzJwwnAsPDB0yymHumjDNnDANqvqA5YHAw4Z14IVp+5KdUVUe6BkW'
+        'DA20IfDauYxCI8PM6VXhgaabOpmyo29SaQI/ZzUgkOwUuAccKUM6MrD6EhIrPwAu'
+        'S8eFcT4ReRYemHs89+RUUObenKdc+yZiuh55TREUG13BOAMCDWwpgdwrusdLJqUt'
+        'mw9aA3LnicXx7xaUlm9pjX8Jznk+TPrA8X/zNFvq4/Rcy1+wZrdd4GMHIAAAAABJ'
+        'RU5ErkJggg=='
+    ),
+    ('next', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAA1ElEQVR42rXSsUpD'
+        'QRAF0LPPaL7AIp0ggoWVEIifEBs7BbEWP0mw8hNS+g22kiadFhaiKQ2EZG32yfDI'
+        'Q9FkYPeyw+yde5nhn7H1i5rKmqL6q8Jr7LYprhMpdIjYxSkOkPHSVBIZ8wqs0MM9'
+        'htjHU2iQU3kM0McsdFhiBwvcltwQh4XwA6kmOMc73hqKKkzxXNQusIdLjDDuBCuv'
+        'mNTSAsm8xWL6vnCCY3wGghws3LVZ+GmMXVwVvMFFcy9WjTGFs40zHOERD6Eur2WR'
+        'Nr7K9cdkU/EFw1YpcnTU9e0AAAAASUVORK5CYII='
+    ),
+    ('next', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAB4UlEQVR42u3Wu4sU'
+        'QRAG8N/Org8O1EAEwUATQVEEMRBUxEgEwcRIRBRP/wIDcwMzk0sETc/YTE3kxNAH'
+        'iEaCgS9EBRHkAh+7MybV0I7r3u6xNy56DU33TFdXV339VVWz3P731h6DjmJSnGnc'
+        'kFaMBzAV806TBqTDZvEUW7P/rSY4UKDEYbzAOfTwJAwoUDWBwA3sxUbcx8woDhZ9'
+        'vtsj9gob8B4HQ889bAlElpwX13AkYE8enwxeHM8IWwyCMbUd2JQpSmSqYl7VFPaw'
+        'GzczmU5cy2Ncxz5ciPV27PktlBKhHuINPmBlJpwOS16UmbIfuIx3mZ4OujFexWac'
+        'xdts7RcEkmefcAJ7QnhdGPkF62OEtSG7BiuwqqanG8Z0cT4i5DYu4laOZh3q07gb'
+        'Xn0Lb75H72VjN9bTv8/4Wov//Eoehd4rgcZcku38IcM9XyQhB8V9OShBpYU7WL0E'
+        'tWE6ouJo7by+JHyN+SGKSxW9i0t4tQAJp4PgfUlYxngmwrA1RD5vZ4dvzwxI5NsW'
+        'Yfgg0nW+Z3ITUTFCJUtQTsW8iqiYwS4cw8tMrhqmFpShZJTewsesGMGhOHxByMdR'
+        'KOZxCjvjOmYzDvWaKsfPFvsgGceTbP/fepJNzOu4aAry5fZvtp+4KIL0l3PWGQAA'
+        'AABJRU5ErkJggg=='
+    ),
+    ('open', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABEElEQVR42p3TTUoD'
+        'UQzA8d9MR5BSBRGkdKHYpeJKcOcBPIEbb+BZvEc33XgBQTyABygIfuCiC7GItda2'
+        'bvJg0NoOBsKbN3lJ/kneg8xvyVWUsnM91hEmfwQu+03TxxrO8BnGdVzhtgpBgRZe'
+        '0CmRnOMQsx8kaf+OLsZFoIxRwwqGuEBjToA8zp9iB72iZJiEpkyDBeSPeMWsCOcR'
+        '9nGArwUNTARH2EU3QxvHUcJ1iWDRBDawh34R2bdxg17F8W8GwV0eyC30I3ot1nma'
+        'h9bRxFP60cRDoE+XZJ/FhHIMCqziI7q6rP5k38Jbukg1PEcfiiUEedzYNu5TgH5s'
+        'TlSXBi7LjymLUqo+wGG51Mz/JINvj4M8F0X2g/kAAAAASUVORK5CYII='
+    ),
+    ('open', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACP0lEQVR42u3WO2sV'
+        'QRQH8N9u1hiJRhSJhJjGJzaK2omlhXUEsbUTC7+B2NmJFjY2YmNha6EWVkI+gAlB'
+        'RbALJqKFIT5yk3vX5qxMlns1j72NemCYnTvnzvzP43/m8K9LlnznMXpJG+Vf6YEc'
+        'HZzCdQwke2XMM7gbXtislMlYAyDDMJ7jPj4GqOryDiYxiCv9yoEDeIjzv9F9gSd4'
+        'E14qN2B5hmW8DC9W3lUkSuLgLFmX8VsbN3EVZ/6QrN2kgz24jGvdQjEeFtaZ0bRM'
+        'YSy9p9jAn/NNWJ6Guo2l+hnFBt3Y2QKAspsBRQ/lrOGik3U5P0e76GFp01Im1XQl'
+        '1u26B7IkIW9jbx+S8iweB4g7eJoCqCrgDcziQULBpuQ4XuMCLtUBrIS147iFuT6E'
+        '4lycO4y3kqzM0MI+bMd8kixNjvkI+0lMpzmQ4QdO4EOAyRtMyIpVI2HgWDxwazyw'
+        'HMjeJYWnaVnG4TBwLr2kDGRH8apGnaZomOMLjuFzJHdRJNzfFSCm+1APqhDsjsds'
+        'Rs3N3wNZq0/Znz7JRxIAZZ7EZiJcs4pttbK51VEl9FA8y7OVl4vaRVNJTehHKT4d'
+        '9yxUYSmSUHwLxVHsDMStQN0KvcGg62Cs17vfju8sOqpfjU4FYAjvIxSVm0osRnFa'
+        'DL0RfIrZBvaX8DUoON2tIVmNyxdwKGmZdgf60YQZEwlD1rPfwQ7sx0HcS1mWvv2T'
+        'uBgH5l0opEefsJ79TszP8KgP/camm5M1i4E+N6TSRuS/VPITkAKgcPrrKLAAAAAA'
+        'SUVORK5CYII='
+    ),
+    ('pause', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAA00lEQVR42r3TvTIE'
+        'QRQF4G96/BaKdCUCiUiJ5B5AIvEeXotHkMs9wQbINthCscFOS+6orq5BMLhJd5/u'
+        'c++5P81Ia6pzi32s4h1PgU+wgSUeY/0kQELGKS6xhnPcYxNX4fQMCzz0nLZQknGA'
+        'F9xgC7O438M15tjGtOekKoUcEXdCchfYOnbDaVcS0kBdcuSYixr1WFc/TmO78JWC'
+        'of1Q1/5GQfNNxPxvCtpiNkos/eSgwRueY5RTYIsYoteas1I5WOIkRvkYd6HiCBc4'
+        'xO2vfqbR9gH8sDBAj6yeFwAAAABJRU5ErkJggg=='
+    ),
+    ('pause', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAABhUlEQVR42u3XP24T'
+        'URAG8J/XDn9sEWwKFHAukAOkoaJKmxvkDnScAk5Aww1okWi5QnqQhajiJHISIM6j'
+        'mZVWK7zejW3hRH7VajSa+d73jcff4z+f1gI56ZZ563XmMbCFPh6U4hc4KcUG6EbN'
+        '/Na/McafWQ06FfFrHOENvqEdxVvYxasCiAG+4jumAfw68t7jQ6FmLQD5eYGPeIeH'
+        'mET8C3oFAD2McIBtnEX8LXaqGmRzANzgEnvYLzAwLQ1XCpp7OCyxNa1q0KkxJx2c'
+        'F+YlzZidLCgeRU6qM2fZkn+yTWvOTW6FDI+C3lSRl6JevwmAeRLkRScFXdOMvBzs'
+        'zwZsNWKg24CBZBV6reJkNSW4iu1Xte9ztsarkKCHpzUleL5MCfKiv2IQ6zBwukwJ'
+        'Vv6XutkDmz2w2QN3ag/UvdXNMiUQLucJnpXo/lfjDoYl15QW2QMZHuM4rHlerF26'
+        'ZSuc8ASfAkzevL0IgB9hy1+XjObLgkMW30N8nmHL1/dhsvZPs/v/OP0Lczt+kYLT'
+        'Xn0AAAAASUVORK5CYII='
+    ),
+    ('preferences', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABbklEQVR42qXTPWtU'
+        'QRTG8d/d3RiTNQYESZAIWiqCLyjYiKLBIgYtbWzE1m9iLdZ+iBRCLKysDGksBAmC'
+        'iWZ9AYkJcVnda/NcvIx2DhzuzNyZc57zP2e6/owK3Xzr1n4n9s/RLdZ1bA4P8R3b'
+        'hcO/HFSZz+AOjmIJz3AD07iInVhVOmhU3MYERniBN3iLBfzEZbwqU+wmvzEOY4hV'
+        'HMR8Dq7jF2bxOufrksFx3MLLSD4V+ZNRtIMr2MdAQbjGPazgXdI4j0c4hj528RR3'
+        'W3eqNsR9XMdG1pNYxFd8SrCb+ID3CTJsQ9zCgURcz8/POXgOJ+J0iDO4FCYbvVYq'
+        'c9jD6dT+I67ieeY1DoXJEVzDalOBcQCexFncRw9fYrOBWmW9HbB6rZJs4nHmF/Ag'
+        'ir4l2m6UjPCjgdgp3kInTNbwJA00kfrPRHrT8uNGQfkOGsejlHAqIAd5G/00XV/Z'
+        '10V/jLGcjhxEyVT2p8Nhxf+O32GaXAcUkzqtAAAAAElFTkSuQmCC'
+    ),
+    ('preferences', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADnklEQVR42tXXXcie'
+        'cxwH8M91P489z7MXRmFecrBkK5EQJrYxNmpxIjsQcsLB0BzYAXkrrOFATQkhzihN'
+        'GG0xIi8tLa+xlJewhAfLY5O579vJ96q/y30/rzvxr6vruv7X/+X7/32/v5erMrVW'
+        'oZXnLjr+721giuNHcC5Owl/4LVaZdqvG6e8WIAey4TW4Al/hMFyWbzUd3VDUORCg'
+        'Wo3+g7AVp+f9JVzYGDPcZ+6kKahPfiiewZVo4xTcj8/xZMb9gg04NuBuxJ34CZ9N'
+        'h5oq1zBexDosxeO5lvaYcxzW4/mAPQtv4rypWqJsLbxSmLrZhjB/nPmbcf5kAQz0'
+        'eO/E7GuwBYPpOyIn62BxaFqMrzOmwiqcHLomJcbBHu/tAlg711KM4p1wvyu8Hx4h'
+        'vouxxonrNTrTiQ2vYUneF+BEzI7gNuAhrM73RVgYaqrQt3Iqm1VFkLkK90TFT8Qj'
+        'luHj8P4sPsCnWIuD8XKs8GVixe+4NcC+jcWqyehgBV7HGTFllVMtyvcNUXzpAdsx'
+        'F0fi6OLbMdiEh/tQ/S/F121eBLWj4G04ZhcLfFG47O7oo5VxJYDv8WrATehydcj9'
+        'CIckwl2U/j34uei/AcdjDm7DD/gDR2V+hRNy8pujpTq41XFmwvyzEjtjRlieDeD6'
+        'LLoNTwVIPWYoz5ckiA1PJgdVPXJ9OyF1Hzbm2wX4JhTMwSz8GkutyfPcnO7vCHFe'
+        'xrUbetuMF2rLlOLoFiZ6OyqvIqCdoeHyCHV2YsB6PBD11xmx1QhC3eI+gpviMZ+g'
+        '1VRnOwNX47k8748r7UmimZ/TLchCbwVALcax3AewNwGrBtANRQsDoBrskQnn4hw8'
+        'nf6Ls/iWLD6G76KLEZwWCoYSF37MOnNC40jW3h9Q8wL4P/5ZFxNjuBsP5sT7s8Ba'
+        'PFrwNxiu3+ghslMDalePb6Plvk0KOll8c0xeRfWSaG6PyUd7FC/Loo8VuBfXFq7X'
+        'abhj32RUWmJ7wzu2Js1uTH0w1Eg0y3FXzHsdPpxMRuyXr0s1dwtQj+W+qqgFa9B3'
+        'JPqtS76YcW04UVuFR/oUt/cVVdFAY8ymIpMODE6jbJuVYNPc9Ba8h0tTrOwo+J8y'
+        'Bf1aN5u3e4TV9+Mls3B1ckTVqDeriSqiqVqjXehgWyqn3Q0taUTEdglkJgD24uzU'
+        'f3Vh82csUI0j7iXJrOP+GU108m4i2plFqNXwmn5z9yW37Jnpb90BadUM57amObf+'
+        'j/QPodrgvyavwEIAAAAASUVORK5CYII='
+    ),
+    ('previous', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAA3klEQVR42rXTMUpD'
+        'QRAG4G+forEMGhvBA6QVUngKsUglmCagJ/IENjmANxAEwc4U2oiFnkEx79nMg+Gh'
+        'KJoMDD/D7vwz/8wuK7SC6q/J1X8qrwXuYJriL2290zIsMMIh+tjAG5q4k7GpUstN'
+        '+BgHuMBjENZx1kUlsfVxigdcBfFZSHhPc6nRwy1uWoIhjnCJp0haYD+I6yQRBtjG'
+        'rJ1B274UwzNeU3IJsg/s5iHO8YJJR8I0SSiJYAt33+19jHNs4iTwx503qcJ9EB5j'
+        'D9cxj5K8WtpDWslTXspn+rV9AknOMXtP/ztaAAAAAElFTkSuQmCC'
+    ),
+    ('previous', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAB5ElEQVR42u3WPYsU'
+        'QRAG4Gc/4FZQE0FR/EAzwcRAA0URDFQUNBMTI1F/xaVuZnaggSb6AwSDSwRBEwPB'
+        'CxRjQQXhOD8Q8W5nxqQGmmHXnd1b9w7ZgmGG7p6ut956q7qZ2czGtwaaG+W8uZGR'
+        't+LdwYmEjalYO94HsYTHlfGxN6xDeYEeruEmXq7H8TiUw91wvAfHJ8FAswZDGfbj'
+        'GeZwCp+wM1hpjfg06wIrF16OfF9PGGngPO5PSlRVyrP47uJ05P1dsr4IEEdxIf7J'
+        'Y7ysiiKpjnI8w0e8HQSgHULbjYdB9RmsJnMlM0t4hSsJ6HIuT0CVQa1iF/bhWKzN'
+        '25XO1ouIuljAvSQlvUo0HTzAGn5gB77H3HYsY1vs+xV78RpP0n3aFcrmcRFX8T6J'
+        'Iu+TqpX4Lw8Q3yJK8b2Gnwn1y8FAa5gGiiG6KRIAKyNq7sCwwwXORX5v/YPe38Fi'
+        '6q9RQ4S3+4gwj2jmY7xR4zzIsTV6Sl8RCgctfI467+I5blTKMMdhHElAZDVSV0QZ'
+        'GqCr6Teiuo2qbMULCdWX8CgAzY3bioeJq0zJB5zFb7yIw+hLgMlGfPJBJ93fclcC'
+        'XcQv3AmhZniaCHNqF5JDeDOJ43g994MtODntK9mmuJRuimv5zP4f+wN3jHr+L56x'
+        'tAAAAABJRU5ErkJggg=='
+    ),
+    ('process', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABEElEQVR42pXTsUoD'
+        'URAF0LPrGjTaKYIgVqIW0drKD/FL0km08ZssbezVQsRGEATRzmhQyNpMZFw2hLzm'
+        'DTPz7tyZuY/5ToGy6WjaNfbRw3L4hnjETRtim+847teouI6tAP7ARcRriVIfl4nm'
+        'YtgFOpEziJxqUryKQIkVXE9Q8ZNYfceD02nD6eEkgRUtbRVYwFK0uJfp7+IpWNSJ'
+        'hTTYGuPU4kEG6OIdny2Pm0AjvASTfzsdz6GHsmmMsBmoxQwhdbEWbP8AblOfZRpa'
+        '2yCH2MbDLMlO853hPAqVZQpWIZJBMOmkqllUR8FinFEnsuxjFfd4xlskbkT8qrml'
+        'aQM7xE7oAr5wF8D507Wup5jnf/8CvAM1ZjcfaKgAAAAASUVORK5CYII='
+    ),
+    ('process', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAC+0lEQVR42rXXz6tV'
+        'VRQH8M8599IvsXdV1MgSfRWENciICpI3CIwmQryBKDTUQc0iaFqI0/wHmhRNKocN'
+        'S6GJ6IsgIoqgfGUSlYN+mBVU9zT5ntge7rvXe7t3w+Zezt57re9ea33XWrsy26iK'
+        'CU0xpxY0rdJxiuoOoLkCKMcd2Isl/IOf8Q1+LPb0slZjOCuA0sR34wgexa34KYpr'
+        'DHA7rmEN7+DyrBaoIrTC38UNjmAf3sWXAbA5+37FdtyLg1jBObyCVazjo8KFU/m9'
+        'LoDeg004FDAPZu7Lt01xzQ6cjDWu4rnCLRPHw3ger+NUDrUHn8DymLPLub0AaoPx'
+        'jXzrj1PcRvAqfsvBNzdAXnWY0XVnhf04FhmnChnVJJrBh/gLxzsA6gmBWxUX6Y7e'
+        'qPNVxwJDnMj/C/gWH88SPJ34GU7KDS3qXTgTSi1iHI2O/y7f9csxfIdLeCC/9Swp'
+        'trhYgwNhyJO4LxS9Tm5rgbeSaG4uor36HzeuCnbcFIadLnWWPtqO25I0DuLijL4v'
+        'RxMZF/FUZN+CndFZl1G5NxntypyUjwLRpu9lI2i1lMVBobyaA4BS1iA6ltq1usPT'
+        'ocWPOlXyuiiFXwqEFuCCJrK3FDqa0gLr2JoNexbggrZIbcbXJYBhNn2PP7LxvQRK'
+        'MwcaNqmi70f2tQR6jabf2biGZwJk6xzYUBUZtoencX7SxqMLCr4BzuLOMhFVEypj'
+        'G6TDGYtRk7K8G49Ezsvj+sRWaW8MhW60HLcyjqe0r40o+yMbjSZCXsWz2JZvPxRW'
+        '2KghKUtua70X8FBc8AU+K+lfj+BsP4liWwC8hruytlKwo9v/N1k70EluV9KSvRSq'
+        'K83f3yBxSLSu4nM8FhNeSu9/CF8VFximIz5TnG/p/eK4+OlNyGAfRMBKTDnA7/gk'
+        'D5E/k0EvB9j9ad934tPCLf2NYmeaJLMLh/F4yvbVVLdhgG0JuAt4O6CqjlWnBtDS'
+        'pVcWkPQOe6K4FyusJ5su/HFqTNW8kQfsXB6nc3ue/wse48T4z9AUdAAAAABJRU5E'
+        'rkJggg=='
+    ),
+    ('redo', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABR0lEQVR42r3Tv0tb'
+        'URjG8c9Nrk2DinQJ/SUWJBYXRVLaoZ26ZOvif+VqhuBm/wddHN0FKRXsUKUVKYVS'
+        'sUpI0yQu7y2Hiw5ZvMs55573/Z73ed5zuKdvOpln6UblluAM1dLYwkasxymkWkqu'
+        'RMA41sX4GA28xBH+FZCsdPIYC3iNOUxhiCfYiX8r6GCALEtOHqGNNXzGd/SQ4xd+'
+        'YAZvsYwu+nmS3MIqPuI85D2IqoYBusLvmGfI8gioBHkvkttYxJ+Av8B2UsEm+img'
+        'EXpPsITn2IrkEd5gPSroFskYF23M8RfXmMW3cHoU+zU8iyp6ieH/2zjAK5zhK95H'
+        'FU8D/gW7AcyS9qqG/kG0qolDHMTte4h32C/fwBRQmHgaBjXD6WP8DAM/3XXHy9Qa'
+        'PmA+PKmH5k7S7jsBqbY6HoX+C1xO8vIqkwTfAJemSw6du47YAAAAAElFTkSuQmCC'
+    ),
+    ('redo', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADCklEQVR42uXXW6il'
+        'YxwG8N+39lpj78ZMNjMOQ5hGOaQoUyjiglKTkjSijHIlbpAribgxxuFiNCgXbuQY'
+        'KUW5MzGUG6dJDJlczEQTZmwz9mktN89Xb1/rtGfPXOCtt/Wtb73v//A8///zvov/'
+        '2Kgy/7/jPJyQ59Y4G1rHyHFtZxPeQRvdcehoHWME/sZleD5I9Eb5aB1lkbUGzGk8'
+        'im/wFiZGITFuABMx0svsNuZCPmdwIrbjW7yBFcN8VWNkLE7hNKzHqQmqXHcEd+Er'
+        'fIxdQeN83BIbVWFrZAATWMzzZtyAk+JopkCjtrMQ3l/DTtyID/FA6mIz5ppBVEOo'
+        '6Sbbp/EnPsBe/I4ODqXaYT78f13YncZF+DnOr8LNRU30NGBsOt+IF8PjmwXHXRxu'
+        '1EJN019Fdkcwi9NTD1N4EO8FLYoMSkR6OBtPYRu+w7rwuriEmqnwS5xNx9dCaOiN'
+        'MvAy7sXFuHIZmlHveTxt2WlS3+4D/dVYjXdxCd4voj8Hd2BtCWNGNy34Cj4p9mxN'
+        'Ld3a5L9ZA7Vo3I+PsvDTwL6Ia7ADe/L+R/yUuRc/4Ip0wq7seSLOtySYVhP+dqON'
+        'pnBGsp6LtHbD4SMpos9GHEaT2fMMzsLtCaYqCtagIlybCA81IN6E3XHe6WOopm8V'
+        'DuI+nIvb4rzVz3lZJHVRdOK4U2QPp2BfIU6D5m94CBck87lBmTcDqHk5GMd1EPX7'
+        '3closaiX8hCqx0p8ng6a7cf5sACqQuVWhZ4Veb8TJ6cDugmkeSCJyAzlfNhhVLfN'
+        'w5HeL/EF/sjv6/BCvn9fZDeDV/FrH0Fb0o2ojvZ1XJ/2uq6ojX24CW9Hig9Heu/E'
+        'pcW6sZ0PC+gxPIkzce2IPc/mpBx0tizpSlZfobZhQ9RrTz7XDJDj1cu5w7X7BCDQ'
+        '3o2Xcgl5DhfmhJsv7n/tvKuWC3k/FA5ESHoJZGMUcSrtNpn1k8sJoBrxW41ILSwb'
+        '0mLzhfhcjnuikhNjHNlLvhOW/VyFkpUFerPYX1Bz3P7ztY+X4aNZX/W5C/w7xz9E'
+        'ht4nTa/0ggAAAABJRU5ErkJggg=='
+    ),
+    ('refresh', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABaUlEQVR42oXTv0tX'
+        'URgG8M/9KlFSVkI/hhAsCEKMFBojBCGi1oQaGwSX/p1qaQxqcqilwVlrcNASDCm+'
+        'JEhCkUQSfO22PCduN80Dl8s5h+d5n/d53lP5e1X51/5dndb+F/S1wAU4gWuYwha+'
+        '5q75gf4W+Azu4hvepMA5fMKDEA2hi2fodBqyT+M+5vEKIxjGJk7hM55iEOvNvgrB'
+        'NF6k6p0AH2ItZydD+hxjRXUnZozhS6RP4nFa2A75Li7hVs5+YhR1MfE6ljGO19iI'
+        'P8WsHuYCHsdKCN+VaI5gB8fwMfJ6DYKd/Ls4mv1AO9tqjzjtE3PdHo4fOIzvcb6o'
+        'KsDSzkjaGCiqCsEqrmABN/EoeZdqvYCmsIjLwfyJ8S0O4The5rIYPIirmMmMnAj5'
+        'SnOQ6qQwjQ+ZuF1cxCzOJv8atzOFUPc3TLqQ/u5laLZy1g3pjSh8krsKdeX/63wq'
+        'buI9ltqJVAc914Oe+28jr2AeFb4d5QAAAABJRU5ErkJggg=='
+    ),
+    ('refresh', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAD3UlEQVR42r3XS4iV'
+        'ZRgH8N+Zmbzfcsa8jGkNDYmhiZpFEUm6bdWmoIKiTVRQgV2JrDYVLYIui2jVoo0E'
+        'hRlFpS4qJNNKMIoJBrsQ4y3NcjSaOW3+n7ydzjkzY9YLH9933stz/T//5z2dzm7U'
+        '0JHnfxs1dJ1rpbUJeDtSzF2ApZiKr3E4++rZ20ruaPaM24COHILFuBVXYxKO4Aq8'
+        'jBcSnT8nGoGuNmud8XoqNmM9PsDTGMIB3Jd1hfdrMTe/a3l+i3GHMVBEq6UBlfJV'
+        'eA3vYwMW4JcoGcZJTMuZEfTgTeyMgk78jqvQHydqpQGtlIvCb3BdFC/DGszJnkvx'
+        'Bh4vzi7GtgZ5F2MHljdLe1eTnI9gNV7CzdiPlTiU54FE4FjCurM4X8fkYKQLMzE/'
+        'Rp8ay/sK7TPweZTAPXnfjl3YhAtbVFMvPirm78p7HT7BlHZVUoX+OTyVcK7J3DMJ'
+        '7bwmIC4FLsGW5PyJzK2OrCfzlLr+4cHieAl9yfOdeLdBaa3F+W4MYjv24I5gpy/r'
+        'HwdPLbHwaJ5+XIbZEXR+kaJ2hNYTA1ZgevAzM7L6I3tTM/xVAt7J5jlYhGdx/zg4'
+        'oxqzgvpqPJT0LYozK/B2YwSqj/nYGprdEG8/xMICveMdndnfm3R0YGNkby2wVCsB'
+        'tDSkcRQ/4vKU2s9FiY1nlH3jpxDXysg8Eh0XNTNgdphtZup4Ok63Qm2bMVoYIvU/'
+        'A+clRcNJ8RkD/k2nPJuOW28MVzXxa3j9BP7Ie0rB8yZ4F6giMTnNqJI5LamFemnA'
+        'YMLeHabbl/LrLdIwOkGvK/TvC0l1R8eBRgNqOBgF87A7hLEbt2TPSEps1jiroJ5e'
+        'Usn6rED/wcaeUNX4poKIlkfZ/li9IlHqGQMjVZrmhsRKInoMD7cjogWhy4qKl4VO'
+        '96SeBxNGLei4FPpeQcUVOe1KWs6c72wI24nwwfUJ2Zz0gYV4NfW7A8cLai6xMRqy'
+        '2YIv8XzkHceD+B5vtcJTJXBKWue6hpYqrba3RQSWhHp34bbM3Vu0491JZbtL65nF'
+        'PnyRtjo/pTMp1Nxb7L8Wr+dmtC13x7nxem3OrM7NeVWzUu5qQhL1XDSP5fI5VKyf'
+        'brB+fWRsxncpub7U/Q+4Bq/g7qSks+F6/zcDqpK8MtesATySsI1E8cpQq4KgdibH'
+        'G7E330Oppo24CV81U95oQOX90YCwKxxeL7jixaxXwupJzxC+xSW4Id10e1J0qpXy'
+        'ZgaI5wPj/D8xnPCuCz+cwqe4MZ1Qk39VYzacdjefesqnYrGeENbJ0OuhhrIenUAb'
+        'Pyejo8Wd8T9rubUCvPWz8fYv5pvmCpSSN4oAAAAASUVORK5CYII='
+    ),
+    ('rename', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABFUlEQVR42p3TPU4D'
+        'QQwF4G+TDQk/Ev9KgUS4AZGgpoeOgo57cCEabgFnoKEFCUpERECQhCyNF40WCAmW'
+        'LNk7fuPnN2tms1r1Q31K0A5aeI54MWL5BGCGAg10sYEt3OIO91Hz1SWb4DCHs+o4'
+        'JYPxFKMUeEjycXnBMk7RT2j/BF5CE3vYxTzOc2xihCssxM1FQj3DO3o4xjVucIJ2'
+        'LQCPGKSiJJ1reMFT1A4i72FcatCIcbIAFMk4WZw3KqLWSw3q+AgN8ohTBnmcDSIv'
+        'kleo5UFlG0dJ96qNsBpP2cU+1nCZJSM0fwGXdFs4xEXUvmJYajAMn2R9tPEW/ucu'
+        'lOya0fkA6+hgJX7nzAzL1I68EzvxL/u2zp/W2zvzllAK1wAAAABJRU5ErkJggg=='
+    ),
+    ('rename', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADA0lEQVR42tWX20tU'
+        'URTGf2fmzDg6KpUpFY1pBRXRDYKcAg2JyKAbhkEPvfVX9B/0GBREPdVD9TBEIvVS'
+        'L6FBEETRQ1B0gSIjYaDLmDrO6eXbstxqjXi02rDZZ9aes/a31vrW2uvAXx5BzLqc'
+        'vkjzd/JFHwnNJfFAEshprQBvzd4yoElgisBInAACubQBuADUC0QSOAd0AH06dDlQ'
+        'AK4KTCVuLmUFpAE4AbwB7gLt2msEapaS4AXgVDVEiTsL0tI7ApQkS3rZMDXCRQAT'
+        'GGI6jtjD3VrxAcRFijGt48ao8lx/Ds26W0x1DE14xcSXMcdeEvgKrFcIssB+z8Ai'
+        '8AQoOwArgWvAIPBDL40CKe1PABnJMvodaL8E1AE/ZUga+C72l1QHeqVnUu/sBTqB'
+        'YYeoDbghK5olazKI3XOL1oxJqdVaV3gkuwgcn8PzN4F1lnjOdWuAvHI2D2zQdLJ9'
+        'ArEL2CFgncr9PLBRXggFsGI8FeqMrLw0g/kh8BnoB04CA8AqzQHJbst974CPiu0t'
+        '4DRwD3hlSBcZ4ya9OeNCapNbclKGSmiLZp9kZwS6Q6QFOKu1F9hswnAFOGoMDUz4'
+        'Ci4EoUGZUvEoKHb9wDbt9wPHZG0X8FrvdgPX5Z37wDfJJ6rN2dBLpTpgLfAM2KJ0'
+        'Qc/Pga3Ae/HB3XrbgadKuw/Al/ne2XakRKhIYFKadZLVa03LlZH3/7SIlvAyIuHN'
+        'wAcQyaJh1YJ2YEhVbUzP7cBD5fUL4KWy4IEyZVAeKEvXuDmoLPJVVBvG/RBUgFbF'
+        'eUwx7DEldJPkPXq52yju0d4hY9SoQjIqz3QZIzMi/bS7oAg8Ag4IaWIBvVtCVTEn'
+        'AI3AYR3o6s2Q4deijUvyaFVZ4K7PODrWlEKYNvpC7zIK5OlpACZj6gMioy8yPcGs'
+        'LXkYo8sj0wegSy1rSvEfQ7BQ62tM+3UQ2AnUAo+BT9or+1UyjOHgSJae11orMEeA'
+        'PcBlXVyNwB31HVNteZwfJq0yqDzLh0mzzirOt1T/N59m/+THaVXjF6p7vI1jlOpW'
+        'AAAAAElFTkSuQmCC'
+    ),
+    ('report', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABUElEQVR42pXTPUtc'
+        'URAG4GfvXkEJWwiRFAYslhSCRkhKsQosCNYWESv/RCqL1KmjkCrBRit/gmCTKp3Y'
+        'aEhCTIjFWmhcSPYjzZxwuOwuOs3Mme/zzgz3o9o4RR3PUYacaBB+n/AbBfrJWGRJ'
+        'HmMVjzJ9PfgidjETwbW8ano8DH6MU3zFF3zD3+AL+IHbFFdUWp1CI/vGRPg8QDP4'
+        'G0ymoLKCySBa7MW7H7qP+IVu6Gdxjlo5Bu1BBmAPZ2G7zB3HJeiHPVVtYi1wqSWg'
+        'ixHBPSxhL3CZxkschj0V6JVDgrtoYR6v8SoA3cEFVmIKL9AuR3Qwhw+4wkFgcRFt'
+        'H2Ejxt4YlqDEu0w+yeQuliPRT/wpKpU7uM503Yq8FYu0H1u5XVYcnobczsZYjy1s'
+        '4Ts+YxPbGORHcxPH0qkcWdrQZ3gSN/M21vvO1MJ7rEey/5f8D+QgTSvvV0SPAAAA'
+        'AElFTkSuQmCC'
+    ),
+    ('report', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAC70lEQVR42sXXTahV'
+        'VRQH8N853mdBIqSm0BcEDhpUJPjsAwPBkQ9qkA2CCpPIF4iJk4gGDQpq4jgHEaVo'
+        'HxgFRTWxQUHfNGpUEDWKohIM+sD77r1O/icOh3fuOe8+yw2bu7n7nL3W+q//+u91'
+        'uMSjmLI3mPHMceYlHeVqEZjDPlzV85xJ5nm8h++C4NJKPa0c2oCnG4dPG2vyuxtf'
+        '4tYYH8zKiWsTCdyF9T3f34/TOIM7+3CpnALp5Xl5iHVZz+W3Oatnr4vxgziO27uQ'
+        '6CLLEq4IxEs95nlsxrfh0Eu4I3vlqtjac6wJYvApHsQLmE9pliup9Yp4fySyPuNn'
+        'HMEuXJZ31+EN3IS/w7NJHwcqQm7Crz1SBSfwDtbWEPkTb+FK/NUs/YuNwLDF2X8u'
+        'ttz2KeVBghhN41qfFKyvQdrcn7QgV9TIOLNmV4f/FvK07S935gRPYk+XnXJGBIra'
+        'ftlAdIzteB7bVuNAm1NVhN/jqRicq4nVbXglKvhco0pmSkFVBUWMjHPwT7g3SjcM'
+        '2XbgZTyCL2qXVFOsqkCKvjrwexwa4ihuxM5AfRL3Zf84Ho7xQZyqB1PW0JhMM3pN'
+        'LhUxtAnX4xjezHOV8/P4JSq4o1Fd1Xkf4Yas9+BdnMLVg576PsJjmVV9j7P+KrBP'
+        '0gsMGlGW+BE/4H68hgfy/6vTEPgw64V4vyEoNDupsoNTVQUtBtUFfIZb8HWfFMxj'
+        'S0cbV7YYrxDeFwTO5HLaGlRfXIkSVswdtXTCy/WVQxzAo7gZe5OCb/A6Hu+Tgt3p'
+        'dLra+OUiP4DPsbG2935SMOhzGQ1ynY6yLjoa1FGt1BbTIy7gbPafiawvtHFmtU1p'
+        'NR7Cx422/ll8kEblXykvWm64LSmvY7WIiw7VLFJWG8PunfikFvl23FPrD8dapFKk'
+        '91wa0qJn7oso4BNxfn8E6GDuhbubxv+LUU/d4SBzusa1su2Lpo2AZc+5tsb6vXFk'
+        'W2T70P8ReRXZ28n7Yr4POr/CLwDvRrVIEk8M6gAAAABJRU5ErkJggg=='
+    ),
+    ('reset', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABP0lEQVR42qXTsU6U'
+        'URAF4O9nV4RFCLsFUEkIGitBt7TwIaCmJ6EEG5/AhhYKnoEnsbEwFgQtoIFmQYlb'
+        'EAI0Z8nlhw0FN7nJvXNn5p6Zc4b7q8oeth68V7XzTc4fsIhW7H0c4kfdt6oZ5rCC'
+        'fzjCWd47eI1J7OO0nqTCDDbxMY7NAl0Tr9CNz0xZzkj2eoLHE9TA5+xBsrH4rA/i'
+        'GoHxHm18x38s4RsmAn0NP9FLPxZwnVLAKj7hRWDt4k1Rwiymc34Z39UBfOl2L2g2'
+        'MIVjjCbpOfawjas0t1UmKJmYzy9yHzB1iT81uu+a008PmvgSuG2c5P0t/mInPp3E'
+        '3CU4wDJ+BWIHX/MjvAv8KnQuFqIaSmOzoLFR0NgtaXxMSN38MkxIW6WQ6lKeDT0X'
+        'NSm3h0n5qWGaiK2P348Nk+eO8y2s7kKTZ78SyAAAAABJRU5ErkJggg=='
+    ),
+    ('reset', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADsklEQVR42s3X24uV'
+        'VRgG8N/eexyNUUetNCOd0SmzwZzSccSsi8J0ICPqopDoJqH+gw4U2ME0+he6ym46'
+        'QpAXQZQFQQehm7qr7ERlBKlFFqRNN88Hi89vb/eoQR8svtNa73oPz/O+72o5t6tV'
+        'DJgpxqwF9Xu1a5v1Ugz+uVAKtLL56eLb5RjFwrz/hm/wYzGnEyVmzkeBdmHJKO7B'
+        'JszF8QxYhMX4C4fxEr5tkDErBTqxej4ewxTezjiCY1iQub9HgTFsw634BHvxRyGr'
+        '76uT+yTew55sNhqFbsc41mWM59v8zFmAJ7J2Qw1DfYNtGh/jBizDCG7E6h5rxzJn'
+        'FJdhazwx3a8S1YRN+AjrMQ/XYk1tXgdzMjo14VdnzVxMRInJsylRoX0Y7xcL7qyF'
+        'ZqCHAQNF+Mq1myNzYfZoNYGwQus+nMSBAOuzgv/VfQC3YFXWfI13C7SX+WBdAHs/'
+        'BgPoM0BZuWUkgjpYWri9Vcy5D1/i5/D+BxzFF9jVoMAaXJpQHcLKplBULw/jEVwT'
+        '2qnF9+l4YC9WFOtH4rkZPJDNy3VTWItH8VCTApW2r4c2c4PoVhHzXTgVjjelXmHM'
+        'REO9GIvMjXi1Hv5Kk+V4M3HfWfwbCL+/wrP5PlizoFUD37wG43ZiCQ6GotAuhawK'
+        'WI4l07Xi0lOxaighkG9lep0p3i8J4vfXlDiCXyN/VUmbSsNhnEhe70ToctwR187B'
+        'bnyKDwoFSyvH8EaQPxWl9kThdmQfz17Q6pYUKsG/4IogfwkexE9dakil8POx9AC+'
+        'DwN61p12AaADeR6vAWxf0vLSHsIqOfNDyy01MI7n/cXiX7sOwoMB4W21jVo1YHUa'
+        'kthgnp9LThhKiNsNIFxWp2Il7LUGGpaemEiB6UbDHfgbd9cwdmVkTtZp2K4pcBjb'
+        'g9KLE9dWkb83B4D7U/Gq9mxlvr2FZ/BK1lT/l2T+9hSmM8JYpuJD0XwprmqwdFdc'
+        'fDRpuEzF9zaEaG1kDUb2inLPbsXoT7wQ2nze0Iy2cXN6g1ZRjE4XlteL0e4Y9ni3'
+        'Dqly9cIkkqku5bhzlnJcUvuu3LdE5oJ6Oe5GpcnQ7rqAZ31c2W9DsqZoSK6PrI2z'
+        '7YqmA5its2jJVmfOSNbcFGDvONe+cEMayycTmpHwu1tTOpQ5w3iqn6a0n7Z8KF3M'
+        '5rTk7wTxx2tt+aK4flvGh6HkyV5t+WwOJiPFweSiIPtEUcgWZ7PDeBnfne/BpNfR'
+        'bHkSS1XVToSKRy/00ex/cTj9T4/n/wIPIsrDcOC4mQAAAABJRU5ErkJggg=='
+    ),
+    ('restore', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABMUlEQVR42o3TvUoD'
+        'QRQF4G8TDAnRxv9Gm4hio4Kl2Ii9IPgmvoGlL2LjqygWNoqFqRRRCBqjQlybu3FY'
+        'YuKFLXbmnHNnzrlT9VsZqkZXFt+gyoQ8AcIsjtBCDQ+l/YHABOaxFcCXWK/hI4TX'
+        'sIM23lKRDIu4DOBuIp6hEg2a2MYx5orrVAPwiiXM4BS95Eo5vtHHM96xj4tCIMdm'
+        'CJ2gE+Bh9Y1ueNLHYyU2VnCPJ3z+QS5O84FbrIqu0Ahyf0yMOb7C5EYqUI7RP+ZB'
+        'KtDDdMSWjSHWAttLBW7Ch/qwaStNYT1MvCkEKriOnFuR+V8CE4GZDE4lHeU2DiLn'
+        'TuJJQaxjHXs4izgHnbIAL+AwRrUdg5PHm1jGFM7xWHCy0hGLFDbCk2b8d3GHqyHY'
+        '0c913P4Pc7BCevTxO8AAAAAASUVORK5CYII='
+    ),
+    ('restore', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADCElEQVR42s3Xy4sd'
+        'VRAG8F/fm4cw0blOdHQQM2YmRomjYAaimFFQjHGjGNBV9oIrXbjTlSYL/xWRLN0o'
+        'GhWfEQRxp8nCV/B5M4qJKJPr5ms408y9c18LDzTddFdX1fmq6qs6bZOtCu3c/xer'
+        'QmsUh9oTGILbcD/24h/8hd4ounf0UV5fveJqyvRwC57CDK7HnziH1/F9ZFu4ut1O'
+        'xl178S/+yPPteBSP4COcwt9BY2NYB/ZgH/bjoSg/3ZCpd7WKK3m3jHcwjy5exIN4'
+        'AV8McqJWCM/gqyKWPbzWkBm0lrGW3Lg5z+dwfDsddczncSaGL2eXTw6RL00078Dd'
+        '2I3DcWJ1OyfqDx38GicuYWUEBKqG3Incj+K9hHdTmVZbxPUUrgmED+CuxHlgNg9A'
+        'ZgW/49nkwUtb5UPt9SI+CHQtnJygWup/DuJG7AwK+0qb7UZdP4dv8UNK6s0I9sYs'
+        '01bCuRKu2IVD+LCwuQmBMzgSweVRaXVAKJaD6ireKBFqFbFdCExfp2zO92HBUVb9'
+        '73kcw4U4spBvrTJjl0Ig3fxQTWi8dKKK8W4Scn8JfQ3xbAQ6hfFptNlSVwfrsQVV'
+        'a4p9YewsrWFej4eXGp5PKwQ1sc3FFvRKBC6ko3XC5dMOwVKMd5Jjm9ivwo9pnUt4'
+        'O6VjCmUIB/BWku8Kfsq3qzsaXn6Kx9KIrounkxBRlQ3OhfSOx4Z+RLSIs+GD+bDh'
+        'pFR8Z3Ttwrv9qLiX526MHsWXuBa/jOFAOdYtZGp6HhfDtu2tGlvdSvcEhfsaLdUQ'
+        '1NyvHR/B+wnrQB31z6v4JMPEbtwTKJvw9htIDhYDyb34LE4MNVfUAnXCrOGm5Mda'
+        'qqTfWorMYuK+hs/x+AhDzaaZ/nDC8UrBDzN4Im11JdehvJuJzCxeTf8fOIpV2zix'
+        'keno5RxAzqaev8FvialMznOp92N4OOidTkmPNJZvNX7DrXg6yTkTOu1Gx2wOJpfx'
+        'cXr+d9M6mNSZXe7ghjDlbL6vh8p/bpy6NqbUT4Y+eI58OK0mcKYswd6409N/gSil'
+        'kasibcgAAAAASUVORK5CYII='
+    ),
+    ('restore_database', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABOklEQVR42qXTP0tc'
+        'URAF8N++fbqIGCEbFQS1sIlgZSLYRqwtrSwEP4aVH8tCbFMEwSrBPyQqphQ3TcR1'
+        'd23mwfB42jgwzOXeuWfOmTuXd1orxRHm8RmDWt4wctro4bQ6KFLSGHYCaBCXKu+g'
+        'jP0NrFX3y1iMAuAeJw1MN3GJGzxgrmJepqQ+PmAJj0kenAWDWazivCqcJYxSL4Yp'
+        'DgO4g+c6tcxgPBp00yBhC79D4k90X5MwjYWQUAQL+BHFuljBRZOEt6yLySS1qHpU'
+        '1p6xh9sGgC+4wjX+JKB2BngKCYv4X5PwPYZoLgrs4Rd6RW0qq5coUiwwEU3u42s0'
+        'ertJwr+g+ZptYR0H2Mdhmar38RHfYt1q+DfLwXIFUzhup8NBUJtJe9nbMQvPuIvB'
+        'Osp/Af6Gv2WfsBuvUrwATC1Lmp+NG6sAAAAASUVORK5CYII='
+    ),
+    ('restore_database', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAC30lEQVR42s2XuYsU'
+        'QRTGf9XH7now65EZmYhooLkgigiLJoJioIFo4IEiq4GKqAjrP6CRia6GgghGghh5'
+        'omIgiMKKN4ggLsrqrjsz3dMmXw1FO33NDGhB0dVd1fVef/V9772Gf9xMwbzXR1st'
+        '/sdmcp4bYAuwQt6bLvZPhOJ9daNn7eZ3eMmXwb3ATuCt7uOCjmOgqWctObAPeAd8'
+        '1P5tJ4KMc4+BNcB54E4fkJ4F1gH30hNBzksNYJ7WeDkksnM7gI3AK+ACEAEDQsPX'
+        'PVUcsGfYKmBxov4CqANfZDRJHQ9VHRgQCq2SEnqu7rZ6ka0gR68PRML3Ooq6HFoA'
+        '/NS6GjClfQa1JhDcvkgZAZuBM1UR8IEQmAGGZLChDVuC2R1b8ibOedtjCKvIONT1'
+        'CrCpT/HmKHC6k/TzQm1TPDAOnJ26p+tWYBw4KGSN836mioIe8oSrAoAJXT93MGa6'
+        'UYGvAJIUSUntpXo6llg0h6qq4DGwB3gNDIvhs8BC4JecqmlsZCAS3A1xKdHcNuBk'
+        'CrFCDvyVOEoGrSTjiKiqgnFgpE8qGO1GBZFgLVKBndsFXBPUVveDzpq4ExmDPnyd'
+        '5cwTKeB7SgWJ5Bg49UFcxoFQZCqrgglHiulc8EH7LdW4HRdMhvxiYD+wATgGLJIz'
+        'MxpPS1rDKRXYkNyUwRB4ozUXgfXi1SfrRB4HYhmdK6c8B0pPm7tjP5VDPHHgN3Bc'
+        'a8cU4mvOcWSq4GqfcsF24KGyKMqK12Xc9woqogEttF9atlturQJ2Kx3/0MedU3A7'
+        'AcRFdb+paNhzEtEy4LbkPCLYI2AtMAmcAg4XVUTTWbVcyUL0CLAEOKtqaQo4IG6M'
+        'Ao28XPBIG6zuMqTauvAWsNwh3CRwA7ibFQdsxLoEfAVWdvljEgJzgMWSqK0bAsnX'
+        'B0xQUOneVO+lBcAhB5HI+dHxi0JxLz+nNpsGQmC+ntWq5IJe/2g9kfEZcBn4JiSe'
+        'WqT/AFoDzskBXdKuAAAAAElFTkSuQmCC'
+    ),
+    ('restore_page', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABK0lEQVR42pXSyypF'
+        'YRQH8N++ELkU6gyQgSkyUTIxMVKexIOYKu+gPAVDRZkpieRSMlDUITrOOSZr62t3'
+        'yFm1Wt9ee93/f/qT7C9HiRUM1vxdFDhFEzk61c88CZ7FBsbRDu2GXcAeGpH806BI'
+        'PqbifYQr3OEW92jhAUt4xFuVl9dGHcZYFC5irRwjmMMAdiIOsrJ2k04Uqmwlx9G5'
+        'FYWncd2rgPRAibQjAZ7ULl+X/BcIi7BD6fHzPjnQxmtoF1n+zxXgC8txzPVArZPC'
+        'OIGZgK9ZI1oDu+E/wQe28Fb22D/rAe9AcOIg8Z9jO51gMvQiOnQT/cJh0qCMmPmy'
+        'BtVCBL8kE7WDgSc4i2kqjowWSYEmPqNAXlvnBmu4xHscehWNrA8YF7GJ5+BCC/vf'
+        '0otKuFylFsUAAAAASUVORK5CYII='
+    ),
+    ('restore_page', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACwElEQVR42sXWzatV'
+        'ZRQG8N/e91y71w9UBEMriAgVahJNLKmBQn+Cw4KKbBA5KUQcNNIUmvRBjQoalBbV'
+        'wIbRQDAFR6FQsxw4EILSyo/0nntOk2fD5nbOPu+514sLFmdzzln7Xe961nqexX22'
+        'quO3egXvHdzvi9XLrUCFIdZjP7ahn++7qjWMw2n8miQG02baHPIgDuR5MX63w/v5'
+        'fA4/4qkc3ltu6Xbg8zw/jXWF8S/ia3yfZExKogurBzCXm63Ni8b5mnw+jB9wCB9g'
+        'T6ozs5wEhgnemAP6gaLf4XexCb/gDbyH3Ymr7/WojbKZVG4eP+EwPsEz6Yn/NXJJ'
+        'k1zD7VZVuuwqXsMjge3P3P4j7MP11qQVJTDElgRaGjyCeL7B2RbmNT7G8UzW1AlU'
+        'wbWU2W7htxEw3xxXvRII/sVCIQRtwmpuOt/VayUQrM8UlFibEZsEBivh7DoVGBSI'
+        '16qIxiD/GRZCsHqqtUIbrgSCwZLGmkZp6/h8RrNeemavAIK5VlDpFFQhIBnBD3E5'
+        '7xu0pbqEB26EC6adgu14Cbty+1dwBV/iUtNbJTwwh9kJTNjYFmzFTrwVZfwUf0TS'
+        'd+P97AxHR0Ha3gdOJvPn8dCEHmjiHg/dXsJjY/67AafwTkkTVsm+VIwejXxfjhA1'
+        '+0LTkLP4J9A8i70lEGyeQowuBvu/WztCuz+aNe1OROrVe80Dv0eSb+aQUbaYi1zA'
+        '5npC+Xv4K1PQS0+MWslm89sLqVjJFn0dva4E7kQH1kRmu1axhdzsYMZuEmlVmYrF'
+        'XkeZduFIEtnboWqN5F7Ez1nJz6cigzETs4gncGvctrqQ229oBTUQLPU6VbqGc3gT'
+        '3ybxXhKsWpA2ZHUC362G8BzBV1lOx9m7+Az1zAQhqqb0GmfwJN4OjTcjuSlMeCzs'
+        '+jr6ldWzfXg5UzGbJG4Hni+aZvwPV+K8jYNgR+gAAAAASUVORK5CYII='
+    ),
+    ('revert', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABR0lEQVR42q3TsUoc'
+        'cRAG8N/ebeJ5eMQQsNEExMLSyiIkVha2aVJJOisFUZ8jL5BCfII0PoOFqIF0IYSE'
+        'REFRTqME9ch5rs0c/Nkop5CBZZeZ+Wa+mW+W/2xZ8l2/D6BaAhfhe48/2EtyKrcV'
+        'yEvgPrzDMc5xHU9qldSXJeDHWMAXnGAGRxHv4Axb+JlgVKNiDfP4ik18xw+c4hea'
+        '6Mc0BvAtcEVeGqeJ3xE8wGF0a0fHT5iNvG1UugtqYwdvo0ANixjFBF7iKT6jhakY'
+        'pyjLV8McljGZxPLwj2MQKxhKpSkisYU1vIhi3dhVLK8RbDt4lMqYFukEgzrGMIIn'
+        'GMZqvLOQ+p/jKBLaF3gTnfbxIfR/hd1gW8l7XGoTG/iL53iNZ/jYPajsDmD32paC'
+        'QTvG3cV6dM9QZD0YNGLrnZD3snT6D7Zq6Y91A20pUBmGTJJhAAAAAElFTkSuQmCC'
+    ),
+    ('revert', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADAklEQVR42tXXX6hl'
+        'YxgG8N9a+5wZnGHOhMiVcjGYIqJcYETJydBM40Yp4UZuKENNUi5JTaTkQv6UC1Py'
+        'L5MrUUaDKTfyt6GoadRQhM45Zvbebp51+lots9exTw1ffa299/q+733e532f9/02'
+        '/7NRZZ4040628VNxwVoCGvQ0Ps7nfZjBgTxH0wKoe3o+wAu4BH+uJbUzPWP+Nt7D'
+        'QZwdQIOCmWaMizkVA6XxN/A99mAev2OI5TzLOYrxumd4Oxkojb+FL7Abd+TdVfg2'
+        'BkaF5wLuOxxpyXbUV1rl9334CE9jJ17GVtyJRawvDq7DwCw2Yilh21u8H00C0GR7'
+        'hXfwAV7H+fg0ydccsjVhmc/633BunmfgPCxk731hpRPEoAXglBg9EA/ms/mXwpNB'
+        '1i0G8F84jmN5tx7r8G5C8RQ+w+HsH/dRwTh0/oifWuzAVz2SewFf4iE8mzAebtWV'
+        'znA0IXish1QnFbjrcGHC8GqX8qoJ2v86HsyG4qtxdw6pW+uHUceLob7Zcws+wfN4'
+        'Eh+W+VBNSMw38Q0ezqZHcDFeCjPD1t4rsAP3Y3+RE9fiTFyDe7P3eJ+2W6UW7Mnv'
+        'u3P4icaV+LhQyCAAbsBrSdAVR+sTJGEztmMzHsSvOL3wbFDMOr8dTNZvyzmjSLgJ'
+        'y3zfZlSCuDXUP4qjHSW4KcPD0PtDakHJ5oasWbeabjguEuwefI654uCZ1qwS24uS'
+        'eGK0Su9Yxh99u2EJotHu9sKzY/+w/q6U4/0FyLlQP0y1XKkFfTXegFhMZZSsvj3U'
+        'NmMLzopUh2F4Lns341DOWlFBvYri0oCYzffLCkU0d4O9qYBHihvTjakn2/BKEdKp'
+        'r3ELeG7C2p04B0/g8a5r4MwUQEbpfDrq+ybchPdxW65yO1p3iKkB1NH3pYnnhiK+'
+        'p0UFD+Dy5MpSVyOqpwRQRQ3L8WwphWoLnknbvjntvLMLTsPAUVyfrG8azzhgDmFX'
+        '0bYntuB/y8Cm0N0cvoSfWwk7Ws0teS2v+73CO+3fq2pCD/nvj78B4dvBB9j0kH8A'
+        'AAAASUVORK5CYII='
+    ),
+    ('save', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABGklEQVR42pXTW0oD'
+        'QRAF0DNxTATB14f4wAfoAtyFC9CduY0swU3ohx+CoILiA0RR8xGSjD/V2hknPi40'
+        '01Tdqrl9q7vwhQKt2I9QGcdv+UbsxZqIMjpX2MZm7C9wi6WMu4ad4F/jEkWStIzD'
+        'SHYwFfFBLBHrBOcgapTxxzmc4xQL6GXnTuiFsmfMR81DmZnSxiJu0A/DklEtPOEN'
+        '68EdJQUJFYaZJ1XN9aRomE+gbJA6CCVbeMmmcYXX2ljHFORN37EbhRVOcNbELzP5'
+        '+VH66GI1Yt34dmq8RgV5s6MfcpoaTGMm86RuYic43xok4n0Y2J9wc9vB+axJV/kx'
+        'rvH+Hx5JgQ0co8jHN4uVaFBMKE65u5jU+Ez/iQI+APb6PkcxNIMIAAAAAElFTkSu'
+        'QmCC'
+    ),
+    ('save', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACeElEQVR42uWXPWtU'
+        'QRSGn7l73RDQrJJIUEEtU+gPEDur2AbBxsKfI1prI4iFMVhYqAT/gLWFVcBGAiqB'
+        'xJgrKlk3d2zekWGYmfuxKwgeuOy9M3M+5p1z3jkL00mh5/8Tt+vreuiLRBkZMzJm'
+        'gnELHHnOauCKvl97YwCDhH6t32wAvqMm+Z4YP+qDgJHzArgFnPUCKoDPwONgZ0UE'
+        'PQvcBs5ox279J+CJN2ZDAw76B8CqvkvvOIqOOeJ0Sr2vAvfD4y095zWwDFwGrmaM'
+        '2xZzjxLzb4DTwI5DIcyBYzpXA6wA52X0ALgIPIskV+wIbgIfgJHGtoEt4Id8JJPQ'
+        'nbcF9rV4HxgDXzog8BaogCFwSjZ829kqcDIPnAPe6XunQw68994vKZjWPOBkLOiN'
+        'B61tGYCvcwD86hNACKv1jDflgE3oJik1JkNgIeLUJvTC83U6C8BcnwB+ArsRxIyO'
+        'xwTOxh53+LIrWzNBYBnYBC5otwM9ViW7qTUhAsM+AcTK8yOwLkcj4Juekcaeak3R'
+        'NmGbqqDyAnBBrIs1N0QuVu93NFcEd0AlW50DmAeWguyupbMhxnyu+RvAC81NAp0l'
+        'YG8WCDiZSO8lsKYdh859nQo4nIYHYjKR41deLk2maa268ICT2mtK6wQpNfJA2YIH'
+        'Uv2AjVBvrLXL8kDZgMAosbtYEKmyG+UusjLD6aWS55pqfVG/VrDuASe0tsrMH+pa'
+        'N20CMGoo3S3mGtSxoHTZPCdYh17FpOYHCtDZMrmmtAJOqhvaytVvD1mR7SrWEzqW'
+        'q4C7wEPtYFZ/u2oR2z35+FM5qbv9uJJnlvI18z+i1wU1E94xmSr4G2L51+Q3iIWv'
+        'Q+yVThMAAAAASUVORK5CYII='
+    ),
+    ('script', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABJ0lEQVR42qXTu0pD'
+        'QRAG4O+cHCWiVioi2ohgFUWwE7Gy8RF8Jx/AB/A9LLS20EIlCGoh2HjBS9BIYjML'
+        'yyEJiNPMZXdm/n9ml79JMSrQwCaqsJP0494ZPlCilw7LrMgS9jCfxRuh13CIuUgu'
+        '8q7JmQ19gkvc4Rb36IZu4QGfKa+sQZ3AdEZjLOwprGASB2impKo2k35ATBy7oU/x'
+        'iO/wF3GDohox8VRkNYbXDv8xv1QOWVUPu0GphS0sx3lzVIESX9gJmB3M4Bj7GM9o'
+        'DUVQ4iXmsRB2KtyrP6ZqAO8xnEf37VhlE0f4qTetBvAvAmo74L7iORIbdbhVLbmD'
+        't2xdtwO20slp5AV+sB72U/YH0vtIf2ADF/lTTvIe++7UEvs1BNe4yuL/k1+nzEUj'
+        'y0+9rAAAAABJRU5ErkJggg=='
+    ),
+    ('script', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACY0lEQVR42s2XPWgV'
+        'QRDHf7fvnjEYgopJpaiNVfyA+B0CorY2FlaCCGmMNlZBQbFKY2dhF0Q7ESwEsbFS'
+        'E8U+EAXRTkERFGPiu0vO5j+wHHn39t5dPgaW27ud3Zn978x/52CdJSoYi7tcc1lt'
+        'XcVVRaAJXAIGAtfJ1FrAc+CjEEzLemoObQdu5xYvkoaeZ4D3wCEZj7uNiZ3aCcAo'
+        '0B84/zLwBHgJnAyJJVcA6WZNToA+9Zt65pvp7pLxq8BD4HgnJDoFSwpsEcRpQGsB'
+        'g8AHxdAUcEJjrlK0BkpDiAHMABeB+8ARpaYrk+sWeL+1sxD5BlwHTgE9mtsHPAaG'
+        'gAXFWRbigAXkDuB7B8NL0n8EPAM2eYjMA0+BbcDffOrXhYDpJm2cXaybbp3O1ODc'
+        'qrV+5hyycddNFhhU/R6kvnGfgCaA816gZbnWFWfbxB8KHnNqGdgtTrCzPwBMA3uK'
+        'Uq4qAmZ8VCTTlJN7Bf8scAe4Jr1GnbeWOTMA3ANuKqIBjgFf1L8BjAGHhY6r4oCf'
+        'BYnep4AHIpkejY8Ab9T/CoxLrzekLnCBPNCr/muxmqVcrCN46807rRsxqROBRTl0'
+        'V0Yntbt9+v5JuheAc4qDNOAaL3UXZDI2JlYDOArMeWPDupL/eelYKHFJHohErVf0'
+        'flbUa5uZyKVrVMcR+DxgO7UU+wy88opRl79s6kbAnFhS/9YKdeHqVK8F86MqC8QB'
+        '4/PacVwWXk8/KutApNRLRbl/QkrsAllo50Q7BxJgv6g1E9tVgfqgV6qtWM/npQX8'
+        'UkEaVTBu8L8A3m2EX7Y1+TktKvE3nvwHkNycDb1XQ1AAAAAASUVORK5CYII='
+    ),
+    ('search', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABDUlEQVR42p3SvS4E'
+        'cRQF8N9/loqGCI0QjY+NSi2h0HkGmpXwCryOUuENJIIoFFQSGqWNz0S/O5o7Mvln'
+        '1y43mUzmfpx7zrlD/yiGqaU+DQklJrCOqci/4RKfVU/jl+EmdvGKB7QDcBvvkS96'
+        'DSdM4jBA8mjiKMBSzqCBLraC7nUGnPARC2bxmFMo4z2DJ3QiV9ZqnahND3I6DTC6'
+        '56lS5NpBcSSTUMlcwEs/Bl2cYQPzmYQSS2HkFVLKDOwE+g7GI3+O5xiewypOcY8i'
+        'ZcPLcaI7jOIYa2GquP1F/Ueqy2jiJKi3sDiEwT8fK7FtE/uxtQKvP41ew3CAr9B9'
+        'g9uarKFiDHvhQeXJv6P4S/M3mTU3+o6eU3cAAAAASUVORK5CYII='
+    ),
+    ('search', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAC3UlEQVR42r3XSYgd'
+        'VRQG4K/qdWJ3g4kQkyhqJ5oYWxsNIoogWbiIEDcBwY3gRkQQnBYJcSmCBIeF3VkH'
+        'ggsRRRdK3EhUgktBXCTEMY7gEBJ1Yaux+2XzFxTF6/fqvR4uXKiqe89w/3POf24V'
+        'VmYUtQnd2lzVUaDTZ71Tc2pJBaOODhbyvB63YEvef8Np/Ndj74o4UGIRO/AUbsQf'
+        'mM/6BK7AV5jFtzWZZTtQneZpPIyj+Ay/YCx7/sfVuB2P4DXM9UKiHNH4K7gH+/AN'
+        'fsZm/J25GT9lbR/2RGZhQM4MNA5P4k3M4CZM95GZzp4ZvIUnGrqGinmBG/Aptkb5'
+        'dbX1slaKZQ3dqTixNbLX10u2GBL6WXyOH/E1zvbL8Nra9iTqFG7FM9Va2xxYwHiU'
+        'nIrx73LKhQFyJb6PzKnoGK/kypbwV/G8gHPYNATTVfuuxO/4MyGBsmzJdpLZ/2Ay'
+        'IRh2/BDZ+RphFeWQtFudaFQC6y4FbxuhXxO7eVwzgvFrIzsRqoZuGwcq+jyDDYHv'
+        'fKP7temU5yO7EV9UujtDlOFF3BHUqvK6kOduH7nF1P7OzA6OD5DreYoyij4YgYh2'
+        '4aoQ0fY6euUQDiyGeLppQJLV01lbrJVc9T6dmK/HERyr8Ue3LScX2TyJ5/Bv2utD'
+        '6Qk351tV25fHcBnSOYuXYviFJnOWLWLfxeP4GPvTjDbhMrweeKdCUJOZ5xKenXgf'
+        'J3GwF22P9TE+lr7+LA7jXjyAT3AiTm2LQ/fhrxBVdSHZiC/xYFAYRNt6OfZievpj'
+        'MT6e9yZ6HdwWR/ZiN9b1aOWt4l0Zn8OH6YB359t7ONTI+mVdSpe6dBzGR3gjJbcO'
+        '7+LlPrlTNuZIF0054Rm8mnvdBN6uGR/5StXG+IFk/aNJugLvNIwXq2X8rpTLttxk'
+        'NWBflZPXm8WWJN39+X58tU/eC4UdSb6TeL4FV6w4EkIgdzbQWbNRLuOnZUWRWDPj'
+        'lwDY+5/0jelCHgAAAABJRU5ErkJggg=='
+    ),
+    ('send', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABS0lEQVR42qXTvUtc'
+        'URAF8N97e/1CJRZGQUFWCVhYB2JhY9qANiIiiLX/gnX6/AP2lgFJl6QRG61SRQgW'
+        'fhJFEQQVN7rPIrPyWAJZk4HHhbkzZ847c27md+TIPC8K1P1vZKjgNToCtdW+O+zk'
+        'qGIKt0gtNKeonUI1oYYh7OO0RQaDGMavCvrRg0mM4nuI01aimyKXsBDTD7DfAOjD'
+        'J3RhJphclDbzgDEsYw9f8BJnKYRrQzs+B4O5KNwIgHd4hXUch24JRSrttIjkMT5g'
+        'FitxfxK5RtSDXdGsej1MVeBj/B6cl2oWsYkbdKS/OKvR2B3AdUxgBF9xlEoiJfRG'
+        'UVHa9zTGcRmm+4atEPswRbInJozhPkDb8RMDMW03ampx/wPzGV5gCVd/sPJ1rHMi'
+        '2FRiY9t4g7V/eT/vsRoMn5yWN31Z05nH9Bxv0dnofQQviko73Xb62AAAAABJRU5E'
+        'rkJggg=='
+    ),
+    ('send', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADHUlEQVR42u3WT4hW'
+        'VRgG8N935zYVNBamG020oJSKIsikSPpDRSa0KWghZQQtgnZtqkW0DIkIWrSJSIok'
+        'IiwqCFKJKIbKkCIiK7DCRUxN2R809fu+afPc4cz1m+kbGacWHTjcc++5533e93mf'
+        '857D/+1fbp1iXC8ydvc/xcBp2IrlmGoxs5Ctsf0TtuN4lYmleBzVKQRvAq6CtbSc'
+        'WIWdi8j8zmBOC+8wLscGfITRfO8vEGDD7FGsD9bh8odl2I8P8EjxfWQBwEsbD2M8'
+        'WMsaz+BMfI3NuBhvYzV6MdA5yXyPxMYqvInLgvFNMKcd6GMMv+F57MMO3BcDU/Nk'
+        'YyRrerHxCj7Hc/gFZ7XTuxK74/UGnI41YWIHzikMd4aIWta8iHdwfmxelX92B3Oa'
+        'gWbxVLxbge9C1z7swm0FG9UsQmuivhV78EXGB2JzrF1n6jnKZKPcbXgXz2ATHsKx'
+        'rO0VzHRT0J7EFbgfn7bSMdDrskrB7wHop9dh4bpsnfeSpm7WTGW8PnM93BDwurBz'
+        'NLZLrBka2JPxpuS/LNWlozdhLx5LusYy/gQ3DwiuSl8T24K1sp2CNgNl6xcC24Xr'
+        '8QRez/xXuBF/5J9+ofLmeXwQA/U8D5JuAP7Egzg3c5OFFnotUa8NUweikRkOVANO'
+        'xiVFKR7UegUbk+nN9uwNSMHyaGNFnlXhyEAR/owjQ7DRONIpHKpn6fuzi65NSr5v'
+        'Aq5PgoF23ZjtdtMtcj+OZ/EG7sa9OGM2DXQGsDLX5WIKj2Jdq0h14sRq/IgvcU9K'
+        '/dbsmpFBu+DXLCzrdRXKq0IHo1E93IGnMVFUxFK43+b7eKJ/CVuwt26JpsYFoec8'
+        'HCrq+gTOTmSTuAgvBGAip92hf0hbjY9xJ97CLXVB15EYe3XIbfl+y/ljQ25lceBD'
+        'THSKC8lnRTUc9nL5Fx6IsYOpD1Vry8rp93Let+ES3I5eWWqvzEVxPrfibpxel5R1'
+        'WuW7h2twaXTyFC4M+AmKP1VtI+7CDzmkNrdEOiOPI/Ps1RxrR/O8OvrYXhzxixH4'
+        '9M1oI16b5WRdlLakqP0nRP43vabKhrXiEvsAAAAASUVORK5CYII='
+    ),
+    ('start', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABL0lEQVR42qXTuy5F'
+        'URAG4G/vczjhEJeCUiQuUUgURK3WaDwEEYXEi+g8gQStR1BQUUkOIkoFcb/fmtmy'
+        'bU7kxCQra82af2bNzD+L75LEqic/7Enh/BHnMQygJfQHHGGviE0KF72YxQ1OcB62'
+        'bvSjHRs4KwZJ0INlTASwgjJSNMfdRGB68uWkseYxjmroRUnDNo65zK8UaYyiC7u4'
+        'xTsWog8Hoad4xmOU84az7KVBHOMu9+IzrrCIyXD4wH00dEgu1VZc4iXHxCu2sIo+'
+        'LKENTxG4VZ1aG5Jy7PfoRFMuizKmMYxtrAe2go7w+cqgFg2r5oI3B3AFOygFbdXA'
+        '1vL0pEFNIzQmGY2ZnGImmLguzH1TjPUIprCWlfDXKF+EPRvlNmzmR7mRz3SI/V+w'
+        '//vOn1U8RdbwFEvHAAAAAElFTkSuQmCC'
+    ),
+    ('start', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADcUlEQVR42sWXS2xM'
+        'YRTHf/dOqVYfaEpoaVQbi9b0JaHalQliVYnY6Y6F2khsLDTBQluxsbIQq2LBgoSN'
+        'hLDwKhEkXSmLeqR0IS3GIzEzNv+vOb29c2dabXzJzdy53zn/8z7f+TzmtjzzAGTM'
+        's2DLAwqM0LnSzGDIh8YHUubbKqAGKNf/SWAU+GxoYkA6l1dyKeALBGAtsB/YIr6f'
+        'wA/tFQNFEjYEDAIfQjBmtWIGfAB4CBwHmoDV2lusB31rAnpF2y9eixVqYTbhKaAF'
+        'uC9LE8AV4B0QBxqAVtE0AJu0d1m0v4B72k9FKZHN8gQwDGxTzOv1XhdilXuvE029'
+        'eDqEkcjliaBH2sQYBwplRTyiHIMrLp5ChWVY/6O8PpXtJcAzuRfgUEBBT5Z4ERgE'
+        'eNuEWWIwZlSBi/uAYn4RqAReRJRULFCeYaXbCowDB4AlwLEwPqdINfBE7+uUWF7A'
+        'sjhwBigzXvEjwhMXFsBjoMrKdElRIAsPA6+BMWAF8FLgGfO7ETgNdArklb4XhHjI'
+        'Bz4pOZcCi6TQAyNzmgduqaRKlck2Xk7Z3cB5gd4AbgKNIRVhQ1EvzEbRT8l0AjIq'
+        'm4zi1Q6MZIl7Ru5/A+wBrgIXgD5lfcokaUYYIypP16pXas+zFtYASeCL2qgfUa5p'
+        '7Req7e5SK74L7JMSmUAoPgo7KVkEFShX9peqXNI5zoq0sfYrcESZ3q3QVJuSTast'
+        'l+oMWWYV+K/LZu6ktPwmN+U6xXxZ91s5cQrYDJwDrhm6lGiTwi4CJlw++UaBUZVK'
+        'hdyXS3hawruB23JtQsKDnTKt47xCMkadAs4DnsnQSjWMeuBtyKjlKeZ1wFkJO6h+'
+        'H+yOrhltAB6pIblK85wCjumPiLpUWmUm260CSWAvsF5H76AJZyrQYj1hlAmjSzKs'
+        'zGmNqErWu1Ycz9KKB+a7Fbv3Sbm+E3iushnTnvPCZ+CO4p/tkPJMnlQB34GjwHvg'
+        'uuHL6zju+YfjuMccx0+VgH5Uf3HMLUqqpiwDibcQA0m2kazDjGTteYxk7WYk6xTG'
+        '9nxHsiBgs8bsE2ogtcByYKdOtq16GoEd2qsV7UnNFs2zFR42lvdr1O4V4JosY3mz'
+        'Gcv7pEik8NlcTKrNxSSmg8teTIrVA4aAS/leTObrajah9jo+26vZXC6nfg6Pzfvl'
+        'dEGv538Bt5TWT+UNZMIAAAAASUVORK5CYII='
+    ),
+    ('update', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABdklEQVR42p3Tu2uU'
+        'URAF8N/uRkETV4wiKCJaKL6iMRIQgr2QQmKhCOKjsPBRCP4pKS0DqRe0EA2WSoQE'
+        'FDGIRUAbYcVHxFioic25cN2QxoHLd4fhOzPnzLn8G42c9WJNvdFzX819GIexOfkP'
+        'vMGr5E2s1ADl5524jCXM5dtAGyPoxzS6BahVgezAbTzGLI7iIPZgI2bwHRP4het4'
+        '1so4cBNP8A0X8BbP8S5UJvAS73EuILOF/3FcwQDuVdzr2IC7mRQuYqAvyUkM4g4e'
+        'YBl9+B2KTezCPhzANuzHSi3i1ii71NO5KD4SXbrR5CdmCsAododXG1/xqGe1Jdpo'
+        '4YtKwDEs4gNOpVhvqFA9hlu4hqs1QDcmWcQnvMCfYpZo0Y+zmMRnzEsXOINxfMRr'
+        '3AjAMjbhBM6jg71xaacYCU7HqsOZ4CkOYShmauJhNjGO+xFxzcPZjkspzsd5sCXa'
+        'tDEVyg2s1gCtjC2dj8RY5TEtxInW2c7/Pee/VCFS9vXHKCQAAAAASUVORK5CYII='
+    ),
+    ('update', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAD3UlEQVR42r3XWYiV'
+        'ZRgH8N85Z0rLcrRcM5cQE62BsEUzR6GFjBoCb6OrEOuqgiLbINtogajuIipovamo'
+        'oDQs2qTFpQKhi0LIyMxWU5xcZuZ08//i65vjzBnFHvjgnPd53mff3pojg1rpg2bp'
+        'O2ZQQ0dJaCuot0EziGk7NHX0l86mYgY6MYA9+B6/lGgawTWPRoF6mMB0XINFOJTv'
+        '7+BOwPHh9zlexM4WPEakQCNWn4h7sATv4w2MwwbMDI/twf+Fq7EMH+E+HCjxGqRQ'
+        'fRjhC/BxLF2OTdgWQaOxAz9iFP7Ed/gCPXH9h+gKr0ZJeN0wlsOl2IoLYt3sxLyA'
+        '+bG0O78L6AztEizEltAU0I01hayOFjHvx7l4HLdgV3DbMQ13xjN7497+5EAnvsy9'
+        'bejLvbvwJFakQtbh9VYRKLL9pDBagIlYGvwqbMTqVEAVZuKO3F2Vs2Xh0YVvI/xu'
+        'PBX8ca1c/wgejqum5OwBrMXkFuFqVM6m4gM8lP+TcRluiFHn4ZWqAkU1nIbNSaoz'
+        'QrAymhdwuEZTNKpCsQ3xRA1zS3RX4oWqAsXF1dG8J+U3MVk9YZiqqXqlllL9Gmfm'
+        'fHRwV5QVKBj2l2L2arTvxc35/1uUHGhDgWImzEyzKry1P3IOlLtj4c4mxiYEj2Jf'
+        'OtvExK9WacXDdc5uvIwb8Ue6aMFjerwxqBM2cDLGlJTamz4/krlyKp6N8rtSVc2S'
+        'p0dhPR4shb6t0VtvU5F26Y4I6iOkrbVjXRG3s9Ig9pUE1YI7lNjdjreHm3AVGJvQ'
+        'FmHdl9D2V2t6BnandjtCMJDfr2USrmtTeDkf1uNXHEx+nZI5sbegKzrZcjxXYTQq'
+        'CbVmBAtMua/clmSD8Tgf75R5dbS4WE+Z9GJSpmJXZVgNF/u+VMEKXJWm1o2LMqIL'
+        'w/uqHnipxGhuFFqJT0p07bTiGt7FdWm3szIxN2dW/OuBeoVBb35fgjmJ19P4FO/l'
+        'cl+prhsloc3gpmRwbcQzyYMZuDc8duZeszoFL88u9xh+x7yEoBjH1+Or7AOzWnhg'
+        'VsbxxnhN7k7IBNySUPynPGul9WthFspb8Raez063tbT3TcNNGat74rFmsntsXPwE'
+        'fsosaOLsjPhrY8CgKirCsDgCC7gwCi1KAlVXsnk5XzbESrYoBlxc8faQpVMrEc7P'
+        'dnt/xmtPymlBBI3JNy5n40PTmTubcM5QwstJ2FfqVsUW+02mYR/ejEVzklgHcXrC'
+        'sj8JOzs0a2PQ0uwEjcOV70geJpPzMFkcJVs9TDrwWZJ5x9E+TIZ6mk1KknUGtxs/'
+        '4OeRPs2O5HFa/78fp8f0ef4PXFnjavTkcwgAAAAASUVORK5CYII='
+    ),
+    ('upgrade', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABVUlEQVR42qXTT0uU'
+        'URQG8N/7TpMziYYTWG0KNZUWQiO4aClI67B96/Z9oNYt2gt+AcGNuEt0oS5ClKaM'
+        'tCC1zTNxHRUXHThwec5zzz1/nstlq+I32ZV4NXC+yPkFpnAv+Am2sTHIrQaAR1jG'
+        'MfbQS3wMTzGCTzgYTFJhHO/RxTCGiuqGgnXDGS/bqePvQmjhTi6+ikMzsflwa9SN'
+        'lDGHDtbwC2dYxOO8/AA74f7EJM5xUCf7dIbUv9wNthqfDnYWzjZmFKW28RV/0MBS'
+        'BvY28RHcx2Y4PTwrE/TtIqV9wAJGgx9jPRXUxbr1WzjNDJqZ7FFKP4+vBqvC6UQb'
+        '/xJsRTitYj1tzMbbBd5K+VvSb41DvEzWXl79jW/4jP3w7ibhBFZQNYr+9/A6a/oe'
+        '7EtU14yYnme9H8O7IuWHeIMf2C2k3MGT66R822caDnYSIW1cw/2/7/wX5fJTwduH'
+        'iCIAAAAASUVORK5CYII='
+    ),
+    ('upgrade', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAADm0lEQVR42s3XS2hd'
+        'VRQG4O/evJSaW6OotKBJqrbY1lfbtLbBWa2BoqAiThxIQXCk83bgAxULgnTqMDpQ'
+        'VJAqHdRqFRStAQeiA0FbH/ioD0wUX2ASJ/8pu8d7k5u0ggcWd9+z117rP2v/e621'
+        'G5b3NAqB+UKWbKjbp1lzthAwmDtbABpxPlu8W40RtPL/F3yObwqdnoCYPxMAzeJL'
+        'RnAXxjCA6QicjyH8iSk8hy/a2FgSgJ589XnYh614LfJZnA9G99eAuAI7cRPex6P4'
+        'rbDV9dOT3y14Ew/G2TBW4Basx8bI+rxbEZ1BPJS1m2oc6ppsEziGHbgkWzCONQus'
+        'XROdkawZTyQmugVRKYzhPVyDc3A11nVge7v/67JmANcGxJbFQFRsX4m3AgJuqwFs'
+        'FEYuirSbK9dui81WofcvElZsfRy/YzLE+qh2/iu9IRzM3K34uZgrI7IxhL0nEdnX'
+        'jpQV6mG8gV5cjLU1oNVvPw7j3sjhvGunuza2+nAUl5U+ewrledyH4/g+JPowivOF'
+        'wT68EI48hQ9CugfwUhGBKlo/YkNOSH/G7xQ6p6F9McdmIIwuc34zMoknot8bkXeT'
+        'hV659vLY3Bzwp21/Ff5VeCX7vrtDOA/g6YzvyNdsyFjmDnRYuzu8eTXRPeW7ArAj'
+        'XyCJpVEDuDd7DXeHRGOR2bwTnb21tY3YhGfiC5q9haOVmEkEGrV9l6S0HU/iShwq'
+        'HBzCnbgOf0VXjV+N2J6OL2h0kx7n4uh17MdV2INPQqr+jPdkbn90FypCp8jXW/yZ'
+        'CbLplNuSpRWItwt+tAoHLfxUzJXO5wtb04nCTDVXRuAELghRRttswVyN4XO1ufKk'
+        'zLXZgtHC/vF69mvg29TzURwpik4dRBnCZq1T0sa5HMPK5h84WX1Ebw3lFHYlFbeC'
+        'tFnraqrxbNGQzNb3trA7hwuTwHalMKknojIVH10gFZfjZ3NsJzPupFel4v7YvrRd'
+        'Kq7S5nRK6Q34ON3QDx0Mnyy27iC+qiWfSlbjb9yPr/Fy0S+2LcetlM6tC5TjxUp6'
+        '9dye3+2xObiYjWbRih1LMzHQoSHpyb72ZdypIbk+tjYvtSuaCGHGl9GSDWfNjSH2'
+        'zcvtCzelsXw4W9NtU9rCI900pd205SvSxWzLWT6CT9MBlW35UGrEzsi7eCxHumNb'
+        'vpSLyXBxMTk3AGaKQjYUZ1N4Hl+e6cVkoavZqnBiZVFHTuC7s301+19cTv/T6/k/'
+        'DdXcF7/bHV4AAAAASUVORK5CYII='
+    ),
+    ('upload', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABBUlEQVR42pXSPU7D'
+        'QBAF4M+JSRARSDQICn46KsQhKDgDDefhUJyBFNAhKv6DQAJCiqAkNOOwOLEjRlpp'
+        'Zjzv7dt5bvqNDM0kL0dWmqmNYvAsTrOC9M+HXRwiRx+nGOAdB7jCXuSinxUEGzjB'
+        'Y4D6uIuhe3QxxDpWcYQbDIr3bIWai6hf8Yl9tHGJb6zgAR184K0RgDFaWEMvWdg4'
+        'TlH3YqYVfY1kHxOMSvW8fJTWeY1tZeA8p6YEVbG0yO98wU23NdhJlYJJQnhd0Z9R'
+        'kEpeTnaSlRS2y88qCAo3nuNnGVbIbsXMFJPHLS/YwfGCzReqtnGOLLWvg80gqLM1'
+        'wxO+Zjz9Z2TwAwpfOI+bYFAVAAAAAElFTkSuQmCC'
+    ),
+    ('upload', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAACQUlEQVR42s2Xz2oU'
+        'QRDGfz072bigScCgYvAmkjfw7ilX74Jn8wbxATzo2YB/QAQPIvgMIujVcxBPioni'
+        'hiQrGlfdaS9fSzHp2Zmdaf8UDD0zXVVd/VX1NzWQRhx/WVyqILKOiz8GnqRGwgE9'
+        'IDeXM3Mh6DvANvAeuGs2ZHWtj14sQDdjYF73T4FXwIHenQAuApcjuo3hDEYZcAU4'
+        'a54fAh+AAfAA2AWuAddlewPYBE4BV4FD4IzuC/neBh6ZZ1+ugQDvJrBmIAywFsAi'
+        '8FyLZ6VaWgeeSacw/kIK14DbpTQdQeI08LIBcnMaN3TZd9Pkhdb4vWYecfxFk6vA'
+        'Oem8AV6b6GP59So0LwQuAOeBn8A7YAv4Wg40jzjJNO5JeR/4bOaLiF2QiUHzE/AN'
+        'WJIv67sRDwyAFeCtHNCwsoPOnmxXgGNtiOi7jplrSVghXQfAjyqlfIYdzSre2Po2'
+        'CPSBhQ4UG2wWgPk2ARwCww4oBJuhfP1TBPopv4ZJJa85BaOaFPgGKRjJ18wIDIDl'
+        'mhTMTaHgYLMsX0kRmGi8H3kXQ2DchQemwbvTlS+6ngJXM1fLA3kDHsgq6NhHGhoi'
+        '/cVUHshrEAjNRROarkrBIvBx1gBCNzQGLulzfFKjF6y76gWdCq1qfqyT4poE4FTN'
+        '3jScE52IoanmecHaNyemar6nAH2pXzgSQNjJkrqhLe0ilazK98gGkZc6oRFwE7in'
+        'HaSi6kJkdEtrZKG2qo7QcRVPStlXv/lHftda804diaQWz/8mvwBG15FKNWNBbwAA'
+        'AABJRU5ErkJggg=='
+    ),
+    ('windows', 16): (
+        'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAABbElEQVR42qXTT0tV'
+        'URQF8N997/nUR1oiFUUhIv0hUudCg5pFTQK/QhO/U/OGNpKmjQQljYhoUDSI0KjM'
+        'MC1vvtdkHbi8Bg3acLnn7LP2WvvsxeE/oxpad3ALl5PbxzN8zXkLg6z7GLQDbCdx'
+        'BzfwBK/QwwM8x0kpykcUNRIXo7ib/XZyyziLN/iOq/iBx4WgjxGMNYor3Az5b6xh'
+        'PF3tBa8T4AAzOBXFFj5iKsUt7KQQbuPbMMEgs7iOhXR1Bu/wCXVU64i9FObS7nim'
+        'XYesh6eYwLngakzjNL6gKtb0sYItrGMU9zOwXSwG8wuTeIFNtErxRNjf51o/o9DG'
+        'XRyly7F0ulPcKy5cwmEU6+TOx6ptbORKFe5luB9QFYI5HGAWn3EccDed7OcvQm+L'
+        '/YXgQq7RwTyuRLkbO/uZVS+Yw+JeIXgUUIleJv0QrxtnC+mmOHgy/JjKYykF17DU'
+        'cKqL1ThTNd/Ev2I00/8r/gDhkmIZ9XqnQgAAAABJRU5ErkJggg=='
+    ),
+    ('windows', 32): (
+        'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAEKklEQVR42r3XW4hW'
+        'VRgG4Of/Z9RRO6mUpE5qWVqZqeTYgciEJDDKioq6CboIuuoiLKjbDnS6KEgyqIsg'
+        'O0Hnw1VoCJVkqaVGloVmKVpRmlk6808375bl7h/NtDYM/561117rW+/7fu/37YZ/'
+        'fjXRyH0/Wv6nq6PYuN2z5pEs3jiMuZMxLvfbsR59BTqtoxlAIzB34FZchT3YnfHh'
+        'OA5rsBgbineOytWZ34V4F1PbQD0R92A1bkoAjUPQ0jgEpQcIDt7AGbgGI/JyZ23u'
+        'XXgk9121Nar5nQMF1RwgyhZG5cVfsBY7M95boNSBc/BW7pfh0QTdikZ689fCibgF'
+        'J1d7dR6E/3OxIy+fGp6bedbI+PAstgKXZP46PIw/8A12YXDWGIvp+ABbBwqgUnRP'
+        'lD4CK/Os1SbIXRHoPLyNF/FaNpyOkRHvc/gOD2BjtV67AColT8OT2WxYzYSqIC+K'
+        'CEWoz+I8/JCgV9bWvgI/YV8o62u2gb8PQ3PybZiCzUVgZdAzsDRUDM7Ge/FVTYRd'
+        'uT8/qbvfApoD+MKU8LkBv2IMjk8QlaiOxWh8GP63RLCtQsiVCPfm/kx8VNLZeRD+'
+        '52BJkBiSRXbjc7wQI9qZ8blYjtMDb0lTFcxIHJOMMpBpVYjMjrmMrj2fhNvxemBe'
+        'mPF3IsixSbUSzWrNuXi+nv51BCqVr4iyr82mg0PJJ1iEx3A5VuGULLgmOf5K+C73'
+        '6I0419ZrR+cAGlgSzpdl071BY0FOvQ534rfopRu34enMLa+qYPUkq8qDHuDJVVST'
+        '8TjmJxt21RY8AfdiPK4Ml93J7258FjR2BIluXBhqFhTr9atBVbnc/IKGefgySDVC'
+        'xe78jgr3cyPGZ/Bm5k7FzBSsPRl/MIgdsgI+gevj8aNqSFWVbDFuzNjKBLsIlwah'
+        '8hqEs3BSUTG1E2FfUJiQ6laduC7Sas574X8LrsPVuDlZMixrt+Ijs/FQqO0sCtr+'
+        'ACpvn5jfbbgs5bhuv1Wl244b8ClOi8JfyomPi3f040c8Ff9Q75w6C/77cEEqWH+4'
+        'r3TRX0DXkzmNpNbLccDhoWhf/F7RI4wrLLj/YP3A7Fjr2VFtq1YDGvHz5Rkfh48x'
+        'C9/nEI1a5zMtIv25ONDfAqhgGRtuV8fpxhRC/DMvT8D7oWJnTv9FTt4oEKtOO6Mo'
+        'v812yq+4nRA7vT+mMyjPevF7eoNVGduaRnV9Np2Er2snrCibmUO19f8yC4ZGKEtD'
+        'w6ZA2hWRXYy706RWdL2anF/VZoPe0DCm6BmOuGtuRt1doWFIOB5f1P6yER2fgAfs'
+        'hJtt/q9PbhTjrWhBuF8cxW8qan/ZiPaErr6BuuLGYSJQtmUduCMGtDm0fZsgRyST'
+        '5uC++ElHUZj+dQDtrqGx4FkpPIOCytrQtPG//nA9ou/Po4FAo/bpXnbXh/yM/wvk'
+        'nB9PYctruwAAAABJRU5ErkJggg=='
+    ),
+}
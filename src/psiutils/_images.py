@@ -0,0 +1,67 @@
+"""A process-wide cache of the images shown by psiutils widgets."""
+from pathlib import Path
+import tkinter as tk
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+ICON_DIR = Path(__file__).parent / 'icons'
+ICON_SIZE = (16, 16)
+HIDPI_SCALE = 2
+HIDPI_SCALING = HIDPI_SCALE * 96 / 72  # tk scaling on a 2x display
+
+# Image key -> image. Holding the images here also keeps them alive:
+# Tk blanks an image once Python drops it.
+_images: dict[tuple, tk.PhotoImage] = {}
+
+
+def photo_image(
+        master: tk.Misc,
+        path: str | Path,
+        size: tuple[int, int] = None) -> 'ImageTk.PhotoImage':
+    """
+    Return the image in the file at path, resized to size.
+
+    Each (path, size) is decoded once per Tk interpreter and the same
+    PhotoImage is returned to every widget that asks for it.
+    """
+    key = (str(path), size, master.tk)
+    image = _images.get(key)
+    if image is None:
+        from PIL import Image, ImageTk
+        with Image.open(path) as source:
+            if size:
+                source = source.resize(size, Image.LANCZOS)
+            image = ImageTk.PhotoImage(source, master=master)
+        _images[key] = image
+    return image
+
+
+def icon_image(
+        master: tk.Misc,
+        icon: str,
+        size: tuple[int, int] = ICON_SIZE) -> tk.PhotoImage:
+    """
+    Return one of the psiutils icons, e.g. 'save', at size.
+
+    The icons are pre-rendered (see _build_icons) at the sizes psiutils
+    uses and at twice those sizes, used on HiDPI displays, and load
+    without Pillow. Other sizes are resized from the icon file.
+    """
+    scale = HIDPI_SCALE if _hidpi(master) else 1
+    key = (icon, size, scale, master.tk)
+    image = _images.get(key)
+    if image is None:
+        from psiutils._icon_atlas import ICONS
+        width, height = size
+        data = ICONS.get((icon, width * scale)) if width == height else None
+        if data is None:
+            return photo_image(master, ICON_DIR / f'{icon}.png', size)
+        image = tk.PhotoImage(master=master, data=data)
+        _images[key] = image
+    return image
+
+
+def _hidpi(master: tk.Misc) -> bool:
+    return float(master.tk.call('tk', 'scaling')) >= HIDPI_SCALING
@@ -0,0 +1,110 @@
+"""A line number -> byte offset index of a memory-mapped file."""
+import mmap
+import os
+import threading
+from array import array
+from itertools import accumulate, islice
+from pathlib import Path
+
+CHUNK_BYTES = 1 << 22
+
+# numpy, imported when a file is first scanned: it is slow to import.
+# None if it is not installed (it is optional: see the columnar extra).
+_NOT_IMPORTED = object()
+np = _NOT_IMPORTED
+
+
+class LineIndex():
+    """
+    Index the lines of a file for random access.
+
+    The file is memory-mapped and `starts` holds the byte offset of the
+    start of each line, so finding a line is an array lookup. build
+    scans the file a chunk at a time; start runs it in a worker thread,
+    and the lines indexed so far can be read while it runs.
+    """
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._map = b''
+        if self.size:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.starts = array('q', [0])
+        self.scanned = 0
+        self.done = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        """Return the number of complete lines indexed."""
+        if not self.done:
+            return len(self.starts) - 1
+        # No line starts at the end of the file
+        return len(self.starts) - (self.starts[-1] == self.size)
+
+    def estimate(self) -> int:
+        """Return the number of lines, estimated until build is done."""
+        if self.done or not self.scanned:
+            return len(self)
+        return round(len(self) * self.size / self.scanned)
+
+    def start(self) -> None:
+        """Build the index in a worker thread."""
+        self._thread = threading.Thread(target=self.build, daemon=True)
+        self._thread.start()
+
+    def build(self) -> None:
+        position = self.scanned
+        while position < self.size:
+            if self._stop.is_set():
+                return
+            end = min(position + CHUNK_BYTES, self.size)
+            self._scan(position, end)
+            position = self.scanned = end
+        self.done = True
+
+    def _scan(self, start: int, end: int) -> None:
+        """Add the starts of the lines following newlines in start:end."""
+        np = _numpy()
+        if np is not None:
+            chunk = np.frombuffer(self._map, np.uint8, end - start, start)
+            starts = np.flatnonzero(chunk == ord('\n')) + (start + 1)
+            del chunk  # release the map
+            self.starts.frombytes(starts.astype(np.int64).tobytes())
+            return
+        lengths = map(len, self._map[start:end].split(b'\n')[:-1])
+        self.starts.extend(islice(
+            accumulate((length + 1 for length in lengths), initial=start),
+            1, None))
+
+    def text(self, first: int, count: int, encoding: str = 'utf-8') -> str:
+        """Return count lines from line first, joined by newlines."""
+        last = min(first + count, len(self))
+        if last <= first:
+            return ''
+        end = self.starts[last] - 1 if last < len(self.starts) else self.size
+        data = self._map[self.starts[first]:end]
+        text = data.decode(encoding, errors='replace').replace('\r\n', '\n')
+        return text[:-1] if text.endswith('\r') else text
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.size:
+            self._map.close()
+        self._file.close()
+
+
+def _numpy() -> object:
+    """Return the numpy module, importing it on first use."""
+    global np
+    if np is _NOT_IMPORTED:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+    return np
@@ -0,0 +1,243 @@
+"""Python-side row storage for psiutils Treeviews."""
+from psiutils._column_types import SAMPLE_SIZE, sort_keys, typed_keys
+
+
+class RowModel():
+    """
+    Hold the rows of a Treeview in Python.
+
+    `rows` keeps the rows in the order they were supplied and is never
+    reordered, so an index into it (a row id) identifies a row for as
+    long as the model is loaded. `order` holds the row ids in display
+    order, without the rows hidden by filter.
+    """
+    def __init__(self, rows: list[tuple] = None) -> None:
+        self.rows: list[tuple] = []
+        self.order: list[int] = []
+        # Column types are kept across loads: see sort_keys
+        self.column_types: dict[int, str] = {}
+        self._indexes: dict[int, dict[str, list[int]]] = {}
+        self._positions: list[int] | None = None
+        self._mask = None
+        self._clear_sort()
+        if rows:
+            self.load(rows)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def load(self, rows: list[tuple]) -> None:
+        self.rows = [tuple(row) for row in rows]
+        self.order = list(range(len(self.rows)))
+        self._mask = None
+        self._clear_sort()
+        for column in list(self._indexes):
+            self._build_index(column)
+
+    def extend(self, rows: list[tuple], mask: list[bool] = None) -> None:
+        """
+        Add rows, keeping the sort and the filter. mask holds one bool
+        per new row, whether the filter shows it; by default the new
+        rows are shown.
+        """
+        start = len(self.rows)
+        self.rows.extend(tuple(row) for row in rows)
+        new_ids = range(start, len(self.rows))
+        if mask is not None:
+            if len(mask) != len(new_ids):
+                raise ValueError('The mask must have one value per new row')
+            if self._mask is None:
+                self._mask = [True] * start
+            self._mask.extend(bool(value) for value in mask)
+        elif self._mask is not None:
+            self._mask.extend([True] * len(new_ids))
+        for column, index in self._indexes.items():
+            for row_id in new_ids:
+                key = str(_cell(self.rows[row_id], column))
+                index.setdefault(key, []).append(row_id)
+
+        # Only the keys of the new rows are computed, unless the type
+        # of the column no longer fits or was inferred from a sample
+        # smaller than the one load would use
+        for column, keys in list(self._keys.items()):
+            new_keys = None
+            if start >= SAMPLE_SIZE:
+                new_keys = typed_keys(
+                    [_cell(self.rows[row_id], column) for row_id in new_ids],
+                    self.column_types[column])
+            if new_keys is None:
+                del self._keys[column]
+                del self.column_types[column]
+            else:
+                keys.extend(new_keys)
+
+        ascending = self._ascending.get(self.sort_column)
+        self._ascending = {}
+        if self.sort_column is None:
+            shown = self._mask
+            self.order.extend(
+                row_id for row_id in new_ids if shown is None or shown[row_id])
+            self._positions = None
+            return
+        if self.sort_column in self._keys:
+            # The old rows are in order already, so the sort is a merge
+            keys = self._keys[self.sort_column]
+            ascending = [*ascending, *new_ids]
+        else:
+            keys = self.sort_keys(self.sort_column)
+            ascending = range(len(self.rows))
+        self._ascending[self.sort_column] = sorted(
+            ascending, key=keys.__getitem__)
+        self._apply()
+
+    def _clear_sort(self) -> None:
+        self._keys: dict[int, list] = {}
+        self._ascending: dict[int, list[int]] = {}
+        self.sort_column: int | None = None
+        self.sort_reverse = False
+        self._positions = None
+
+    def add_index(self, column: int) -> None:
+        """Keep a value -> row ids index of column, rebuilt on load."""
+        self._build_index(column)
+
+    def _build_index(self, column: int) -> None:
+        index: dict[str, list[int]] = {}
+        for row_id, row in enumerate(self.rows):
+            index.setdefault(str(_cell(row, column)), []).append(row_id)
+        self._indexes[column] = index
+
+    def row_ids(self) -> range:
+        """Return the ids of all the rows, including those hidden by filter."""
+        return range(len(self.rows))
+
+    def row(self, position: int) -> tuple:
+        """Return the row displayed at position."""
+        return self.rows[self.order[position]]
+
+    def row_id(self, position: int) -> int:
+        """Return the row id of the row displayed at position."""
+        return self.order[position]
+
+    def window(self, start: int, count: int) -> list[tuple]:
+        """Return count rows in display order, starting at start."""
+        rows = self.rows
+        return [rows[row_id] for row_id in self.order[start:start+count]]
+
+    def position(self, row_id: int) -> int | None:
+        """Return the display position of row_id, None if filtered out."""
+        if self._positions is None:
+            positions = [None] * len(self.rows)
+            for position, order_id in enumerate(self.order):
+                positions[order_id] = position
+            self._positions = positions
+        return self._positions[row_id]
+
+    def values(self, row_ids) -> list[tuple]:
+        """
+        Return the rows with the given ids, in display order.
+
+        Rows hidden by filter follow, in row id order.
+        """
+        hidden = len(self.rows)
+
+        def display_order(row_id: int) -> tuple[int, int]:
+            position = self.position(row_id)
+            return (hidden if position is None else position, row_id)
+
+        rows = self.rows
+        return [rows[row_id] for row_id in sorted(row_ids, key=display_order)]
+
+    def lookup(self, column: int, values: list) -> list[int]:
+        """
+        Return the ids of the rows whose value in column is in values.
+
+        Values are compared as strings, as they are shown in the
+        widget. Indexed columns (see add_index) are looked up in O(1)
+        per value; others are scanned once.
+        """
+        keys = {str(value) for value in values}
+        index = self._indexes.get(column)
+        if index is None:
+            return [
+                row_id for row_id, row in enumerate(self.rows)
+                if str(_cell(row, column)) in keys
+            ]
+        row_ids = []
+        for key in keys:
+            row_ids.extend(index.get(key, []))
+        return row_ids
+
+    def find(self, column: int, value: object) -> int | None:
+        """Return the display position of the first row matching value."""
+        positions = [
+            position for position in map(
+                self.position, self.lookup(column, [value]))
+            if position is not None
+        ]
+        return min(positions, default=None)
+
+    def sort_keys(self, column: int) -> list:
+        """Return the typed sort key of each row id in column (cached)."""
+        if column not in self._keys:
+            kind, keys = sort_keys(
+                [_cell(row, column) for row in self.rows],
+                self.column_types.get(column, ''))
+            self.column_types[column] = kind
+            self._keys[column] = keys
+        return self._keys[column]
+
+    def sort(self, column: int, reverse: bool = False) -> None:
+        """
+        Sort the display order on column.
+
+        The ascending order of each column is cached, so sorting on a
+        column a second time costs a list copy and reversing the current
+        sort costs a list reverse.
+        """
+        if column == self.sort_column:
+            if reverse != self.sort_reverse:
+                self.order.reverse()
+                self.sort_reverse = reverse
+                self._positions = None
+            return
+
+        if column not in self._ascending:
+            keys = self.sort_keys(column)
+            self._ascending[column] = sorted(
+                range(len(self.rows)), key=keys.__getitem__)
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self._apply()
+
+    def filter(self, mask: list[bool] = None) -> None:
+        """
+        Show only the rows where mask, a sequence of one bool per row
+        id, is true. A mask of None shows all the rows.
+        """
+        if mask is not None:
+            if len(mask) != len(self.rows):
+                raise ValueError('The mask must have one value per row')
+            mask = [bool(value) for value in mask]
+        self._mask = mask
+        self._apply()
+
+    def _apply(self) -> None:
+        """Rebuild the display order from the sort and the filter."""
+        if self.sort_column is None:
+            order = range(len(self.rows))
+        else:
+            order = self._ascending[self.sort_column]
+        if self.sort_reverse:
+            order = order[::-1]
+        mask = self._mask
+        if mask is None:
+            self.order = list(order)
+        else:
+            self.order = [row_id for row_id in order if mask[row_id]]
+        self._positions = None
+
+
+def _cell(row: tuple, column: int) -> object:
+    return row[column] if column < len(row) else ''
+
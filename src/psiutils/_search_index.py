@@ -0,0 +1,115 @@
+"""A substring search index over the rows of a Treeview."""
+import unicodedata
+
+GRAM = 3
+SEPARATOR = '\x00'  # between cells, so a match never spans two cells
+
+
+class SearchIndex():
+    """
+    Find the rows containing a piece of text, for type-ahead filtering.
+
+    The text of each row is normalized once (case-folded, accents
+    removed) and every trigram of it is indexed. A query is answered
+    from the rows of its rarest trigram. As the query is typed, each
+    query that extends the previous one only checks the rows that
+    matched before; deleting characters reuses the earlier results.
+    """
+    def __init__(self, rows, columns: list[int] = None) -> None:
+        """
+        :param rows: the rows of the model, indexed by row id.
+        :param columns: the columns to search. Defaults to all of them.
+        """
+        self.columns = columns
+        self.texts = self._texts(rows)
+        self._grams: dict[str, list[int]] | None = None
+        self._results: list[tuple[str, list[int]]] = []
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _texts(self, rows) -> list[str]:
+        columns = self.columns
+        return [
+            SEPARATOR.join(
+                normalize(cell) for cell in
+                (row if columns is None else _cells(row, columns)))
+            for row in rows
+        ]
+
+    def extend(self, rows) -> None:
+        """
+        Add rows to the end of the index. The trigrams and the kept
+        results are updated from the new rows only.
+        """
+        start = len(self.texts)
+        texts = self._texts(rows)
+        self.texts.extend(texts)
+        if self._grams is not None:
+            self._add_grams(start, texts)
+        for query, matches in self._results:
+            matches.extend(
+                row_id for row_id, text in enumerate(texts, start)
+                if query in text)
+
+    def search(self, text: str) -> list[int] | None:
+        """
+        Return the ids of the rows containing text, in row id order;
+        None if text is blank, i.e. every row matches.
+        """
+        query = normalize(text)
+        if not query:
+            self._results = []
+            return None
+
+        # Keep the results of the queries that query refines
+        results = self._results
+        while results and results[-1][0] not in query:
+            results.pop()
+        if results and results[-1][0] == query:
+            return results[-1][1]
+
+        if results:
+            candidates = results[-1][1]
+        else:
+            candidates = self._candidates(query)
+        texts = self.texts
+        matches = [row_id for row_id in candidates if query in texts[row_id]]
+        results.append((query, matches))
+        return matches
+
+    def _candidates(self, query: str):
+        """Return the rows that may contain query."""
+        if len(query) < GRAM:
+            return range(len(self.texts))
+        grams = self._index()
+        postings = [grams.get(query[start:start + GRAM], [])
+                    for start in range(len(query) - GRAM + 1)]
+        return min(postings, key=len)
+
+    def _index(self) -> dict[str, list[int]]:
+        """Return the trigram -> row ids index, built on first use."""
+        if self._grams is None:
+            self._grams = {}
+            self._add_grams(0, self.texts)
+        return self._grams
+
+    def _add_grams(self, first: int, texts: list[str]) -> None:
+        """Index the trigrams of texts, the rows from row id first."""
+        grams = self._grams
+        for row_id, text in enumerate(texts, first):
+            for gram in {text[start:start + GRAM]
+                         for start in range(len(text) - GRAM + 1)}:
+                grams.setdefault(gram, []).append(row_id)
+
+
+def normalize(value) -> str:
+    """Return value as case-folded text without accents."""
+    text = unicodedata.normalize('NFKD', str(value).casefold())
+    if text.isascii():
+        return text
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+def _cells(row: tuple, columns: list[int]) -> list:
+    return [row[column] if column < len(row) else '' for column in columns]
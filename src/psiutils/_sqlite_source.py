@@ -0,0 +1,222 @@
+"""A SQLite table or query as the rows of a virtual Treeview."""
+from pathlib import Path
+import sqlite3
+
+PAGE_SIZE = 200
+MAX_VARIABLES = 500  # keep IN (...) lists well below SQLite's limit
+KEY = 'psiutils_key'
+POSITION = 'psiutils_position'
+
+
+class SqliteSource():
+    """
+    Browse a SQLite table or query in a virtual Treeview.
+
+    Only a page of rows around the viewport is held in memory. Sorting
+    is an ORDER BY, filtering a WHERE clause and the window is fetched
+    with LIMIT/OFFSET, so a table of any size is shown in constant
+    memory. Rows are identified by key (the rowid of a table by
+    default), which is what Treeview keeps for the selection.
+
+    Usage:
+
+        source = SqliteSource('audit.db', table='events',
+                              columns=['date', 'user', 'action'])
+        tree = Treeview(master, column_defs, virtual=True)
+        tree.set_source(source)
+        ...
+        source.filter('user = ?', ('jeff',))
+        tree.refresh()
+    """
+    def __init__(
+            self,
+            connection: sqlite3.Connection | str | Path,
+            table: str = '',
+            query: str = '',
+            columns: list[str] = None,
+            key: str = '',
+            page_size: int = PAGE_SIZE) -> None:
+        """
+        :param table: the table to browse; or
+        :param query: a SELECT statement to browse.
+        :param columns: the columns shown, in Treeview column order.
+            Defaults to all the columns of the table or query.
+        :param key: a column that identifies a row. Defaults to the
+            rowid of a table and is required for a query.
+        """
+        if bool(table) == bool(query):
+            raise ValueError('SqliteSource needs one of table or query')
+        if query and not key:
+            raise ValueError('SqliteSource needs a key column for a query')
+
+        if not isinstance(connection, sqlite3.Connection):
+            connection = sqlite3.connect(connection)
+        self.connection = connection
+        self._from = _quote(table) if table else f'({query})'
+        self.key = _quote(key or 'rowid')
+        self.columns = columns or self._all_columns()
+        self.page_size = page_size
+
+        self.sort_column: int | None = None
+        self.sort_reverse = False
+        self._where = ''
+        self._params: tuple = ()
+        self.invalidate()
+
+    def _all_columns(self) -> list[str]:
+        cursor = self.connection.execute(f'SELECT * FROM {self._from} LIMIT 0')
+        return [description[0] for description in cursor.description]
+
+    def invalidate(self) -> None:
+        """Forget cached rows and counts, e.g. after the data changes."""
+        self._count: int | None = None
+        self._page_start = 0
+        self._page: list[tuple] = []  # (key, row) in display order
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = self.connection.execute(
+                f'SELECT COUNT(*) FROM {self._from}{self._where_sql()}',
+                self._params).fetchone()[0]
+        return self._count
+
+    def filter(self, where: str = '', params: tuple = ()) -> None:
+        """Show only the rows matching the SQL condition where."""
+        self._where = where
+        self._params = tuple(params)
+        self.invalidate()
+
+    def sort(self, column: int, reverse: bool = False) -> None:
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self._page = []
+
+    def window(self, start: int, count: int) -> list[tuple]:
+        """Return count rows in display order, starting at start."""
+        return [row for (_, row) in self._rows(start, count)]
+
+    def row_id(self, position: int) -> object:
+        """Return the key of the row displayed at position."""
+        return self._rows(position, 1)[0][0]
+
+    def position(self, row_id: object) -> int | None:
+        """Return the display position of the row with key row_id."""
+        cursor = self._numbered(POSITION, f'{KEY} = ?', (row_id,))
+        found = cursor.fetchone()
+        return found[0] if found else None
+
+    def find(self, column: int, value: object) -> int | None:
+        """Return the display position of the first row matching value."""
+        column_name = _quote(self.columns[column])
+        cursor = self._numbered(
+            POSITION, f'CAST({column_name} AS TEXT) = ?', (str(value),))
+        found = cursor.fetchone()
+        return found[0] if found else None
+
+    def row_ids(self) -> list[object]:
+        """Return the keys of the rows matching the filter."""
+        cursor = self.connection.execute(
+            f'SELECT {self.key} FROM {self._from}{self._where_sql()}',
+            self._params)
+        return [key for (key,) in cursor]
+
+    def lookup(self, column: int, values: list) -> list[object]:
+        """Return the keys of the rows whose value in column is in values."""
+        keys = []
+        column_name = _quote(self.columns[column])
+        for chunk in _chunks([str(value) for value in values]):
+            condition = f'CAST({column_name} AS TEXT) IN ({_marks(chunk)})'
+            cursor = self.connection.execute(
+                f'SELECT {self.key} FROM {self._from}'
+                f'{self._where_sql(condition)}',
+                self._params + tuple(chunk))
+            keys.extend(key for (key,) in cursor)
+        return keys
+
+    def values(self, row_ids) -> list[tuple]:
+        """
+        Return the rows with the given keys, in display order.
+
+        Rows hidden by filter follow, in key order, as with RowModel.
+        """
+        row_ids = list(row_ids)
+        found = []
+        for chunk in _chunks(row_ids):
+            found.extend(self._numbered(
+                f'{POSITION}, {KEY}, {self._column_sql()}',
+                f'{KEY} IN ({_marks(chunk)})',
+                tuple(chunk)))
+        found.sort(key=lambda row: row[0])
+        rows = [tuple(row[2:]) for row in found]
+        if not self._where or len(found) == len(row_ids):
+            return rows
+
+        shown = {row[1] for row in found}
+        hidden = []
+        for chunk in _chunks([key for key in row_ids if key not in shown]):
+            hidden.extend(self.connection.execute(
+                f'SELECT {self.key}, {self._column_sql()} FROM {self._from}'
+                f' WHERE {self.key} IN ({_marks(chunk)})',
+                tuple(chunk)))
+        hidden.sort(key=lambda row: row[0])
+        return rows + [tuple(row[1:]) for row in hidden]
+
+    def _rows(self, start: int, count: int) -> list[tuple]:
+        """Return (key, row) pairs, fetching a page if they are not cached."""
+        stop = min(start + count, len(self))
+        page_stop = self._page_start + len(self._page)
+        if not (self._page_start <= start and stop <= page_stop):
+            self._page_start = max(0, start - self.page_size // 4)
+            limit = max(self.page_size, stop - self._page_start)
+            cursor = self.connection.execute(
+                f'SELECT {self.key}, {self._column_sql()} FROM {self._from}'
+                f'{self._where_sql()}{self._order_sql()} LIMIT ? OFFSET ?',
+                self._params + (limit, self._page_start))
+            self._page = [(row[0], tuple(row[1:])) for row in cursor]
+
+        offset = start - self._page_start
+        return self._page[offset:offset + stop - start]
+
+    def _numbered(
+            self, select: str, condition: str, params: tuple
+            ) -> sqlite3.Cursor:
+        """Select from the rows matching condition, numbered in order."""
+        return self.connection.execute(
+            f'SELECT {select} FROM ('
+            f'SELECT *, {self.key} AS {KEY}, '
+            f'ROW_NUMBER() OVER ({self._order_sql().strip()}) - 1 '
+            f'AS {POSITION} FROM {self._from}{self._where_sql()}) '
+            f'WHERE {condition} ORDER BY {POSITION}',
+            self._params + params)
+
+    def _column_sql(self) -> str:
+        return ', '.join(_quote(column) for column in self.columns)
+
+    def _where_sql(self, condition: str = '') -> str:
+        conditions = [f'({clause})' for clause in (self._where, condition)
+                      if clause]
+        if not conditions:
+            return ''
+        return f' WHERE {" AND ".join(conditions)}'
+
+    def _order_sql(self) -> str:
+        direction = 'DESC' if self.sort_reverse else 'ASC'
+        if self.sort_column is None:
+            return f' ORDER BY {self.key} {direction}'
+        column = _quote(self.columns[self.sort_column])
+        return f' ORDER BY {column} {direction}, {self.key} {direction}'
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _marks(values: list) -> str:
+    return ', '.join('?' * len(values))
+
+
+def _chunks(values: list) -> list[list]:
+    return [
+        values[start:start + MAX_VARIABLES]
+        for start in range(0, len(values), MAX_VARIABLES)
+    ]
@@ -1,10 +1,11 @@
 """Button class for Tkinter applications."""
 import tkinter as tk
 from tkinter import ttk
+from collections.abc import Mapping
 from pathlib import Path
-from PIL import Image, ImageTk
 
 from psiutils.text import Text
+from psiutils._images import photo_image, icon_image
 
 from psiutils.constants import PAD, Pad
 from psiutils.widgets import enter_widget, clickable_widget, HAND
@@ -30,14 +31,15 @@ class IconButton(ttk.Frame):
         self.icon = icon
 
         # Icon and text
-        if not icon_path:
-            icon_path = f'{Path(__file__).parent}/icons/'
-        image = Image.open(f'{icon_path}{icon}.png').resize((16, 16))
-        photo_image = ImageTk.PhotoImage(image)
+        if icon_path:
+            image = photo_image(
+                self, Path(f'{icon_path}{icon}.png'), (16, 16))
+        else:
+            image = icon_image(self, icon)
 
         self.button_label = ttk.Label(
-            self, text=button_text, image=photo_image, compound=tk.LEFT)
-        self.button_label.image = photo_image  # Prevent garbage collection
+            self, text=button_text, image=image, compound=tk.LEFT)
+        self.button_label.image = image
         self.button_label.pack(padx=(3, 5), pady=5)
         self.widget = self.button_label
 
@@ -118,10 +120,7 @@ class ButtonFrame(ttk.Frame):
         if 'enabled' in kwargs:
             self._enabled = kwargs['enabled']
 
-        self.icon_buttons = {
-            name: IconButton(self, button[0], button[1])
-            for name, button in icon_buttons.items()
-        }
+        self.icon_buttons = _IconButtons(self)
 
     def icon_button(
             self,
@@ -208,6 +207,32 @@ class ButtonFrame(ttk.Frame):
                         button.disable()
 
 
+class _IconButtons(Mapping):
+    """
+    The icon buttons of a ButtonFrame, keyed as icon_buttons.
+
+    A button is created the first time it is looked up, so a frame
+    costs nothing for the buttons it does not use.
+    """
+    def __init__(self, master: ButtonFrame) -> None:
+        self._master = master
+        self._buttons: dict[str, IconButton] = {}
+
+    def __getitem__(self, id_: str) -> IconButton:
+        button = self._buttons.get(id_)
+        if button is None:
+            text, icon = icon_buttons[id_]
+            button = IconButton(self._master, text, icon)
+            self._buttons[id_] = button
+        return button
+
+    def __iter__(self):
+        return iter(icon_buttons)
+
+    def __len__(self) -> int:
+        return len(icon_buttons)
+
+
 def enable_buttons(buttons: list[Button], enable: bool = True):
     state = tk.NORMAL if enable else tk.DISABLED
     for button in buttons:
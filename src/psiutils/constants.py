@@ -5,8 +5,18 @@ from .known_paths import get_documents_dir, get_downloads_dir
 
 DEFAULT_GEOMETRY = '500x400'
 
-DOCUMENTS_DIR = get_documents_dir()
-DOWNLOADS_DIR = get_downloads_dir()
+# DOCUMENTS_DIR and DOWNLOADS_DIR are looked up on first use
+_KNOWN_DIRS = {
+    'DOCUMENTS_DIR': get_documents_dir,
+    'DOWNLOADS_DIR': get_downloads_dir,
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _KNOWN_DIRS:
+        value = globals()[name] = _KNOWN_DIRS[name]()
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 # GUI
 PAD = 5
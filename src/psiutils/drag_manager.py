@@ -18,11 +18,18 @@
 """
 
 
+import contextlib
 import tkinter as tk
+from typing import Callable
+
+from psiutils.constants import COLOURS
 
 DRAG_TOKEN_X_OFFSET = 11
 DRAG_TOKEN_Y_OFFSET = 12
 DRAG_TOKEN_TEXT = '... ...'
+FRAME_MS = 16  # the token is moved at most once per frame
+MAX_TARGET_CELLS = 64  # larger targets are checked for every point
+HOVER_COLOUR = COLOURS['pale-umber']
 
 
 class DragManager():
@@ -33,14 +40,26 @@ class DragManager():
         self.source_widget = None
         self.target_widgets = []
         self.drop_widget = None
+        self.highlight = None
         self.drag_token = tk.Label(self.root, text=DRAG_TOKEN_TEXT, bg='white',
                                    borderwidth=2, relief='groove')
-
-    def add_draggable(self, source_widget, target_widgets: list[tuple]):
+        # Snapshot at on_start, for the length of the drag
+        self._targets: _TargetIndex | None = None
+        self._origin = (0, 0)
+        self._pointer = (0, 0)
+        self._hover: int | None = None
+        self._backgrounds: dict[int, str] = {}
+        self._job = None
+
+    def add_draggable(self, source_widget, target_widgets: list[tuple],
+                      highlight: Callable = None):
         """
             source_widget is the tree from which we will be selecting an item
             target_widgets is a list of tuples. One tuple per target; the
                 first entry being the widget, the second its text_variable
+            highlight, if given, is called with a target widget and True
+                when the pointer moves over it, and False when it leaves.
+                By default the target's background is set to HOVER_COLOUR
             drag_token is a label widget that moves with the hand cursor to
                 indicate dragging in progress
         """
@@ -50,18 +69,20 @@ class DragManager():
         source_widget.configure(cursor="hand1")
         self.source_widget = source_widget
         self.target_widgets = target_widgets
+        self.highlight = highlight
 
     def _get_source_coords(self) -> tuple:
         sx = self.source_widget.winfo_rootx()
         sy = self.source_widget.winfo_rooty()
         return (sx, sy)
 
-    def _place_token(self, widget):
-        sx = self.parent.main_frame.winfo_rootx()
-        sy = self.parent.main_frame.winfo_rooty()
-        x, y = widget.winfo_pointerxy()
+    def _place_token(self) -> None:
+        self._job = None
+        x, y = self._pointer
+        sx, sy = self._origin
         self.drag_token.place(x=x-sx-DRAG_TOKEN_X_OFFSET,
                               y=y-sy-DRAG_TOKEN_Y_OFFSET)
+        self._set_hover(self._targets.find(x, y))
 
     def on_start(self, event):
         widget = event.widget
@@ -70,26 +91,116 @@ class DragManager():
             return
         self.values = widget.item(selected_item)['values']
 
-        self._place_token(widget)
+        # The targets do not move during a drag, so their rectangles
+        # are read from Tk once here rather than on each event
+        main_frame = self.parent.main_frame
+        self._origin = (main_frame.winfo_rootx(), main_frame.winfo_rooty())
+        self._targets = _TargetIndex([
+            _rectangle(target_widget[0])
+            for target_widget in self.target_widgets])
+        self._pointer = (event.x_root, event.y_root)
+        self._place_token()
 
     def on_drag(self, event):
-        self._place_token(event.widget)
+        if self._targets is None:
+            return
+        self._pointer = (event.x_root, event.y_root)
+        if self._job is None:
+            self._job = self.root.after(FRAME_MS, self._place_token)
 
     def on_drop(self, event):
         self.drag_token.place_forget()
-
-        x, y = event.widget.winfo_pointerxy()
-        for target_widget in self.target_widgets:
-            target = target_widget[0]
-            x_coords = (target.winfo_rootx(),
-                        target.winfo_rootx() + target.winfo_width())
-            y_coords = (target.winfo_rooty(),
-                        target.winfo_rooty() + target.winfo_height())
-
-            if (x >= x_coords[0] and x <= x_coords[1] and
-                    y >= y_coords[0] and y <= y_coords[1]):
-                name = f'{self.values[0]} {self.values[1]} {self.values[2]}'
-                # Set the widget's textvariable to the selected value
-                self.drop_widget = target_widget[0]
-                target_widget[1].set(name.strip())
+        if self._targets is None:
+            return
+        self._cancel()
+        self._set_hover(None)
+        index = self._targets.find(event.x_root, event.y_root)
+        self._targets = None
+
+        if index is not None:
+            target_widget = self.target_widgets[index]
+            name = f'{self.values[0]} {self.values[1]} {self.values[2]}'
+            # Set the widget's textvariable to the selected value
+            self.drop_widget = target_widget[0]
+            target_widget[1].set(name.strip())
+
+    def _set_hover(self, index: int | None) -> None:
+        if index == self._hover:
+            return
+        if self._hover is not None:
+            self._highlight(self._hover, False)
+        if index is not None:
+            self._highlight(index, True)
+        self._hover = index
+
+    def _highlight(self, index: int, on: bool) -> None:
+        widget = self.target_widgets[index][0]
+        if self.highlight:
+            self.highlight(widget, on)
+            return
+        with contextlib.suppress(tk.TclError):  # e.g. ttk widgets
+            if on:
+                self._backgrounds[index] = widget.cget('background')
+                widget.configure(background=HOVER_COLOUR)
+            elif index in self._backgrounds:
+                widget.configure(background=self._backgrounds.pop(index))
+
+    def _cancel(self) -> None:
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+
+class _TargetIndex():
+    """
+    The screen rectangles of the drop targets, bucketed in a grid of
+    cells the size of a typical target, so finding the target under
+    the pointer checks only the few targets in its cell. A target that
+    would cover more than MAX_TARGET_CELLS cells, e.g. a whole-window
+    drop zone, is kept in a list checked for every point instead.
+    """
+    def __init__(self, rectangles: list[tuple[int, int, int, int]]) -> None:
+        self.rectangles = rectangles
+        self.cell = (
+            _median([right - left for left, _, right, _ in rectangles]),
+            _median([bottom - top for _, top, _, bottom in rectangles]))
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.large: list[int] = []
+        width, height = self.cell
+        for index, (left, top, right, bottom) in enumerate(rectangles):
+            columns = range(left // width, right // width + 1)
+            rows = range(top // height, bottom // height + 1)
+            if len(columns) * len(rows) > MAX_TARGET_CELLS:
+                self.large.append(index)
+                continue
+            for column in columns:
+                for row in rows:
+                    self.cells.setdefault((column, row), []).append(index)
+
+    def find(self, x: int, y: int) -> int | None:
+        """Return the index of the first target containing x, y."""
+        width, height = self.cell
+        found = None
+        for index in self.cells.get((x // width, y // height), ()):
+            if self._contains(index, x, y):
+                found = index
                 break
+        for index in self.large:
+            if found is not None and index > found:
+                break
+            if self._contains(index, x, y):
+                return index
+        return found
+
+    def _contains(self, index: int, x: int, y: int) -> bool:
+        left, top, right, bottom = self.rectangles[index]
+        return left <= x <= right and top <= y <= bottom
+
+
+def _rectangle(widget: tk.Widget) -> tuple[int, int, int, int]:
+    x, y = widget.winfo_rootx(), widget.winfo_rooty()
+    return (x, y, x + widget.winfo_width(), y + widget.winfo_height())
+
+
+def _median(values: list[int]) -> int:
+    return max(sorted(values)[len(values) // 2], 1) if values else 1
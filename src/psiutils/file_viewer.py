@@ -0,0 +1,172 @@
+"""A read-only viewer for text files too large to load into a Text."""
+import contextlib
+import tkinter as tk
+from tkinter import ttk
+from pathlib import Path
+
+from psiutils._line_index import LineIndex
+from psiutils.widgets import PsiText
+
+WINDOW_LINES = 1000  # lines held in the Text
+POLL_MS = 100  # while the file is being indexed
+
+
+class FileViewer(ttk.Frame):
+    """
+    Show a text file of any size, a window of lines at a time.
+
+    The file is memory-mapped and its lines are indexed in a worker
+    thread (see LineIndex); the start of the file is shown at once.
+    The Text holds only the lines around the view and the window is
+    moved as the view nears either end of it, so scrolling with the
+    keyboard or the mouse wheel is handled by the Text itself. The
+    scrollbar covers the whole file and goto_line loads the window
+    around any line by index.
+
+    Usage:
+
+        viewer = FileViewer(root, 'app.log')
+        viewer.grid(row=0, column=0, sticky='nsew')
+        viewer.goto_line(1_000_000)
+    """
+    def __init__(
+            self,
+            master: tk.Misc,
+            path: str | Path = None,
+            encoding: str = 'utf-8',
+            window_lines: int = WINDOW_LINES,
+            **kwargs) -> None:
+        super().__init__(master, **kwargs)
+        self.encoding = encoding
+        self.window_lines = window_lines
+        self.index: LineIndex | None = None
+        self._first = 0  # the file line shown on the first Text line
+        self._loaded = 0  # the number of lines in the Text
+        self._poll_job = None
+        self._move_job = None
+
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.text = PsiText(self, wrap=tk.NONE, state=tk.DISABLED)
+        self.text.grid(row=0, column=0, sticky=tk.NSEW)
+        self.scrollbar = ttk.Scrollbar(
+            self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.text.configure(yscrollcommand=self._on_text_scroll)
+        self.bind('<Destroy>', self._on_destroy, add='+')
+
+        if path:
+            self.open(path)
+
+    @property
+    def line_count(self) -> int:
+        """The number of lines indexed so far."""
+        return len(self.index) if self.index else 0
+
+    def open(self, path: str | Path) -> None:
+        self.close()
+        self.index = LineIndex(path)
+        self.index.start()
+        self._load(0)
+        self._poll_job = self.after(POLL_MS, self._poll)
+
+    def close(self) -> None:
+        """Close the file and clear the view."""
+        self._cancel()
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        self._first = 0
+        self._set_text('')
+        self._loaded = 0
+
+    def goto_line(self, line: int) -> None:
+        """Show line (counted from 1) at the top of the view."""
+        line = max(0, min(line - 1, self.line_count - 1))
+        if not self._first <= line < self._first + self._loaded:
+            self._load(line)
+        self.text.yview(f'{line - self._first + 1}.0')
+
+    def top_line(self) -> int:
+        """Return the line (counted from 1) at the top of the view."""
+        return self._first + self._text_line('@0,0') + 1
+
+    def _load(self, line: int) -> None:
+        """Fill the Text with the window of lines around line."""
+        start = max(0, min(
+            line - self.window_lines // 3,
+            self.line_count - self.window_lines))
+        self._set_text(
+            self.index.text(start, self.window_lines, self.encoding))
+        self._first = start
+        self._loaded = min(self.window_lines, self.line_count - start)
+
+    def _set_text(self, text: str) -> None:
+        self.text.configure(state=tk.NORMAL)
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', text)
+        self.text.configure(state=tk.DISABLED)
+
+    def _move_window(self) -> None:
+        """Centre the window on the view, keeping the view in place."""
+        self._move_job = None
+        top = self.top_line()
+        self._load(top - 1)
+        self.text.yview(f'{top - self._first}.0')
+
+    def _on_text_scroll(self, *args) -> None:
+        if self.index is None:
+            self.scrollbar.set(0, 1)
+            return
+        top = self.top_line() - 1
+        visible = self._text_line(f'@0,{self.text.winfo_height()}') + 1
+        visible -= top - self._first
+        total = max(self.index.estimate(), 1)
+        self.scrollbar.set(top / total, min((top + visible) / total, 1))
+
+        # Move the window before the view reaches either end of it
+        margin = self.window_lines // 4
+        end = self._first + self._loaded
+        near_start = self._first > 0 and top - self._first < margin
+        near_end = (end < self.line_count
+                    and end - (top + visible) < margin)
+        if (near_start or near_end) and self._move_job is None:
+            # Not while Tk is updating the view
+            self._move_job = self.after_idle(self._move_window)
+
+    def _on_scrollbar(self, command: str, *args) -> None:
+        if command == tk.MOVETO:
+            total = max(self.index.estimate(), 1) if self.index else 1
+            self.goto_line(int(float(args[0]) * total) + 1)
+        else:
+            self.text.yview_scroll(int(args[0]), args[1])
+
+    def _poll(self) -> None:
+        """Update the scrollbar, and the window, as lines are indexed."""
+        self._poll_job = None
+        if self.index is None:
+            return
+        if (self._loaded < self.window_lines
+                and self._first + self._loaded < self.line_count):
+            self._move_window()
+        self._on_text_scroll()
+        if not self.index.done:
+            self._poll_job = self.after(POLL_MS, self._poll)
+
+    def _text_line(self, index: str) -> int:
+        """Return the 0-based line in the Text of index."""
+        return int(self.text.index(index).split('.')[0]) - 1
+
+    def _cancel(self) -> None:
+        for job in (self._poll_job, self._move_job):
+            if job is not None:
+                with contextlib.suppress(tk.TclError):
+                    self.after_cancel(job)
+        self._poll_job = self._move_job = None
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is self:
+            self._cancel()
+            if self.index is not None:
+                self.index.close()
+                self.index = None
@@ -0,0 +1,252 @@
+"""Incremental syntax highlighting of a PsiText with Pygments."""
+import tkinter as tk
+from tkinter import font as tkfont
+from collections import defaultdict
+
+from pygments.lexer import Lexer, RegexLexer
+from pygments.lexers import get_lexer_by_name
+from pygments.style import StyleMeta
+from pygments.styles import get_style_by_name
+
+from psiutils.widgets import PsiText
+
+CHUNK_LINES = 200  # lines lexed per idle callback
+TAG_PREFIX = 'psi_token'
+
+
+class Highlighter():
+    """
+    Colour the text of a PsiText as the user edits it.
+
+    The token runs of each line are cached, with the lexer state at the
+    start of the line where it is known. After a change, lexing resumes
+    from the last line before the change whose state is known and stops
+    as soon as a line after the change starts in the same state as
+    before, since from there on the tokens cannot have changed. Lines
+    down to the bottom of the view are tagged at once; the rest of the
+    text is lexed and tagged in chunks while the widget is idle.
+
+    Lexers derived from RegexLexer (most of them) can resume; others
+    are re-run from the top of the text, still leaving the lines below
+    the view to idle time.
+
+    The highlighter sets coalesce on the widget and re-lexes once per
+    idle cycle, from the widget's dirty_ranges.
+    """
+    def __init__(
+            self,
+            text: PsiText,
+            lexer: Lexer | str,
+            style: StyleMeta | str = 'default') -> None:
+        self.text = text
+        self.lexer = get_lexer_by_name(lexer) if isinstance(lexer, str) \
+            else lexer
+        self.style = get_style_by_name(style) if isinstance(style, str) \
+            else style
+        # Only the plain RegexLexer loop exposes its state: see _lex
+        self.resumable = (
+            type(self.lexer).get_tokens_unprocessed
+            is RegexLexer.get_tokens_unprocessed)
+
+        self._runs: list[tuple | None] = []
+        self._states: list[tuple | None] = []
+        self._tags: dict[object, str | None] = {}
+        self._fonts: list[tkfont.Font] = []
+        self._tokens = None
+        self._line = 0
+        self._until = 0
+        self._job = None
+
+        text.coalesce = True
+        text.bind('<<TextModified>>', self._on_modified, add='+')
+        text.bind('<Destroy>', self._on_destroy, add='+')
+        self.rehighlight()
+
+    def rehighlight(self) -> None:
+        """Lex and tag the whole text again."""
+        for tag in self._tags.values():
+            if tag:
+                self.text.tag_remove(tag, '1.0', tk.END)
+        lines = self._line_count()
+        self._runs = [None] * lines
+        self._states = [None] * lines
+        self._states[0] = ('root',) if self.resumable else None
+        self._start(0, lines - 1)
+
+    def _on_modified(self, *args) -> None:
+        ranges = self.text.dirty_ranges
+        if not ranges:
+            return
+        first = _line(ranges[0][0])
+        last = max(_line(end) for start, end in ranges)
+        lines = last - first + 1
+        delta = self._line_count() - len(self._runs)
+        old_last = last - delta
+
+        # The state at the start of first is set by the text above it
+        self._runs[first:old_last + 1] = [None] * lines
+        self._states[first + 1:old_last + 1] = [None] * (lines - 1)
+        for tag in self._tags.values():
+            if tag:
+                self.text.tag_remove(tag, f'{first + 1}.0', f'{last + 2}.0')
+
+        until = last
+        if self._tokens is not None:
+            # Carry on with the lines the current pass has yet to check
+            first = min(first, self._line)
+            if self._until > old_last:
+                until = max(until, self._until + delta)
+        self._start(first, until)
+
+    def _start(self, line: int, until: int) -> None:
+        """Re-lex from line; the lines down to until have changed."""
+        while line > 0 and self._states[line] is None:
+            line -= 1
+        source = self.text.get(f'{line + 1}.0', 'end-1c')
+        self._tokens = self._lex(source, self._states[line])
+        self._line = line
+        self._until = until
+
+        self._cancel()
+        self._advance(self._last_visible())
+        if self._tokens is not None:
+            self._job = self.text.after_idle(self._on_idle)
+
+    def _on_idle(self) -> None:
+        self._job = None
+        self._advance(self._line + CHUNK_LINES - 1)
+        if self._tokens is not None:
+            self._job = self.text.after_idle(self._on_idle)
+
+    def _advance(self, stop: int) -> None:
+        """Lex and tag the lines up to stop, or until the pass is done."""
+        added = defaultdict(list)
+        removed = defaultdict(list)
+        while self._line <= stop:
+            try:
+                state, runs = next(self._tokens)
+            except StopIteration:
+                self._tokens = None
+                break
+            line = self._line
+            if (line > self._until and state is not None
+                    and state == self._states[line]):
+                self._tokens = None  # the rest of the text is unchanged
+                break
+            self._states[line] = state
+            old = self._runs[line]
+            if runs != old:
+                self._runs[line] = runs
+                for start, end, tag in old or ():
+                    removed[tag].extend(
+                        (f'{line + 1}.{start}', f'{line + 1}.{end}'))
+                for start, end, tag in runs:
+                    added[tag].extend(
+                        (f'{line + 1}.{start}', f'{line + 1}.{end}'))
+            self._line += 1
+
+        for tag, indexes in removed.items():
+            self.text.tk.call(self.text._w, 'tag', 'remove', tag, *indexes)
+        for tag, indexes in added.items():
+            self.text.tag_add(tag, *indexes)
+
+    def _lex(self, source: str, stack: tuple | None):
+        """
+        Yield (state, runs) for each line of source: the lexer state at
+        the start of the line, None if not known, and the (start, end,
+        tag) runs of its tokens.
+
+        RegexLexer keeps its state stack in a local of its generator.
+        The state is recorded for a line when a match starts the line;
+        lexing the text from there with that stack gives the same
+        tokens.
+        """
+        if stack is None:
+            tokens = self.lexer.get_tokens_unprocessed(source)
+            frame = None
+        else:
+            tokens = self.lexer.get_tokens_unprocessed(source, stack)
+            frame = tokens.gi_frame
+
+        line_start = 0
+        state = stack
+        runs = []
+        for position, token_type, value in tokens:
+            if (position == line_start and state is None
+                    and frame is not None):
+                lexer_locals = frame.f_locals
+                if lexer_locals.get('pos') == line_start:
+                    state = tuple(lexer_locals['statestack'])
+
+            tag = self._tag(token_type)
+            offset = position
+            for index, part in enumerate(value.split('\n')):
+                if index:
+                    yield state, tuple(runs)
+                    line_start = offset
+                    state = None
+                    runs = []
+                if part and tag:
+                    _add_run(
+                        runs, offset - line_start,
+                        offset - line_start + len(part), tag)
+                offset += len(part) + 1
+        yield state, tuple(runs)
+
+    def _tag(self, token_type) -> str | None:
+        """Return the tag for token_type, None if the style ignores it."""
+        if token_type in self._tags:
+            return self._tags[token_type]
+
+        style = self.style.style_for_token(token_type)
+        options = {}
+        if style['color']:
+            options['foreground'] = f'#{style["color"]}'
+        if style['bgcolor']:
+            options['background'] = f'#{style["bgcolor"]}'
+        if style['underline']:
+            options['underline'] = True
+        if style['bold'] or style['italic']:
+            token_font = tkfont.Font(font=self.text.cget('font'))
+            token_font.configure(
+                weight='bold' if style['bold'] else 'normal',
+                slant='italic' if style['italic'] else 'roman')
+            self._fonts.append(token_font)
+            options['font'] = token_font
+
+        tag = None
+        if options:
+            tag = f'{TAG_PREFIX}{token_type}'
+            self.text.tag_configure(tag, **options)
+            self.text.tag_lower(tag)  # keep the selection visible
+        self._tags[token_type] = tag
+        return tag
+
+    def _line_count(self) -> int:
+        return _line(self.text.index('end-1c')) + 1
+
+    def _last_visible(self) -> int:
+        """Return the (0-based) last line in view."""
+        return _line(self.text.index(f'@0,{self.text.winfo_height()}'))
+
+    def _cancel(self) -> None:
+        if self._job is not None:
+            self.text.after_cancel(self._job)
+            self._job = None
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is self.text:
+            self._cancel()
+            self._tokens = None
+
+
+def _line(index: str) -> int:
+    """Return the 0-based line of a Text index."""
+    return int(str(index).split('.')[0]) - 1
+
+
+def _add_run(runs: list, start: int, end: int, tag: str) -> None:
+    if runs and runs[-1][1] == start and runs[-1][2] == tag:
+        runs[-1] = (runs[-1][0], end, tag)
+    else:
+        runs.append((start, end, tag))
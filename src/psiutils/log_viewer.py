@@ -0,0 +1,261 @@
+"""A live view of the JSON log written by psi_logger."""
+import contextlib
+import json
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from psiutils.widgets import PsiText, vertical_scroll_bar
+
+MAX_LINES = 10_000
+POLL_SECONDS = 0.25  # between reads of the log file
+FRAME_MS = 40  # between appends to the Text
+LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'warn': 30, 'error': 40,
+          'exception': 40, 'critical': 50}
+LEVEL_COLOURS = {'debug': 'grey', 'warning': 'orange', 'error': 'red',
+                 'exception': 'red', 'critical': 'red'}
+_FIELDS = ('timestamp', 'level', 'logger', 'event')
+
+
+@dataclass
+class LogLine():
+    level: str
+    logger: str
+    text: str
+    record: dict
+
+
+class LogTail():
+    """
+    Read the lines appended to a JSON lines log file.
+
+    The offset read to is kept between reads, so each read costs only
+    the new lines. When the file is rotated (RotatingFileHandler renames
+    it to <name>.1 and starts a new file) the rest of the old file is
+    read from the backup and the new file from its start. The file is
+    not held open between reads, so that it can be rotated on Windows.
+    """
+    def __init__(self, path: str | Path, backlog: int = MAX_LINES) -> None:
+        """
+        :param backlog: the number of existing lines returned by the
+            first read. Older lines are skipped without being parsed.
+        """
+        self.path = Path(path)
+        self.offset = 0
+        self._backlog = backlog
+        self._inode = None
+        self._partial = b''
+
+    def read(self) -> list[LogLine]:
+        """Return the lines appended since the last read."""
+        lines = []
+        try:
+            file = open(self.path, 'rb')
+        except FileNotFoundError:
+            return []  # between the rename and the new file
+        with file:
+            stat = os.fstat(file.fileno())
+            if self._inode is not None and stat.st_ino != self._inode:
+                lines.extend(self._read_backup())
+                self.offset = 0
+            elif stat.st_size < self.offset:  # truncated
+                self.offset = 0
+                self._partial = b''
+            self._inode = stat.st_ino
+            file.seek(self.offset)
+            data = file.read()
+        self.offset += len(data)
+        lines.extend(self._split(data))
+
+        if self._backlog is not None:
+            lines = lines[-self._backlog:] if self._backlog else []
+            self._backlog = None
+        return [parse_line(line) for line in lines if line.strip()]
+
+    def _read_backup(self) -> list[bytes]:
+        """Return the rest of the rotated file, if it can be found."""
+        backup = self.path.with_name(f'{self.path.name}.1')
+        data = b''
+        with contextlib.suppress(OSError), open(backup, 'rb') as file:
+            if os.fstat(file.fileno()).st_ino == self._inode:
+                file.seek(self.offset)
+                data = file.read()
+        lines = self._split(data)
+        if self._partial:
+            lines.append(self._partial)
+            self._partial = b''
+        return lines
+
+    def _split(self, data: bytes) -> list[bytes]:
+        """Return the complete lines in data, keeping any partial line."""
+        *lines, self._partial = (self._partial + data).split(b'\n')
+        return lines
+
+
+def parse_line(line: bytes) -> LogLine:
+    """Return the LogLine of a line of the log."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        record = None
+    if not isinstance(record, dict):
+        record = {'event': line.decode('utf-8', errors='replace').rstrip()}
+    level = str(record.get('level', '')).lower()
+    logger = str(record.get('logger', ''))
+    extra = ' '.join(
+        f'{key}={value}' for key, value in record.items()
+        if key not in _FIELDS)
+    text = ' '.join(
+        str(part) for part in (
+            record.get('timestamp', ''), level.upper(), logger,
+            record.get('event', ''), extra)
+        if part)
+    return LogLine(level, logger, text, record)
+
+
+class LogViewer(ttk.Frame):
+    """
+    Follow a psi_logger log file as it is written.
+
+    The file is tailed and its lines parsed in a worker thread (see
+    LogTail). The lines received are added to the Text at most once a
+    frame, in a single insert. The last max_lines lines are kept in a
+    ring buffer, so set_filter redraws from memory without reading the
+    file again.
+
+    Usage:
+
+        viewer = LogViewer(root, app_name='my_app')
+        viewer.set_filter(level='warning')
+    """
+    def __init__(
+            self,
+            master: tk.Misc,
+            path: str | Path = None,
+            app_name: str = None,
+            max_lines: int = MAX_LINES,
+            **kwargs) -> None:
+        """
+        :param path: the log file; by default the psi_logger log of
+            app_name.
+        """
+        if path is None and app_name is None:
+            raise ValueError('LogViewer needs a path or an app_name')
+        super().__init__(master, **kwargs)
+        if path is None:
+            from psiutils._logger import _log_file
+            path = _log_file(app_name)
+        self.path = Path(path)
+        self.lines: deque[LogLine] = deque(maxlen=max_lines)
+        self.loggers: set[str] = set()
+        self.level = ''
+        self.logger = ''
+        self.follow = True
+
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.text = PsiText(self, wrap=tk.NONE, state=tk.DISABLED)
+        self.text.grid(row=0, column=0, sticky=tk.NSEW)
+        scroll_bar = vertical_scroll_bar(self, self.text)
+        scroll_bar.grid(row=0, column=1, sticky=tk.NS)
+        for level, colour in LEVEL_COLOURS.items():
+            self.text.tag_configure(level, foreground=colour)
+
+        self._tail = LogTail(self.path, max_lines)
+        self._queue: queue.Queue[list[LogLine]] = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+        self._job = self.after(FRAME_MS, self._drain)
+        self.bind('<Destroy>', self._on_destroy, add='+')
+
+    def set_filter(self, level: str = '', logger: str = '') -> None:
+        """
+        Show only the lines at level or above and from logger. An
+        empty value shows all levels or all loggers.
+        """
+        self.level = level.lower()
+        self.logger = logger
+        shown = [line for line in self.lines if self._shown(line)]
+        self._set_text(self._segments(shown), clear=True)
+
+    def _shown(self, line: LogLine) -> bool:
+        if self.logger and line.logger != self.logger:
+            return False
+        if self.level and line.level in LEVELS:
+            return LEVELS[line.level] >= LEVELS.get(self.level, 0)
+        return True
+
+    # Worker thread
+
+    def _produce(self) -> None:
+        while not self._stop.is_set():
+            with contextlib.suppress(OSError):
+                lines = self._tail.read()
+                if lines:
+                    self._queue.put(lines)
+            self._stop.wait(POLL_SECONDS)
+
+    # Tk thread
+
+    def _drain(self) -> None:
+        self._job = None
+        received = []
+        with contextlib.suppress(queue.Empty):
+            while True:
+                received.extend(self._queue.get_nowait())
+        if received:
+            self._append(received[-self.lines.maxlen:])
+        self._job = self.after(FRAME_MS, self._drain)
+
+    def _append(self, received: list[LogLine]) -> None:
+        # Drop the shown lines that fall out of the ring buffer
+        overflow = len(self.lines) + len(received) - self.lines.maxlen
+        dropped = sum(
+            self._shown(self.lines[index])
+            for index in range(max(0, min(overflow, len(self.lines)))))
+        self.lines.extend(received)
+        self.loggers.update(line.logger for line in received)
+
+        shown = [line for line in received if self._shown(line)]
+        if dropped:
+            self.text.configure(state=tk.NORMAL)
+            self.text.delete('1.0', f'{dropped + 1}.0')
+        if shown:
+            self._set_text(self._segments(shown))
+        else:
+            self.text.configure(state=tk.DISABLED)
+
+    def _segments(self, lines: list[LogLine]) -> list:
+        """Return the insert arguments for lines: text, tags, ..."""
+        segments = []
+        for line in lines:
+            segments.extend((
+                f'{line.text}\n',
+                line.level if line.level in LEVEL_COLOURS else ''))
+        return segments
+
+    def _set_text(self, segments: list, clear: bool = False) -> None:
+        at_end = self.text.yview()[1] >= 1.0
+        self.text.configure(state=tk.NORMAL)
+        if clear:
+            self.text.delete('1.0', tk.END)
+        if segments:
+            self.text.insert('end-1c', *segments)
+        self.text.configure(state=tk.DISABLED)
+        if self.follow and at_end:
+            self.text.see(tk.END)
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is not self:
+            return
+        self._stop.set()
+        if self._job is not None:
+            with contextlib.suppress(tk.TclError):
+                self.after_cancel(self._job)
+            self._job = None
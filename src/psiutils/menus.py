@@ -3,22 +3,112 @@
 import contextlib
 import tkinter as tk
 from tkinter import TclError
+from typing import Callable
+
+_UNBUILT = object()
 
 
 class Menu(tk.Menu):
-    def __init__(self, root: tk.Tk, menu_items: list = None) -> None:
-        if menu_items is None:
+    def __init__(
+            self,
+            root: tk.Tk,
+            menu_items: list = None,
+            provider: Callable[[], list['MenuItem']] = None,
+            version: Callable[[], object] = None) -> None:
+        """
+        :param provider: builds the menu lazily. If given, menu_items
+            is ignored and provider is called for the items each time
+            the menu is about to be shown.
+        :param version: returns a token, e.g. a counter bumped when the
+            items change. The items are rebuilt only when it changes.
+            Without it they are rebuilt each time the menu is shown.
+        """
+        if menu_items is None or provider:
             menu_items = []
-        super().__init__(root)
+        if provider:
+            super().__init__(root, postcommand=self._build)
+        else:
+            super().__init__(root)
         self.menu_items = menu_items
+        self.provider = provider
+        self.version = version
+        self._version = _UNBUILT
+        # The index of the first item: after any tear-off entry
+        last = self.index(tk.END)
+        self._first = 0 if last is None else last + 1
         for menu_item in menu_items:
-            menu_item.menu = self
-            self.add_command(label=menu_item.text, command=menu_item.command,
-                             underline=menu_item.underline,)
+            self.add_item(menu_item)
+
+    def invalidate(self) -> None:
+        """Rebuild the items the next time the menu is shown."""
+        self._version = _UNBUILT
+
+    def _build(self) -> None:
+        version = self.version() if self.version else _UNBUILT
+        if version is not _UNBUILT and version == self._version:
+            return
+        if self.index(tk.END) is not None:
+            self.delete(self._first, tk.END)
+        self.menu_items = list(self.provider())
+        for menu_item in self.menu_items:
+            self.add_item(menu_item)
+        self._version = version
+
+    def add_item(self, menu_item: 'MenuItem') -> None:
+        """Add menu_item as a command, recording its entry index."""
+        menu_item.menu = self
+        self.add_command(label=menu_item.text, command=menu_item.command,
+                         underline=menu_item.underline,
+                         state=menu_item.state)
+        menu_item.index = self.index(tk.END)
 
     def enable(self, enable: bool = True) -> None:
         enable_menu_items(self, self.menu_items, enable)
 
+    def set_states(self, states: dict['MenuItem', bool]) -> None:
+        """
+        Enable (True) or disable (False) each item in states.
+
+        Entries are configured by the index recorded by add_item, rather
+        than by label, which Tk matches against every entry, and items
+        already in the state asked for are left alone. If entries have
+        been added or removed other than by add_item, the indexes are
+        found again from the labels, and the states applied.
+        """
+        labels = None
+        for menu_item, enable in states.items():
+            state = tk.NORMAL if enable else tk.DISABLED
+            index = menu_item.index
+            if index is not None and not self._has_entry(index, menu_item):
+                if labels is None:
+                    labels = self._labels()
+                index = menu_item.index = labels.get(menu_item.text)
+            elif state == menu_item.state:
+                continue
+            menu_item.state = state
+            with contextlib.suppress(TclError):
+                if index is None:  # not added by add_item
+                    self.entryconfigure(menu_item.text, state=state)
+                else:
+                    self.tk.call(
+                        self._w, 'entryconfigure', index, '-state', state)
+
+    def _has_entry(self, index: int, menu_item: 'MenuItem') -> bool:
+        """Return True if the entry at index is menu_item's."""
+        try:
+            return self.entrycget(index, 'label') == menu_item.text
+        except TclError:  # no entry, or one without a label
+            return False
+
+    def _labels(self) -> dict[str, int]:
+        """Return the index of the first entry with each label."""
+        labels = {}
+        last = self.index(tk.END)
+        for index in range(0 if last is None else last + 1):
+            with contextlib.suppress(TclError):
+                labels.setdefault(self.entrycget(index, 'label'), index)
+        return labels
+
 
 class MenuItem():
     def __init__(
@@ -34,6 +124,8 @@ class MenuItem():
         self.dimmable = dimmable
         self.underline = None
         self.menu = None
+        self.index: int | None = None  # in menu
+        self.state = tk.NORMAL
 
         if 'disabled' in kwargs and kwargs['disabled']:
             self.state = tk.DISABLED
@@ -52,8 +144,15 @@ class MenuItem():
 
 
 def enable_menu_items(menu: Menu, menu_items: list, enable: bool) -> None:
+    states = {
+        menu_item: enable for menu_item in menu_items if menu_item.dimmable}
+    if isinstance(menu, Menu):
+        menu.set_states(states)
+        return
+
     state = tk.NORMAL if enable else tk.DISABLED
-    for menu_item in menu_items:
-        with contextlib.suppress(TclError):
-            if menu_item.dimmable:
+    for menu_item in states:
+        menu_item.state = state  # applied when the item is added
+        if menu is not None:
+            with contextlib.suppress(TclError):
                 menu.entryconfig(menu_item.text, state=state)
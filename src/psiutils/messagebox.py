@@ -3,9 +3,9 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import font
 from pathlib import Path
-from PIL import ImageTk, Image
 
 from psiutils.constants import PAD, Status
+from psiutils._images import photo_image
 
 from psiutils.text import Text
 
@@ -63,7 +63,7 @@ class MessageBox():
         if isinstance(self.icon, str):
             path = Path(Path(__file__).parent, 'images', icons[self.icon])
             try:
-                self.icon_image = ImageTk.PhotoImage(Image.open(path))
+                self.icon_image = photo_image(root, path)
             except FileNotFoundError:
                 pass
         else:
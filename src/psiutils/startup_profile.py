@@ -0,0 +1,203 @@
+"""
+Profile the cost of importing each psiutils module.
+
+Each module is imported in a fresh interpreter run with -X importtime,
+recording the import tree, the wall time and the growth in resident
+memory, and the time spent in the heavy third-party dependencies.
+
+Usage:
+
+    python -m psiutils.startup_profile
+    python -m psiutils.startup_profile psiutils.buttons --json now.json
+    python -m psiutils.startup_profile --baseline release.json
+
+With --baseline the exit status is 1 if any module got slower by more
+than REGRESSION (and NOISE_US), so the check can gate a release.
+"""
+import argparse
+import json
+import pkgutil
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import psiutils
+
+DEPENDENCIES = (
+    'tkinterweb', 'markdown', 'PIL', 'dateutil', 'structlog', 'psiconfig',
+    'tkcalendar', 'appdirs', 'numpy', 'pygments')
+SKIP_MODULES = ('psiutils.startup_profile', 'psiutils._build_icons')
+REGRESSION = 0.2  # fraction of the baseline import time
+NOISE_US = 5_000
+
+# Run in the fresh interpreter: prints the wall time and the growth in
+# peak RSS (KiB) of the import as JSON
+_PROBE = '''
+import json, sys, time
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def rss():
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+before = rss()
+start = time.perf_counter()
+import {module}
+wall = time.perf_counter() - start
+print(json.dumps({{'wall': wall, 'rss': rss() - before}}))
+'''
+
+
+@dataclass
+class ImportEntry():
+    """One line of the -X importtime tree."""
+    name: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class Profile():
+    module: str
+    wall: float = 0.0  # seconds
+    rss_kib: int = 0
+    tree: list[ImportEntry] = field(default_factory=list)
+    error: str = ''
+
+    @property
+    def import_us(self) -> int:
+        """The cumulative import time of the module itself."""
+        for entry in self.tree:
+            if entry.name == self.module:
+                return entry.cumulative_us
+        return 0
+
+    def dependencies(self) -> dict[str, int]:
+        """Return the time (us) spent importing each of DEPENDENCIES."""
+        times: dict[str, int] = {}
+        for entry in self.tree:
+            package = entry.name.split('.')[0]
+            if package in DEPENDENCIES:
+                times[package] = times.get(package, 0) + entry.self_us
+        return dict(sorted(times.items(), key=lambda item: -item[1]))
+
+
+def parse_importtime(text: str) -> list[ImportEntry]:
+    """Parse the stderr of `python -X importtime`."""
+    tree = []
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue  # the header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        tree.append(ImportEntry(
+            name.strip(), depth, int(self_us), int(cumulative_us)))
+    return tree
+
+
+def profile(module: str) -> Profile:
+    """Import module in a fresh interpreter and profile it."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         _PROBE.format(module=module)],
+        capture_output=True, text=True)
+    if result.returncode:
+        error = result.stderr.strip().splitlines()
+        return Profile(module, error=error[-1] if error else 'failed')
+
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    return Profile(
+        module, measured['wall'], measured['rss'],
+        parse_importtime(result.stderr))
+
+
+def package_modules() -> list[str]:
+    """Return the names of the psiutils modules."""
+    return [
+        f'psiutils.{info.name}'
+        for info in pkgutil.iter_modules(psiutils.__path__)
+        if f'psiutils.{info.name}' not in SKIP_MODULES
+    ]
+
+
+def report(profiles: list[Profile]) -> str:
+    lines = [f'{"module":<30} {"wall ms":>8} {"import ms":>10} '
+             f'{"rss KiB":>8}  dependencies']
+    for item in profiles:
+        if item.error:
+            lines.append(f'{item.module:<30} {item.error}')
+            continue
+        dependencies = ', '.join(
+            f'{name} {time / 1000:.1f}ms'
+            for name, time in item.dependencies().items())
+        lines.append(
+            f'{item.module:<30} {item.wall * 1000:>8.1f} '
+            f'{item.import_us / 1000:>10.1f} {item.rss_kib:>8}  '
+            f'{dependencies}')
+    return '\n'.join(lines)
+
+
+def compare(profiles: list[Profile], baseline: dict) -> list[str]:
+    """
+    Return a line for each module whose import time regressed against
+    baseline, a dict as saved by save.
+    """
+    regressions = []
+    for item in profiles:
+        before = baseline.get(item.module)
+        if item.error or not before:
+            continue
+        was = before['import_us']
+        now = item.import_us
+        if now - was > max(was * REGRESSION, NOISE_US):
+            regressions.append(
+                f'{item.module}: {was / 1000:.1f}ms -> {now / 1000:.1f}ms')
+    return regressions
+
+
+def save(profiles: list[Profile], path: Path) -> None:
+    data = {
+        item.module: {**asdict(item), 'import_us': item.import_us}
+        for item in profiles
+    }
+    Path(path).write_text(json.dumps(data, indent=2), encoding='utf-8')
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m psiutils.startup_profile',
+        description='Profile the import time of psiutils modules.')
+    parser.add_argument(
+        'modules', nargs='*', help='modules to profile (default: all)')
+    parser.add_argument('--json', type=Path, help='save the results')
+    parser.add_argument(
+        '--baseline', type=Path, help='compare with saved results')
+    args = parser.parse_args(argv)
+
+    profiles = [profile(module)
+                for module in args.modules or package_modules()]
+    print(report(profiles))
+    if args.json:
+        save(profiles, args.json)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        regressions = compare(profiles, baseline)
+        if regressions:
+            print('\nRegressions:')
+            print('\n'.join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
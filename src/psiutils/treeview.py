@@ -1,13 +1,45 @@
 
-from pathlib import Path
+import bisect
+import contextlib
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
-import dateutil  # type: ignore
-from dateutil.parser import parse  # type: ignore
-from PIL import Image, ImageTk
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
+from operator import itemgetter
+import time
+from typing import Callable, Iterator, TYPE_CHECKING
+
+from psiutils._row_model import RowModel
+from psiutils._column_types import sort_keys
+from psiutils._search_index import SearchIndex
+from psiutils._images import icon_image
+
+if TYPE_CHECKING:
+    from psiutils._columnar_model import ColumnarModel
 
 CHECK_BOX_SIZE = (20, 20)
+OVERSCAN = 5
+DEFAULT_ROW_HEIGHT = 20
+CHUNK_ROWS = 200
+CHUNK_SECONDS = 0.012  # leaves time to repaint within a 60Hz frame
+LOADER_BATCH_SIZE = 500
+LOADER_MAX_BATCHES = 8
+LOADER_POLL_MS = 20
+FILTER_DELAY_MS = 150
+# Event state bits of the modifiers of an additive click
+SHIFT_MASK = 0x1
+CONTROL_MASK = 0x4
+COMMAND_MASK = 0x8  # aqua
+
+
+def __getattr__(name: str) -> object:
+    # sqlite3 is imported when SqliteSource is first asked for
+    if name == 'SqliteSource':
+        from psiutils._sqlite_source import SqliteSource
+        return SqliteSource
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 @dataclass
@@ -15,16 +47,89 @@ class ColumnDefn():
     name: str
     heading: str
     width: int
+    dtype: str = 'str'  # of column arrays: 'str', 'int' or 'float'
+
+
+@dataclass
+class _Stream():
+    """The state of a chunked populate."""
+    rows: Iterator
+    append: Callable
+    replace: Callable
+    on_progress: Callable = None
+    on_done: Callable = None
+    on_cancel: Callable = None
+    collected: list = field(default_factory=list)  # keyed mode
+    job: str = None
 
 
 class Treeview(ttk.Treeview):
-    def __init__(self, master, column_defs: dict = None, **kwargs) -> None:
+    def __init__(
+            self,
+            master,
+            column_defs: dict = None,
+            virtual: bool = False,
+            overscan: int = OVERSCAN,
+            index_columns: tuple[str] = (),
+            key: str | Callable = None,
+            search_columns: tuple[str] = (),
+            **kwargs) -> None:
+        """
+        A ttk Treeview with column definitions and sorting.
+
+        :param virtual: if True the rows are held in `self.model` and
+            only the rows in the viewport (plus `overscan` rows) are
+            inserted into the widget. Scrolling reuses those items.
+        :param index_columns: names of columns to keep a value index
+            for, making select_item and select_items O(1) per value.
+        :param key: a column name or a function of the row values that
+            identifies a row. If given, populate updates the widget in
+            place, touching only the rows that changed, and keeps the
+            sort, selection, focus and scroll position.
+        :param search_columns: names of the columns filter searches.
+            Defaults to all the columns.
+        """
+        # Set before the widget exists: configure() consults them
+        self.virtual = virtual
+        self._yscrollcommand = kwargs.pop('yscrollcommand', None)
+        if not virtual and self._yscrollcommand:
+            kwargs['yscrollcommand'] = self._yscrollcommand
+
         super().__init__(master, **kwargs)
         if not column_defs:
             column_defs = {}
         self.column_defs = column_defs
+        self.model = RowModel()
+        self.overscan = overscan
+        self._iids: list[str] = []  # item of each row id (not virtual)
+        self._item_rows: tuple[list, dict] = None  # see _item_row_id
+        self._model_stale = False
+
+        # Virtual mode state
+        self._offset = 0
+        self._pool: list[str] = []
+        self._attached = 0
+        self._selected_rows: set[int] = set()
+        self._render_job = None
+        self._stream: _Stream = None
+
+        # Filter state
+        self._search: SearchIndex = None
+        self._filter_text = ''
+        self._filter_job = None
 
         self._configure_columns()
+        self._key = key
+        if isinstance(key, str):
+            self._key = itemgetter(self.columns[key])
+        self._index_columns = [self.columns[name] for name in index_columns]
+        for column in self._index_columns:
+            self.model.add_index(column)
+        self._search_columns = (
+            [self.columns[name] for name in search_columns] or None)
+        self.bind('<Destroy>', self._on_destroy, add='+')
+        if virtual:
+            self._bind_virtual()
 
     def _configure_columns(self) -> None:
         column_ids = [col_defn.name for col_defn in self.column_defs]
@@ -55,62 +160,709 @@ class Treeview(ttk.Treeview):
             for column, col_defn in enumerate(self.column_defs)
     }
 
-    def _heading(self, col_id: str, heading: str) -> Treeview.heading:
+    def _heading(self, col_id: str, heading: str) -> dict | None:
         return self.heading(
             col_id,
             text=heading,
             command=lambda c=col_id: self._sort_columns(c, False)
         )
 
-    def populate(self, values: dict[tuples]) -> None:
-        self.delete(*self.get_children())
-        for item in values:
-            item = self.insert('', 'end', values=item)
+    def populate(
+            self,
+            values: list[tuple] | dict[str, list],
+            chunked: bool = False,
+            on_progress: Callable = None,
+            on_done: Callable = None,
+            on_cancel: Callable = None) -> None:
+        """
+        Replace the rows of the Treeview with values.
+
+        values may also be a dict of column name -> column of values
+        (a list, array.array or numpy array). The rows are then held
+        column-wise in a ColumnarModel, typed by each ColumnDefn dtype,
+        which uses far less memory than row tuples and sorts and
+        filters whole columns at a time.
+
+        If chunked, values may be any iterable, e.g. a generator. Rows
+        are added in time-budgeted chunks scheduled with `after`, so the
+        window repaints while they stream in. on_progress(count) is
+        called after each chunk and on_done(count) at the end;
+        on_cancel(count) if cancel_populate stops it first.
+        """
+        self.cancel_populate()
+        self._reset_model()
+        if isinstance(values, dict):
+            columnar = self._columnar_model(values)
+            if not (chunked or self._key):
+                self.model = columnar
+                self._show_model()
+                return
+            values = columnar.rows
+
+        if chunked:
+            self._populate_chunked(
+                values, self.append_rows, self.populate,
+                on_progress, on_done, on_cancel)
+            return
+
+        if self._key:
+            self._populate_keyed(values)
+            return
+
+        self.model.load(values)
+        self._show_model()
+
+    def _columnar_model(self, columns: dict[str, list]) -> 'ColumnarModel':
+        # Imported here: numpy, if installed, is slow to import
+        from psiutils._columnar_model import ColumnarModel
+        column_defs = self.column_defs[1:]
+        return ColumnarModel(
+            [columns[col_defn.name] for col_defn in column_defs],
+            [col_defn.dtype for col_defn in column_defs])
 
+    def _show_model(self, **new_item) -> None:
+        """Show the rows of a freshly loaded model."""
+        if self.virtual:
+            self._offset = 0
+            self._selected_rows = set()
+            self._render()
+            self._rows_changed()
+            return
+
+        super().delete(*self.get_children())
+        insert = super().insert
+        self._iids = [
+            insert('', 'end', values=row, **new_item)
+            for row in self.model.rows
+        ]
+        self._model_stale = False
+        self._rows_changed()
+
+    def append_rows(self, values: list[tuple]) -> None:
+        """Add rows to the end of the Treeview."""
+        self._append(values)
+
+    def _append(self, values: list[tuple], **new_item) -> None:
+        if not hasattr(self.model, 'extend'):
+            self._reset_model()
+        if not self.virtual:
+            self._sync_model()
+        values = [tuple(row) for row in values]
+        start = len(self.model.rows)
+        shown = len(self.model)
+        self.model.extend(values, self._filter_mask(values, start))
+        if (self._search is None and self._filter_text
+                and self._filter_job is None):
+            self._filter_model()  # no index to extend: filter every row
+
+        if self.virtual:
+            if (self.model.sort_column is not None
+                    or shown < self._offset + self._visible_rows()
+                    + self.overscan):
+                self._render()
+            else:
+                self._update_scrollbar()
+            return
+
+        insert = super().insert
+        self._iids.extend(
+            insert('', 'end', values=row, **new_item)
+            for row in self.model.rows[start:]
+        )
+        if self._filter_text or self.model.sort_column is not None:
+            self._apply_order()
+
+    def _filter_mask(self, values: list[tuple], start: int) -> list | None:
+        """
+        Add values, the rows from row id start, to the search index and
+        return whether the filter shows each of them; None to show them
+        all. The rows already filtered are not searched again.
+        """
+        if self._search is None:
+            return None
+        self._search.extend(values)
+        if not self._filter_text or self._filter_job is not None:
+            return None  # a pending filter covers the new rows
+        matches = self._search.search(self._filter_text)
+        if matches is None:
+            return None
+        new = set(matches[bisect.bisect_left(matches, start):])
+        return [row_id in new for row_id in range(start, len(self._search))]
+
+    def set_source(self, source) -> None:
+        """
+        Show the rows of source, e.g. a SqliteSource, in a virtual
+        Treeview. Sorting and selection are delegated to the source;
+        populate switches back to rows held in Python.
+        """
+        if not self.virtual:
+            raise ValueError('set_source needs a virtual Treeview')
+        self.cancel_populate()
+        self._cancel_filter()
+        self._filter_text = ''
+        self._search = None
+        self.model = source
+        self._offset = 0
+        self._selected_rows = set()
+        self._render()
+
+    def refresh(self) -> None:
+        """Redisplay the model, e.g. after filtering a source."""
+        if self.virtual:
+            self._render()
+        else:
+            self._apply_order()
+
+    def _reset_model(self) -> None:
+        """Replace a source or a ColumnarModel with a RowModel."""
+        if isinstance(self.model, RowModel):
+            return
+        self.model = RowModel()
+        self._search = None
+        for column in self._index_columns:
+            self.model.add_index(column)
+
+    def _clear(self) -> None:
+        self.model.load([])
+        self._search = None
+        self._offset = 0
+        self._selected_rows = set()
+        if self.virtual:
+            self._render()
+            return
+        super().delete(*self.get_children())
+        self._iids = []
+        self._model_stale = False
+
+    def _populate_chunked(
+            self,
+            values,
+            append: Callable,
+            replace: Callable,
+            on_progress: Callable,
+            on_done: Callable,
+            on_cancel: Callable) -> None:
+        """
+        Stream values in with append; in keyed mode collect them and
+        apply the diff with replace once the iterable is exhausted.
+        """
+        if not self._key:
+            self._clear()
+        self._stream = _Stream(
+            iter(values), append, replace, on_progress, on_done, on_cancel)
+        # The first chunk is added now, so the first screenful is shown
+        # in the next repaint
+        self._populate_chunk()
+
+    def _populate_chunk(self) -> None:
+        stream = self._stream
+        stream.job = None
+        deadline = time.perf_counter() + CHUNK_SECONDS
+        finished = True
+        batch = []
+        for row in stream.rows:
+            batch.append(row)
+            if len(batch) >= CHUNK_ROWS:
+                self._add_chunk(stream, batch)
+                batch = []
+            if time.perf_counter() >= deadline:
+                finished = False
+                break
+        self._add_chunk(stream, batch)
+
+        count = self._stream_count(stream)
+        if not finished:
+            if stream.on_progress:
+                stream.on_progress(count)
+            # after(1) rather than after(0) lets Tk run its idle redraw
+            stream.job = self.after(1, self._populate_chunk)
+            return
+
+        self._stream = None
+        if self._key:
+            stream.replace(stream.collected)
+        if stream.on_progress:
+            stream.on_progress(count)
+        if stream.on_done:
+            stream.on_done(count)
+
+    def _add_chunk(self, stream: _Stream, batch: list[tuple]) -> None:
+        if not batch:
+            return
+        if self._key:
+            stream.collected.extend(batch)
+        else:
+            stream.append(batch)
+
+    def _stream_count(self, stream: _Stream) -> int:
+        if self._key:
+            return len(stream.collected)
+        return len(self.model.rows)
+
+    def cancel_populate(self) -> None:
+        """Stop a chunked populate: the rows added so far are kept."""
+        stream = self._stream
+        if stream is None:
+            return
+        self._stream = None
+        if stream.job is not None:
+            self.after_cancel(stream.job)
+        if stream.on_cancel:
+            stream.on_cancel(self._stream_count(stream))
+
+    def _on_destroy(self, event) -> None:
+        if event.widget is not self:
+            return
+        self._cancel_render()
+        self._cancel_filter()
+        self.cancel_populate()
+
+    def _populate_keyed(self, values: list[tuple], **new_item) -> None:
+        """
+        Replace the rows with values, matching old and new rows by key.
+
+        Only new rows are inserted, missing rows deleted and changed
+        rows updated; new_item holds item options for inserted rows.
+        """
+        if not self.virtual:
+            self._sync_model()
+        old_rows = self.model.rows
+        old_ids = {
+            self._key(row): row_id for row_id, row in enumerate(old_rows)}
+        sort = (self.model.sort_column, self.model.sort_reverse)
+        top_key = (self._key(self.model.row(self._offset))
+                   if self.virtual and len(self.model) else None)
+
+        # Checked before the model is touched, so a failed populate
+        # leaves the model and the items as they were
+        values = [tuple(row) for row in values]
+        keys = [self._key(row) for row in values]
+        new_ids = dict(zip(keys, range(len(keys))))
+        if len(new_ids) != len(keys):
+            raise ValueError('Keyed populate: keys are not unique')
+        self.model.load(values)
+
+        mapping = {
+            old_id: new_ids[key]
+            for key, old_id in old_ids.items() if key in new_ids
+        }
+        if sort[0] is not None:
+            self.model.sort(*sort)
+        self._remap_rows(mapping)
+        self._search = None
+        if self._filter_text:
+            self._filter_model()
+
+        if self.virtual:
+            if top_key in new_ids:
+                position = self.model.position(new_ids[top_key])
+                self._offset = self._offset if position is None else position
+            self._render()
+            return
+
+        old_iids = self._iids
+        iids = [None] * len(keys)
+        for old_id, row_id in mapping.items():
+            iid = old_iids[old_id]
+            iids[row_id] = iid
+            if old_rows[old_id] != self.model.rows[row_id]:
+                self.item(iid, values=self.model.rows[row_id])
+        kept = set(mapping)
+        removed = [
+            iid for old_id, iid in enumerate(old_iids) if old_id not in kept]
+        if removed:
+            super().delete(*removed)
+        for row_id, row in enumerate(self.model.rows):
+            if iids[row_id] is None:
+                iids[row_id] = super().insert(
+                    '', 'end', values=row, **new_item)
+        self._iids = iids
+        self._model_stale = False
+
+        order = [iids[row_id] for row_id in self.model.order]
+        if list(self.get_children()) != order:
+            self.set_children('', *order)
+
+    def _remap_rows(self, mapping: dict[int, int]) -> None:
+        """Carry per-row state over a keyed populate: old -> new row id."""
+        self._selected_rows = {
+            mapping[row_id] for row_id in self._selected_rows
+            if row_id in mapping
+        }
 
     def select_item(self, column: int | str, value: str) -> None:
         if isinstance(column, str):
             column = self.columns[column]
 
-        for iid in self.get_children():
-            values = self.item(iid, "values")
-            if values[column] == value:
-                self.selection_set(iid)
-                break
+        if not self.virtual:
+            self._sync_model()
+        position = self.model.find(column, value)
+        if position is None:
+            return
 
-    def _sort_columns(self, col: int, reverse: bool) -> None:
+        row_id = self.model.row_id(position)
+        if self.virtual:
+            self._selected_rows = {row_id}
+            self._see_position(position)
+            self._render()
+        else:
+            self.selection_set(self._iids[row_id])
+
+    def select_items(self, column: int | str, values: list) -> None:
+        """Select every row whose value in column is one of values."""
+        if isinstance(column, str):
+            column = self.columns[column]
+
+        if not self.virtual:
+            self._sync_model()
+        row_ids = self.model.lookup(column, values)
+        if self.virtual:
+            self._selected_rows = set(row_ids)
+            self._render()
+        else:
+            iids = self._iids
+            self.selection_set([iids[row_id] for row_id in row_ids])
+
+    def filter(self, text: str, delay: int = FILTER_DELAY_MS) -> None:
+        """
+        Show only the rows containing text, ignoring case and accents,
+        e.g. as the user types into an Entry; blank text shows all rows.
+
+        The filter is applied delay ms after the last call, so a burst
+        of keystrokes costs one update. It uses an index built once per
+        populate, and text that extends the previous text only rechecks
+        the rows that matched before. The filter is kept when the rows
+        are replaced or added to.
+        """
+        if not hasattr(self.model, 'rows'):
+            raise ValueError('filter needs rows held in Python: '
+                             'filter the source instead')
+        self._filter_text = text
+        self._cancel_filter()
+        if delay:
+            self._filter_job = self.after(delay, self._apply_filter)
+        else:
+            self._apply_filter()
+
+    def _cancel_filter(self) -> None:
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+
+    def _apply_filter(self) -> None:
+        self._filter_job = None
+        if not self.virtual:
+            self._sync_model()
+        self._filter_model()
+        self._offset = 0
+        self._apply_order()
+
+    def _filter_model(self) -> None:
+        """Hide the rows of the model that do not match the filter."""
+        if self._search is None:
+            self._search = SearchIndex(self.model.rows, self._search_columns)
+        matches = self._search.search(self._filter_text)
+
+        mask = None
+        if matches is not None:
+            mask = [False] * len(self._search)
+            for row_id in matches:
+                mask[row_id] = True
+        self.model.filter(mask)
+
+    def _rows_changed(self) -> None:
+        """Drop the search index, and filter the new rows."""
+        self._search = None
+        if self._filter_text:
+            self._cancel_filter()
+            self._apply_filter()
+
+    def _sort_columns(self, col: str, reverse: bool) -> None:
         """Sort the Treeview by column."""
-        children = [
-                (self.set(child, col), child) for child in self.get_children('')
-            ]
-        date_children = self._get_date_children(children)
-        if date_children:
-            children = date_children
+        column = self._column_index(col)
+        if column is not None:
+            if not self.virtual:
+                self._sync_model()
+            self.model.sort(column, reverse)
+            self._apply_order()
+
+        self.heading(col, command=lambda: self._sort_columns(col, not reverse))
+
+    def _column_index(self, col: str) -> int | None:
+        """Return the index into the row values of the column col."""
+        if col == '#0':
+            return None
+        return self.columns[col]
+
+    def insert(self, parent, index, iid=None, **kw) -> str:
+        if self.virtual:
+            raise ValueError('A virtual Treeview shows its model: '
+                             'use populate or append_rows')
+        self._model_stale = True
+        return super().insert(parent, index, iid, **kw)
+
+    def delete(self, *items) -> None:
+        if self.virtual:
+            raise ValueError('A virtual Treeview shows its model: '
+                             'use populate')
+        self._model_stale = True
+        super().delete(*items)
+
+    def item(self, item, option=None, **kw):
+        if 'values' in kw or isinstance(option, dict) and 'values' in option:
+            self._model_stale = True
+        return super().item(item, option, **kw)
+
+    def set(self, item, column=None, value=None):
+        if value is not None:
+            self._model_stale = True
+        return super().set(item, column, value)
+
+    def _sync_model(self) -> None:
+        """
+        Reload the model if items were changed other than by populate,
+        keeping the sort and the filter.
+
+        The rows hidden by filter are detached items, so the model is
+        rebuilt from the items it knew that still exist, followed by
+        the items inserted since.
+        """
+        if not self._model_stale:
+            return
+        known = set(self._iids)
+        iids = [iid for iid in self._iids if self.exists(iid)]
+        iids.extend(iid for iid in self.get_children() if iid not in known)
+        self._iids = iids
+        sort = (self.model.sort_column, self.model.sort_reverse)
+        self.model.load([self.item(iid, "values") for iid in iids])
+        self._model_stale = False
+        self._search = None
+        if sort[0] is not None:
+            self.model.sort(*sort)
+        if self._filter_text:
+            self._filter_model()
+        if sort[0] is not None or self._filter_text:
+            self._apply_order()
+
+    def _apply_order(self) -> None:
+        """Show the rows in model order: one bulk reorder of the items."""
+        if self.virtual:
+            self._render()
+            return
+        iids = self._iids
+        self.set_children('', *[iids[row_id] for row_id in self.model.order])
+
+    # Virtual mode
+
+    def configure(self, cnf=None, **kwargs):
+        # In virtual mode the scrollbar reflects the model, not the items
+        if self.virtual and (isinstance(cnf, dict) or kwargs):
+            kwargs = {**(cnf or {}), **kwargs}
+            cnf = None
+            if 'yscrollcommand' in kwargs:
+                self._yscrollcommand = kwargs.pop('yscrollcommand')
+                self._update_scrollbar()
+                if not kwargs:
+                    return None
+        return super().configure(cnf, **kwargs)
+
+    config = configure
+
+    def yview(self, *args):
+        if not self.virtual:
+            return super().yview(*args)
+        if not args:
+            return self._fractions()
+
+        if args[0] == 'moveto':
+            self._scroll_to(round(float(args[1]) * len(self.model)))
+        elif args[0] == 'scroll':
+            step = self._visible_rows() if args[2] == 'pages' else 1
+            self._scroll_to(self._offset + int(args[1]) * step)
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        self.yview('moveto', fraction)
+
+    def yview_scroll(self, number: int, what: str) -> None:
+        self.yview('scroll', number, what)
+
+    def _bind_virtual(self) -> None:
+        self.bind('<Configure>', self._schedule_render, add='+')
+        self.bind('<<TreeviewSelect>>', self._sync_selection, add='+')
+        self.bind('<ButtonPress-1>', self._on_click, add='+')
+        self.bind('<MouseWheel>', self._on_mouse_wheel)
+        self.bind('<Button-4>', lambda e: self._wheel(-1))
+        self.bind('<Button-5>', lambda e: self._wheel(1))
+        self.bind('<Up>', lambda e: self._move_focus(-1))
+        self.bind('<Down>', lambda e: self._move_focus(1))
+        self.bind('<Prior>', lambda e: self._move_focus(-self._visible_rows()))
+        self.bind('<Next>', lambda e: self._move_focus(self._visible_rows()))
+        self.bind('<Home>', lambda e: self._move_focus(-len(self.model)))
+        self.bind('<End>', lambda e: self._move_focus(len(self.model)))
+
+    def _on_mouse_wheel(self, event) -> str:
+        return self._wheel(-1 if event.delta > 0 else 1)
+
+    def _wheel(self, direction: int) -> str:
+        self.yview('scroll', direction * 3, 'units')
+        return 'break'
+
+    def _visible_rows(self) -> int:
+        """Return the number of rows that fit in the viewport."""
+        first, last = super().yview()
+        if self._attached and last < 1:
+            return max(1, int((last - first) * self._attached))
+
+        rowheight = ttk.Style(self).lookup('Treeview', 'rowheight')
         try:
-            children.sort(key=lambda t: float(t[0]), reverse=reverse)
-        except TypeError:
-            children.sort(key=lambda t: t[0], reverse=reverse)
-        except ValueError:
-            children.sort(reverse=reverse)
+            rowheight = int(rowheight)
+        except (TypeError, ValueError):
+            rowheight = DEFAULT_ROW_HEIGHT
+        return max(int(self.cget('height')),
+                   self.winfo_height() // max(rowheight, 1))
 
-        for index, (val, child) in enumerate(children):
-            self.move(child, '', index)
+    def _fractions(self) -> tuple[float, float]:
+        total = len(self.model)
+        if not total:
+            return (0.0, 1.0)
+        last = min(self._offset + self._visible_rows(), total)
+        return (self._offset / total, last / total)
 
-        self.heading(col, command=lambda: self._sort_columns(col, not reverse))
+    def _update_scrollbar(self) -> None:
+        if self._yscrollcommand:
+            self._yscrollcommand(*self._fractions())
+
+    def _scroll_to(self, offset: int) -> None:
+        max_offset = max(len(self.model) - self._visible_rows(), 0)
+        offset = min(max(offset, 0), max_offset)
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _see_position(self, position: int) -> None:
+        """Scroll so that the row at display position is visible."""
+        visible = self._visible_rows()
+        if position < self._offset:
+            self._scroll_to(position)
+        elif position >= self._offset + visible:
+            self._scroll_to(position - visible + 1)
+
+    def _schedule_render(self, *args) -> None:
+        if self._render_job is None:
+            self._render_job = self.after_idle(self._render)
+
+    def _cancel_render(self, *args) -> None:
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+            self._render_job = None
+
+    def _render(self) -> None:
+        """Copy the rows in the viewport into the recycled items."""
+        self._render_job = None
+        total = len(self.model)
+        self._offset = min(self._offset,
+                           max(total - self._visible_rows(), 0))
+        count = min(self._visible_rows() + self.overscan,
+                    total - self._offset)
+
+        while len(self._pool) < count:
+            self._pool.append(super().insert('', 'end'))
+        if count != self._attached:
+            self.set_children('', *self._pool[:count])
+            self._attached = count
+
+        selected = []
+        rows = self.model.window(self._offset, count)
+        for index, values in enumerate(rows):
+            iid = self._pool[index]
+            row_id = self.model.row_id(self._offset + index)
+            self.item(iid, values=values, **self._row_options(row_id))
+            if row_id in self._selected_rows:
+                selected.append(iid)
 
-    def _get_date_children(self, children) -> list:
+        super().yview_moveto(0)
+        if set(selected) != set(self.selection()):
+            self.selection_set(selected)
+        self._update_scrollbar()
+
+    def _row_options(self, row_id: int) -> dict:
+        """Return extra item options for the row: see CheckTreeView."""
+        return {}
+
+    def _pool_position(self, iid: str) -> int | None:
+        """Return the display position of the row shown in item iid."""
         try:
-            date_children = []
-            for child in children:
-                if len(child[0]) < 8:
-                    is_date = False
-                    break
-                date = parse(child[0])
-                date_children.append((date, child[1]))
-            return date_children
-        except dateutil.parser._parser.ParserError:
-            return []
+            index = self._pool.index(iid)
+        except ValueError:
+            return None
+        if index >= self._attached:
+            return None
+        return self._offset + index
+
+    def _item_row_id(self, iid: str) -> int | None:
+        """Return the row id of the row shown in item iid."""
+        if self.virtual:
+            position = self._pool_position(iid)
+            return None if position is None else self.model.row_id(position)
+
+        self._sync_model()
+        iids = self._iids
+        cache = self._item_rows
+        if (cache is None or cache[0] is not iids
+                or len(cache[1]) != len(iids)):
+            cache = self._item_rows = (
+                iids, {item: row_id for row_id, item in enumerate(iids)})
+        return cache[1].get(iid)
+
+    def _on_click(self, event) -> None:
+        """
+        A click that is not a Ctrl, Shift (or Command) click replaces
+        the selection, including rows scrolled out of the pool. The
+        class binding then selects the item and _sync_selection merges
+        it.
+        """
+        mode = str(self['selectmode'])
+        if mode == 'none':
+            return
+        additive = SHIFT_MASK | CONTROL_MASK
+        if self.tk.call('tk', 'windowingsystem') == 'aqua':
+            additive |= COMMAND_MASK
+        if mode == 'extended' and event.state & additive:
+            return
+        row_id = self._item_row_id(self.identify_row(event.y))
+        if row_id is not None:
+            self._selected_rows = {row_id}
+
+    def _sync_selection(self, *args) -> None:
+        """Merge the selection of the items in the pool into the rows."""
+        selection = set(self.selection())
+        for index, iid in enumerate(self._pool[:self._attached]):
+            row_id = self.model.row_id(self._offset + index)
+            if iid in selection:
+                self._selected_rows.add(row_id)
+            else:
+                self._selected_rows.discard(row_id)
+
+    def _move_focus(self, step: int) -> str:
+        if not len(self.model):
+            return 'break'
+        position = self._pool_position(self.focus())
+        if position is None:
+            position = self._offset
+        position = min(max(position + step, 0), len(self.model) - 1)
+        self._see_position(position)
 
+        iid = self._pool[position - self._offset]
+        self.focus(iid)
+        if str(self['selectmode']) != 'none':
+            self._selected_rows = {self.model.row_id(position)}
+            self.selection_set(iid)
+        return 'break'
+
+    def selected_rows(self) -> list[tuple]:
+        """Return the values of the selected rows (virtual mode)."""
+        return self.model.values(self._selected_rows)
 
 
 def sort_treeview(tree: Treeview, col: int, reverse: bool) -> None:
@@ -118,31 +870,11 @@ def sort_treeview(tree: Treeview, col: int, reverse: bool) -> None:
     print('*** psiutils  "sort_treeview" called: DEPRECATED ***')
     print('Use psiutils.Treeviw class instead!!!')
 
-    children = [
-            (tree.set(child, col), child) for child in tree.get_children('')
-        ]
-    is_date = True
-    try:
-        date_children = []
-        for child in children:
-            if len(child[0]) < 8:
-                is_date = False
-                break
-            date = parse(child[0])
-            date_children.append((date, child[1]))
-    except dateutil.parser._parser.ParserError:
-        is_date = False
-    if is_date:
-        children = date_children
-    try:
-        children.sort(key=lambda t: float(t[0]), reverse=reverse)
-    except TypeError:
-        children.sort(key=lambda t: t[0], reverse=reverse)
-    except ValueError:
-        children.sort(reverse=reverse)
-
-    for index, (val, child) in enumerate(children):
-        tree.move(child, '', index)
+    children = tree.get_children('')
+    _, keys = sort_keys([tree.set(child, col) for child in children])
+    order = sorted(range(len(children)), key=keys.__getitem__,
+                   reverse=reverse)
+    tree.set_children('', *[children[index] for index in order])
 
     tree.heading(col, command=lambda: sort_treeview(tree, col, not reverse))
 
@@ -158,12 +890,18 @@ class CheckTreeView(Treeview):
         :param column_defs: a tuple defining column (key, text, width)
         Other parameters are passed to the `TreeView`.
         """
+        self._checked_rows: set[int] = set()
+        self._check_new_rows = False
         super().__init__(master, column_defs, **kwargs)
         self["show"] = "tree headings"
         (
             self.unchecked_image,
             self.checked_image
         ) = self._get_checkbox_images()
+        # The check box is the image of the item's tag, so checking any
+        # number of items is a tag add and a tag remove
+        self.tag_configure('unchecked', image=self.unchecked_image)
+        self.tag_configure('checked', image=self.checked_image)
 
         if "selectmode" not in kwargs:
             kwargs["selectmode"] = "none"
@@ -171,46 +909,167 @@ class CheckTreeView(Treeview):
             kwargs["show"] = "tree"
 
     def _get_checkbox_images(
-            self) -> tuple[ImageTk.PhotoImage, ImageTk.PhotoImage]:
-
-        icon_path = f'{Path(__file__).parent}/icons/'
-        unchecked_img = Image.open(f"{icon_path}checkbox_unchecked.png")
-        unchecked_img = unchecked_img.resize(CHECK_BOX_SIZE, Image.LANCZOS)
-        unchecked = ImageTk.PhotoImage(unchecked_img)
-
-        checked_img = tk.PhotoImage(file=f"{icon_path}checkbox_checked.png")
-        checked_img = Image.open(f"{icon_path}checkbox_checked.png")
-        checked_img = checked_img.resize(CHECK_BOX_SIZE, Image.LANCZOS)
-        checked = ImageTk.PhotoImage(checked_img)
-        return (unchecked, checked)
-
-    def populate(self, values: list[tuple], checked: bool = False) -> None:
-        self.delete(*self.get_children())
-        item_checked = (self.checked_image
-                        if checked else self.unchecked_image)
-        for item in values:
-            iid = self.insert(
-                parent='',
-                index='end',
-                image=item_checked,
-                values=item
-            )
-            if checked:
-                self.item(iid, tags=("checked",))
-            else:
-                self.item(iid, tags=("unchecked"))
+            self) -> tuple[tk.PhotoImage, tk.PhotoImage]:
+        return (
+            icon_image(self, 'checkbox_unchecked', CHECK_BOX_SIZE),
+            icon_image(self, 'checkbox_checked', CHECK_BOX_SIZE),
+        )
+
+    def _remap_rows(self, mapping: dict[int, int]) -> None:
+        super()._remap_rows(mapping)
+        checked_rows = {
+            mapping[row_id] for row_id in self._checked_rows
+            if row_id in mapping
+        }
+        if self._check_new_rows:
+            kept = set(mapping.values())
+            checked_rows |= {
+                row_id for row_id in range(len(self.model.rows))
+                if row_id not in kept
+            }
+        self._checked_rows = checked_rows
+
+    def _row_options(self, row_id: int) -> dict:
+        return self._new_item(row_id in self._checked_rows)
+
+    def append_rows(self, values: list[tuple], checked: bool = False) -> None:
+        """Add rows to the end of the Treeview."""
+        values = list(values)
+        if not hasattr(self.model, 'extend'):
+            self._reset_model()
+        if not self.virtual:
+            self._sync_model()
+        if checked:
+            start = len(self.model.rows)
+            self._checked_rows.update(range(start, start + len(values)))
+        self._append(values, **self._new_item(checked))
+
+    def _clear(self) -> None:
+        self._checked_rows = set()
+        super()._clear()
+
+    def set_source(self, source) -> None:
+        self._checked_rows = set()
+        super().set_source(source)
+
+    def _reset_model(self) -> None:
+        if not isinstance(self.model, RowModel):
+            self._checked_rows = set()  # the row ids of the old model
+        super()._reset_model()
+
+    def _new_item(self, checked: bool) -> dict:
+        """Return the item options for a new row."""
+        return {'tags': ("checked",) if checked else ("unchecked",)}
+
+    def check_all(self) -> None:
+        """Check every row, including rows hidden by filter."""
+        self._check_rows(set(self.model.row_ids()))
+
+    def uncheck_all(self) -> None:
+        """Uncheck every row, including rows hidden by filter."""
+        self._check_rows(set())
+
+    def invert(self) -> None:
+        """Check the unchecked rows and uncheck the checked ones."""
+        self._check_rows(set(self.model.row_ids()) - self._checked_rows)
+
+    def set_checked(self, column: int | str, values: list) -> None:
+        """
+        Check exactly the rows whose value in column is in values, and
+        uncheck all the others, including rows hidden by filter.
+
+        Values are compared as strings, or as numbers in a numeric
+        column of a ColumnarModel. Values that match no row are
+        ignored, so values that match nothing uncheck every row.
+        """
+        if isinstance(column, str):
+            column = self.columns[column]
+        if not self.virtual:
+            self._sync_model()
+        self._check_rows(set(self.model.lookup(column, values)))
+
+    def _check_rows(self, row_ids: set[int]) -> None:
+        """Make row_ids the checked rows, retagging only the changes."""
+        if not self.virtual:
+            self._sync_model()
+        changed = self._checked_rows ^ row_ids
+        self._checked_rows = row_ids
+        if self.virtual:
+            self._render()
+            return
+
+        iids = self._iids
+        self._retag(
+            [iids[row_id] for row_id in changed if row_id in row_ids],
+            'unchecked', 'checked')
+        self._retag(
+            [iids[row_id] for row_id in changed if row_id not in row_ids],
+            'checked', 'unchecked')
+
+    def _retag(self, iids: list[str], old: str, new: str) -> None:
+        if iids:
+            self.tk.call(self._w, 'tag', 'remove', old, iids)
+            self.tk.call(self._w, 'tag', 'add', new, iids)
+
+    def _sync_model(self) -> None:
+        if not self._model_stale:
+            return
+        super()._sync_model()
+        # Items inserted directly carry their state in their tags
+        self._checked_rows = {
+            row_id for row_id, iid in enumerate(self._iids)
+            if 'checked' in self.item(iid, 'tags')
+        }
+
+    def populate(
+            self,
+            values: list[tuple],
+            checked: bool = False,
+            chunked: bool = False,
+            on_progress: Callable = None,
+            on_done: Callable = None,
+            on_cancel: Callable = None) -> None:
+        self.cancel_populate()
+        self._reset_model()
+        if isinstance(values, dict):
+            columnar = self._columnar_model(values)
+            if not (chunked or self._key):
+                self.model = columnar
+                self._show_checked(checked)
+                return
+            values = columnar.rows
+
+        if chunked:
+            self._populate_chunked(
+                values,
+                partial(self.append_rows, checked=checked),
+                partial(self.populate, checked=checked),
+                on_progress, on_done, on_cancel)
+            return
+
+        if self._key:
+            self._check_new_rows = checked
+            self._populate_keyed(values, **self._new_item(checked))
+            return
+
+        self.model.load(values)
+        self._show_checked(checked)
+
+    def _show_checked(self, checked: bool) -> None:
+        self._checked_rows = (
+            set(self.model.row_ids()) if checked else set())
+        self._show_model(**self._new_item(checked))
 
     def item_click(self, event) -> int:
         iid = self.identify_row(event.y)
         if not iid:
             return
 
-        current_img = self.item(iid, "image")[0]
-        if current_img == str(self.unchecked_image):
-            self.item(iid, image=self.checked_image, tags=("checked",))
-        else:
-            self.item(iid, image=self.unchecked_image, tags=("unchecked"))
-
+        row_id = self._item_row_id(iid)
+        if row_id is None:
+            return
+        self._checked_rows ^= {row_id}
+        self.item(iid, **self._row_options(row_id))
         return "break"
 
     def checked_items(self) -> list[tuple]:
@@ -225,11 +1084,149 @@ class CheckTreeView(Treeview):
             [("docs", "report.pdf", "Read this file"),
             ("code", "main.py", "Fix bug")]
         """
-        checked_items = []
+        if not self.virtual:
+            self._sync_model()
+        return self.model.values(self._checked_rows)
+
+
+_LOADER_DONE = object()
+
+
+class TreeviewLoader():
+    """
+    Load rows into a Treeview from a producer run in a worker thread.
+
+    producer is called in the worker thread and returns an iterable of
+    rows, e.g. a generator reading a file or a database cursor. Rows are
+    passed to the Tk thread in batches through a bounded queue, which is
+    drained by `after` polling; a producer that gets more than
+    max_batches ahead of the widget waits. The load is cancelled if the
+    Treeview is destroyed.
+
+    Usage:
+
+        loader = TreeviewLoader(
+            tree, lambda: read_rows(path), on_done=self._loaded)
+        loader.start()
+    """
+    def __init__(
+            self,
+            tree: Treeview,
+            producer: Callable,
+            batch_size: int = LOADER_BATCH_SIZE,
+            max_batches: int = LOADER_MAX_BATCHES,
+            poll_ms: int = LOADER_POLL_MS,
+            on_progress: Callable = None,
+            on_done: Callable = None,
+            on_error: Callable = None) -> None:
+        """
+        :param on_progress: called with the row count after each drain.
+        :param on_done: called with the row count when all are loaded.
+        :param on_error: called with the exception if the producer
+            raises; if not given the exception is raised in the Tk
+            thread.
+        """
+        self.tree = tree
+        self.producer = producer
+        self.batch_size = batch_size
+        self.poll_ms = poll_ms
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.count = 0
+        self.running = False
+
+        self._queue = queue.Queue(maxsize=max_batches)
+        self._cancelled = threading.Event()
+        self._thread = None
+        self._job = None
+
+    def start(self) -> None:
+        """Clear the Treeview and start loading."""
+        self.tree.populate([])
+        self.running = True
+        self.tree.bind('<Destroy>', self._on_destroy, add='+')
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+        self._job = self.tree.after(self.poll_ms, self._drain)
+
+    def cancel(self) -> None:
+        """Stop loading: the rows loaded so far are kept."""
+        if not self.running:
+            return
+        self.running = False
+        self._cancelled.set()
+        if self._job is not None:
+            with contextlib.suppress(tk.TclError):
+                self.tree.after_cancel(self._job)
+            self._job = None
+
+    def _on_destroy(self, event) -> None:
+        if event.widget is self.tree:
+            self.cancel()
+
+    # Worker thread
+
+    def _produce(self) -> None:
+        try:
+            batch = []
+            for row in self.producer():
+                if self._cancelled.is_set():
+                    return
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    if not self._put(batch):
+                        return
+                    batch = []
+            if batch and not self._put(batch):
+                return
+            self._put(_LOADER_DONE)
+        except Exception as err:
+            self._put(err)
+
+    def _put(self, item) -> bool:
+        """Queue item, waiting while the queue is full; False if cancelled."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    # Tk thread
+
+    def _drain(self) -> None:
+        self._job = None
+        if not self.running:
+            return
+
+        deadline = time.perf_counter() + CHUNK_SECONDS
+        while time.perf_counter() < deadline:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _LOADER_DONE:
+                self._finish()
+                return
+            if isinstance(item, Exception):
+                self._fail(item)
+                return
+            self.tree.append_rows(item)
+            self.count += len(item)
+
+        if self.on_progress:
+            self.on_progress(self.count)
+        self._job = self.tree.after(self.poll_ms, self._drain)
+
+    def _finish(self) -> None:
+        self.running = False
+        if self.on_done:
+            self.on_done(self.count)
 
-        for iid in self.get_children(''):
-            tags = self.item(iid, "tags")
-            if "checked" in tags:
-                values = self.item(iid, "values")
-                checked_items.append(values)
-        return checked_items
+    def _fail(self, err: Exception) -> None:
+        self.running = False
+        if not self.on_error:
+            raise err
+        self.on_error(err)
@@ -6,20 +6,30 @@ import tkinter as tk
 import ctypes
 from typing import Any
 import platform
+from typing import TYPE_CHECKING
 
-from psiconfig import TomlConfig
-from psiutils._logger import psi_logger as logger
 from psiutils.constants import DEFAULT_GEOMETRY
+from psiutils._geometry import geometry_writer, saved_geometry
 from psiutils.text import Text
+
+if TYPE_CHECKING:
+    from psiconfig import TomlConfig
 # if 'XDG_CURRENT_DESKTOP' in os.environ:
 #     from psiutils._notify import _notify
 #     notify = _notify
 
 
-psi_logger = logger
 txt = Text()
 
 
+def __getattr__(name: str) -> object:
+    # structlog is imported when the logger is first asked for
+    if name in ('psi_logger', 'logger'):
+        from psiutils._logger import psi_logger
+        return psi_logger
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 def display_icon(root: tk.Tk, icon_file_path: str,
                  ignore_error: bool = True) -> None:
     if platform.system() == 'Windows':
@@ -77,22 +87,31 @@ def enable_frame(parent: tk.Frame, enable: bool = True) -> None:
             child.configure(state=state)
 
 
-def geometry(config: TomlConfig, file: Path, default: str = '') -> str:
+def geometry(
+        config: 'TomlConfig | str | Path',
+        file: Path,
+        default: str = '') -> str:
+    """
+    Return the saved geometry of the window of file.
+
+    config is a TomlConfig or the path of its file. The geometry table
+    is read from a process-wide cache: see load_document.
+    """
     if not default:
         default = DEFAULT_GEOMETRY
-    try:
-        return config.geometry[Path(file).stem]
-    except KeyError:
-        return default
+    return saved_geometry(config).get(Path(file).stem, default)
 
 
 def window_resize(master: tk.Tk, file: str, *args) -> None:
+    """
+    Record the geometry of master.root, for binding to <Configure>.
+
+    The geometry is saved in master.config once resizing has settled:
+    see GeometryWriter.
+    """
     match = master.root.geometry().split('+')
     window_geometry = (
         f'{master.root.winfo_width()}x{master.root.winfo_height()}+'
         f'{master.root.winfo_x()}+{match[2]}')
-    master.config.read()
-    new_geometry = master.config.geometry
-    new_geometry[Path(file).stem] = window_geometry
-    master.config.update('geometry', new_geometry)
-    master.config.save()
+    geometry_writer(master.config).set(
+        master.root, Path(file).stem, window_geometry)
@@ -2,23 +2,45 @@
 import tkinter as tk
 from tkinter import ttk
 import contextlib
+import itertools
 
 
 from psiutils.constants import PAD, COLOURS
-from psiutils._about_frame import AboutFrame as AboutFrameMaster
 from psiutils._scrolling_canvas import ScrollingCanvas as ScrollingCanvasMaster
 
 HAND = 'hand2'
 DIM_TEXT = '#555'
+MODIFY_COMMANDS = ('insert', 'delete', 'replace')
+DIRTY_MARK = 'psi_dirty'
 
-About = AboutFrameMaster
 ScrollingCanvas = ScrollingCanvasMaster
 
 
+def __getattr__(name: str) -> object:
+    # The about frame is imported on first use: see _about_frame
+    if name in ('About', 'AboutFrameMaster'):
+        from psiutils._about_frame import AboutFrame
+        return AboutFrame
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 class PsiText(tk.Text):
-    def __init__(self, *args, **kwargs):
-        """A text widget that reports on internal widget commands."""
+    def __init__(self, *args, coalesce: bool = False, **kwargs):
+        """
+        A text widget that reports on internal widget commands.
+
+        Each insert, delete and replace generates <<TextModified>>.
+        With coalesce, the changes made before the widget next goes
+        idle generate a single <<TextModified>>, and dirty_ranges then
+        holds the merged (start, end) indexes of the changed text.
+        """
         tk.Text.__init__(self, *args, **kwargs)
+        self.coalesce = coalesce
+        self.dirty_ranges: list[tuple[str, str]] = []
+        # (start, end) mark pairs: Tk keeps them in place as text changes
+        self._dirty: list[tuple[str, str]] = []
+        self._marks = itertools.count()
+        self._notify_job = None
 
         # create a proxy for the underlying widget
         self._orig = f'{self._w}_orig'
@@ -27,13 +49,104 @@ class PsiText(tk.Text):
 
     def _proxy(self, command, *args):
         cmd = (self._orig, command) + args
-        result = self.tk.call(cmd)
+        if command not in MODIFY_COMMANDS:
+            return self.tk.call(cmd)
 
-        if command in ('insert', 'delete', 'replace'):
+        if not self.coalesce:
+            result = self.tk.call(cmd)
             self.event_generate('<<TextModified>>')
-
+            return result
+
+        marks = self._mark_change(command, args)
+        try:
+            result = self.tk.call(cmd)
+        finally:
+            self._add_dirty(*marks)
+            if self._notify_job is None:
+                self._notify_job = self.after_idle(self._notify)
         return result
 
+    def _mark_change(self, command: str, args: tuple) -> tuple[str, str]:
+        """Return a pair of marks around the text command will change."""
+        if command == 'insert':
+            indexes = args[:1]
+        elif command == 'replace':
+            indexes = args[:2]
+        else:
+            indexes = args
+            if len(args) % 2:
+                indexes += (f'{args[-1]}+1c',)
+        last = self._position('end-1c')
+        positions = [min(self._position(index), last) for index in indexes]
+
+        number = next(self._marks)
+        start, end = f'{DIRTY_MARK}{number}s', f'{DIRTY_MARK}{number}e'
+        self.tk.call(
+            self._orig, 'mark', 'set', start, _index(min(positions)))
+        self.tk.call(self._orig, 'mark', 'gravity', start, tk.LEFT)
+        self.tk.call(self._orig, 'mark', 'set', end, _index(max(positions)))
+        return start, end
+
+    def _add_dirty(self, start: str, end: str) -> None:
+        """
+        Add the range between two marks to the dirty ranges.
+
+        Typing or loading text extends the latest range, so only that
+        one is checked: the others are merged by _notify, so that a
+        burst of separate edits costs a constant number of Tk calls
+        each.
+        """
+        if self._dirty:
+            pair = self._dirty[-1]
+            first, last = self._position(start), self._position(end)
+            pair_first, pair_last = map(self._position, pair)
+            if first <= pair_last and last >= pair_first:
+                if first < pair_first:
+                    self.tk.call(
+                        self._orig, 'mark', 'set', pair[0], _index(first))
+                if last > pair_last:
+                    self.tk.call(
+                        self._orig, 'mark', 'set', pair[1], _index(last))
+                self.tk.call(self._orig, 'mark', 'unset', start, end)
+                return
+        self._dirty.append((start, end))
+
+    def _notify(self) -> None:
+        self._notify_job = None
+        ranges = sorted(
+            (self._position(start), self._position(end))
+            for start, end in self._dirty)
+        marks = [mark for pair in self._dirty for mark in pair]
+        if marks:
+            self.tk.call(self._orig, 'mark', 'unset', *marks)
+        self._dirty = []
+
+        merged: list[tuple[tuple, tuple]] = []
+        for first, last in ranges:
+            if merged and first <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(last, merged[-1][1]))
+            else:
+                merged.append((first, last))
+        self.dirty_ranges = [
+            (_index(first), _index(last)) for first, last in merged]
+        self.event_generate('<<TextModified>>')
+
+    def _position(self, index: str) -> tuple[int, int]:
+        line, char = str(
+            self.tk.call(self._orig, 'index', index)).split('.')
+        return int(line), int(char)
+
+    def destroy(self) -> None:
+        if self._notify_job is not None:
+            self.after_cancel(self._notify_job)
+            self._notify_job = None
+        super().destroy()
+
+
+def _index(position: tuple[int, int]) -> str:
+    line, char = position
+    return f'{line}.{char}'
+
 
 def get_styles() -> ttk.Style:
     style = ttk.Style()
@@ -34,3 +34,12 @@ def test_enable_buttons():
     assert str(button['state']) == tk.DISABLED
     enable_buttons([button], True)
     assert str(button['state']) == tk.NORMAL
+
+
+def test_icon_buttons_are_created_on_demand(app):
+    button_frame = ButtonFrame(app)
+    assert not button_frame.winfo_children()
+    button = button_frame.icon_button('save')
+    assert button_frame.winfo_children() == [button]
+    assert button_frame.icon_button('save') is button
+    assert 'close' in button_frame.icon_buttons
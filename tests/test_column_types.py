@@ -0,0 +1,47 @@
+from datetime import datetime
+import pytest
+
+from psiutils._column_types import (
+    infer_type, sort_keys, typed_keys,
+    NUMBER, ISO_DATE, DMY_DATE, DATE, TEXT)
+
+
+@pytest.mark.parametrize("values, expected", [
+    (['3', '4.5', '-1'], NUMBER),
+    (['2024-01-02', '2023-12-13T10:00'], ISO_DATE),
+    (['01/02/2024', '13/12/2023 10:00'], DMY_DATE),
+    (['Jan 3rd 2024', 'March 4 2021'], DATE),
+    (['abc', '1'], TEXT),
+    (['', ''], TEXT),
+])
+def test_infer_type(values, expected):
+    assert infer_type(values) == expected
+
+
+def test_short_values_are_not_dates():
+    assert infer_type(['May', 'June']) == TEXT
+
+
+def test_dmy_keys_are_day_first():
+    kind, keys = sort_keys(['01/02/2024', '13/12/2023'])
+    assert kind == DMY_DATE
+    assert keys == [datetime(2024, 2, 1), datetime(2023, 12, 13)]
+
+
+def test_blank_values_sort_first():
+    _, keys = sort_keys(['2', '', '1'])
+    assert sorted(range(3), key=keys.__getitem__) == [1, 2, 0]
+
+
+def test_remembered_type_is_reinferred_when_it_no_longer_fits():
+    assert sort_keys(['1', '2'], NUMBER) == (NUMBER, [1.0, 2.0])
+    assert sort_keys(['a', '2'], NUMBER) == (TEXT, ['a', '2'])
+
+
+def test_typed_keys_rejects_values_of_another_type():
+    assert typed_keys(['1', 'x'], NUMBER) is None
+
+
+def test_iso_date_falls_back_for_odd_cells():
+    keys = typed_keys(['2024-01-02', '3 Feb 2024'], ISO_DATE)
+    assert keys == [datetime(2024, 1, 2), datetime(2024, 2, 3)]
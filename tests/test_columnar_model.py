@@ -0,0 +1,122 @@
+from array import array
+import pytest
+
+from psiutils import _columnar_model
+from psiutils._columnar_model import ColumnarModel, STR, INT, FLOAT
+
+NAMES = ['carol', 'alice', 'bob', 'alice']
+SCORES = [3.5, 10, 2, 7]
+
+
+@pytest.fixture(params=['numpy', 'array'], autouse=True)
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(_columnar_model, 'np', None)
+    return request.param
+
+
+def test_window_converts_values():
+    model = ColumnarModel([NAMES, SCORES], [STR, FLOAT])
+    assert len(model) == 4
+    assert model.window(1, 2) == [('alice', 10.0), ('bob', 2.0)]
+
+
+def test_strings_are_dictionary_encoded():
+    model = ColumnarModel([NAMES])
+    assert model.columns[0].categories == ['carol', 'alice', 'bob']
+
+
+def test_sort_and_reverse():
+    model = ColumnarModel([NAMES, SCORES], [STR, FLOAT])
+    model.sort(1)
+    assert list(model.order) == [2, 0, 3, 1]
+    model.sort(1, reverse=True)
+    assert list(model.order) == [1, 3, 0, 2]
+    model.sort(0)
+    assert [row[0] for row in model.window(0, 4)] == [
+        'alice', 'alice', 'bob', 'carol']
+
+
+def test_string_columns_sort_by_inferred_type():
+    model = ColumnarModel([['01/02/2024', '13/12/2023']])
+    model.sort(0)
+    assert list(model.order) == [1, 0]
+    model = ColumnarModel([['10', '9', '100']])
+    model.sort(0)
+    assert list(model.order) == [1, 0, 2]
+
+
+def test_int_column_from_array():
+    model = ColumnarModel([array('q', [3, 1, 2])], [INT])
+    model.sort(0)
+    assert model.window(0, 3) == [(1,), (2,), (3,)]
+
+
+def test_lookup_and_find():
+    model = ColumnarModel([NAMES, SCORES], [STR, FLOAT])
+    assert model.lookup(0, ['alice']) == [1, 3]
+    assert model.lookup(1, ['7', 'x']) == [3]
+    model.sort(1)
+    assert model.find(0, 'alice') == 2
+    assert model.find(0, 'dave') is None
+
+
+def test_filter_with_mask():
+    model = ColumnarModel([NAMES, SCORES], [STR, FLOAT])
+    model.sort(1)
+    model.filter(model.mask(1, lambda score: score > 3))
+    assert model.window(0, 4) == [
+        ('carol', 3.5), ('alice', 7.0), ('alice', 10.0)]
+    assert model.position(2) is None
+    assert model.find(0, 'bob') is None
+    assert model.values([2, 1]) == [('alice', 10.0), ('bob', 2.0)]
+    model.filter(None)
+    assert len(model) == 4
+
+
+def test_filter_rejects_wrong_length_mask():
+    model = ColumnarModel([NAMES])
+    with pytest.raises(ValueError):
+        model.filter([True])
+
+
+def test_columns_must_be_the_same_length():
+    with pytest.raises(ValueError):
+        ColumnarModel([NAMES, SCORES[:2]])
+
+
+def test_extend_appends_rows():
+    model = ColumnarModel([NAMES, SCORES], [STR, FLOAT])
+    model.sort(1)
+    model.extend([('dave', '1')])
+    assert model.sort_column == 1
+    assert model.row_id(0) == 4
+    assert model.rows[4] == ('dave', 1.0)
+    assert len(model.rows[1:]) == 4
+
+
+def test_extend_keeps_filter():
+    model = ColumnarModel([NAMES, SCORES], [STR, FLOAT])
+    model.sort(1, reverse=True)
+    model.filter([True, False, True, True])
+    model.extend([('dave', '1'), ('erin', '20')], [False, True])
+    assert model.window(0, 10) == [
+        ('erin', 20.0), ('alice', 7.0), ('carol', 3.5), ('bob', 2.0)]
+    with pytest.raises(ValueError):
+        model.extend([('fred', '1')], [True, False])
+
+
+def test_extend_merges_into_sort():
+    rows = [(f'name {index % 13}', index % 7) for index in range(200)]
+    model = ColumnarModel([[], []], [STR, INT])
+    model.sort(0, reverse=True)
+    for start in range(0, len(rows), 30):
+        model.extend(rows[start:start + 30])
+    fresh = ColumnarModel([[], []], [STR, INT])
+    fresh.extend(rows)
+    fresh.sort(0, reverse=True)
+    assert list(model.order) == list(fresh.order)
+    model.extend([('zoe', 1)])
+    assert model.window(0, 1) == [('zoe', 1)]
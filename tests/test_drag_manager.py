@@ -0,0 +1,37 @@
+import pytest
+
+from psiutils.drag_manager import _TargetIndex
+
+# A seating plan: 20 columns of 10 seats, with gaps between them
+SEATS = [(x * 50, y * 20, x * 50 + 45, y * 20 + 15)
+         for x in range(20) for y in range(10)]
+
+
+def test_find_target():
+    index = _TargetIndex(SEATS)
+    assert index.find(0, 0) == 0
+    assert index.find(45, 15) == 0
+    assert index.find(120, 65) == 23
+    assert index.find(47, 5) is None
+    assert index.find(-1, -1) is None
+
+
+@pytest.mark.parametrize('targets', [
+    SEATS + [(0, 0, 2000, 500)],
+    [(0, 0, 600, 100)] + SEATS,
+])
+def test_find_matches_scan(targets):
+    index = _TargetIndex(targets)
+    assert len(index.large) == 1  # the zone is not put in the cells
+    for x in range(-10, 1010, 7):
+        for y in range(-10, 210, 3):
+            expected = next(
+                (number for number, (left, top, right, bottom)
+                 in enumerate(targets)
+                 if left <= x <= right and top <= y <= bottom),
+                None)
+            assert index.find(x, y) == expected
+
+
+def test_no_targets():
+    assert _TargetIndex([]).find(10, 10) is None
@@ -0,0 +1,36 @@
+import pytest
+import tkinter as tk
+
+from psiutils.file_viewer import FileViewer
+
+
+@pytest.fixture
+def app():
+    return tk.Tk()
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / 'app.log'
+    path.write_text(''.join(f'line {number}\n' for number in range(1, 10_001)))
+    return path
+
+
+def test_viewer_loads_a_window(app, log_file):
+    viewer = FileViewer(app, log_file, window_lines=100)
+    viewer.index._thread.join()
+    viewer.goto_line(1)
+    assert viewer.line_count == 10_000
+    assert int(viewer.text.index('end-1c').split('.')[0]) == 100
+    assert viewer.text.get('1.0', '1.end') == 'line 1'
+
+
+def test_goto_line(app, log_file):
+    viewer = FileViewer(app, log_file, window_lines=100)
+    viewer.index._thread.join()
+    viewer.goto_line(5_000)
+    assert viewer.top_line() == 5_000
+    top = viewer.text.index('@0,0')
+    assert viewer.text.get(top, f'{top} lineend') == 'line 5000'
+    viewer.destroy()
+    assert viewer.index is None
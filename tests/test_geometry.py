@@ -0,0 +1,99 @@
+import os
+from psiconfig import TomlConfig
+
+from psiutils import _geometry
+from psiutils._geometry import geometry_writer, save_atomic
+from psiutils.constants import DEFAULT_GEOMETRY
+from psiutils.utilities import geometry
+
+
+class Root():
+    """Just enough of a Tk window for GeometryWriter."""
+    def __init__(self):
+        self.jobs = {}
+        self.bindings = []
+        self.count = 0
+
+    def after(self, delay, callback):
+        self.count += 1
+        job = f'after#{self.count}'
+        self.jobs[job] = callback
+        return job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def bind(self, sequence, callback, add=None):
+        self.bindings.append(callback)
+
+
+def config_file(tmp_path):
+    path = tmp_path / 'config.toml'
+    path.write_text('colour = "red"\n\n[geometry]\nmain = "10x10+0+0"\n')
+    return path
+
+
+def test_writes_once_settled(tmp_path, monkeypatch):
+    monkeypatch.setattr(_geometry, '_writers', {})
+    monkeypatch.setattr(_geometry, '_documents', {})
+    path = config_file(tmp_path)
+    config = TomlConfig(path)
+    root = Root()
+    writer = geometry_writer(config)
+
+    for width in range(100, 110):
+        writer.set(root, 'main', f'{width}x50+0+0')
+    writer.set(root, 'main', '109x50+0+0')
+    assert len(root.jobs) == 1
+    assert config.geometry['main'] == '109x50+0+0'
+    assert 'main = "10x10+0+0"' in path.read_text()
+
+    # Another setting saved meanwhile is kept
+    path.write_text(path.read_text().replace('red', 'blue'))
+    root.jobs.popitem()[1]()
+    assert TomlConfig(path).geometry == {'main': '109x50+0+0'}
+    assert TomlConfig(path).colour == 'blue'
+    assert writer.pending == {}
+
+
+def test_flush_all(tmp_path, monkeypatch):
+    monkeypatch.setattr(_geometry, '_writers', {})
+    monkeypatch.setattr(_geometry, '_documents', {})
+    path = config_file(tmp_path)
+    geometry_writer(TomlConfig(path)).set(Root(), 'about', '1x2+3+4')
+
+    # A config loaded meanwhile sees the unsaved geometry
+    assert geometry_writer(TomlConfig(path)).config.geometry['about'] \
+        == '1x2+3+4'
+    _geometry.flush_all()
+    assert TomlConfig(path).geometry['about'] == '1x2+3+4'
+
+
+def test_save_atomic(tmp_path):
+    path = tmp_path / 'config.toml'
+    save_atomic(path, {'geometry': {'main': '1x1+0+0'}})
+    assert TomlConfig(path).geometry == {'main': '1x1+0+0'}
+    assert [file.name for file in tmp_path.iterdir()] == ['config.toml']
+
+
+def test_geometry_is_parsed_once_per_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(_geometry, '_writers', {})
+    monkeypatch.setattr(_geometry, '_documents', {})
+    path = config_file(tmp_path)
+    first = _geometry.load_document(path.resolve())
+    assert geometry(path, 'main.py') == '10x10+0+0'
+    assert geometry(TomlConfig(path), 'about') == DEFAULT_GEOMETRY
+    assert _geometry.load_document(path.resolve()) is first
+
+    # A change by another process is picked up
+    path.write_text('[geometry]\nmain = "20x20+0+0"\n')
+    os.utime(path, ns=(0, 0))
+    assert geometry(path, 'main') == '20x20+0+0'
+
+    # Pending and saved changes are seen without parsing the file
+    writer = geometry_writer(TomlConfig(path))
+    writer.set(Root(), 'main', '30x30+0+0')
+    assert geometry(path, 'main') == '30x30+0+0'
+    writer.flush()
+    document = _geometry.load_document(path.resolve())
+    assert document['geometry']['main'] == '30x30+0+0'
@@ -0,0 +1,48 @@
+import pytest
+import tkinter as tk
+
+from psiutils.highlighter import Highlighter
+from psiutils.widgets import PsiText
+
+SOURCE = 'def f():\n    return "text"\n\nx = 1\n'
+
+
+@pytest.fixture
+def app():
+    return tk.Tk()
+
+
+def drain(app, highlighter):
+    while highlighter._tokens is not None:
+        app.update_idletasks()
+    app.update_idletasks()
+
+
+def test_highlight_matches_full_lex(app):
+    text = PsiText(app)
+    text.insert('1.0', SOURCE * 50)
+    highlighter = Highlighter(text, 'python')
+    drain(app, highlighter)
+    assert text.tag_ranges('psi_tokenToken.Keyword')
+
+    text.insert('3.0', '"""')
+    text.insert('10.0', 'y = 2\n')
+    text.delete('20.0', '21.0')
+    app.update_idletasks()
+    drain(app, highlighter)
+    runs = list(highlighter._runs)
+
+    highlighter.rehighlight()
+    drain(app, highlighter)
+    assert highlighter._runs == runs
+
+
+def test_edit_relexes_few_lines(app):
+    text = PsiText(app)
+    text.insert('1.0', SOURCE * 50)
+    highlighter = Highlighter(text, 'python')
+    drain(app, highlighter)
+
+    text.insert('100.0', 'z')
+    app.update_idletasks()
+    assert highlighter._tokens is None
@@ -0,0 +1,27 @@
+import pytest
+import tkinter as tk
+
+from psiutils._images import ICON_DIR, icon_image
+from psiutils._icon_atlas import ICONS
+from psiutils._build_icons import icon_sizes
+
+
+@pytest.fixture(scope="module")
+def tk_root():
+    root = tk.Tk()
+    root.withdraw()  # hide window
+    yield root
+    root.destroy()
+
+
+def test_icon_is_decoded_once_per_size(tk_root):
+    image = icon_image(tk_root, 'save')
+    assert icon_image(tk_root, 'save') is image
+    assert icon_image(tk_root, 'save', (20, 20)) is not image
+    assert image.width() == 16
+
+
+def test_icon_atlas_has_every_icon():
+    for path in ICON_DIR.glob('*.png'):
+        for size in icon_sizes(path.stem):
+            assert (path.stem, size) in ICONS
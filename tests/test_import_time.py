@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+IMPORT_BUDGET_US = 300_000  # import psiutils.buttons, tkinter included
+HEAVY_MODULES = (
+    'tkinterweb', 'markdown', 'PIL', 'structlog', 'psiconfig', 'numpy',
+    'dateutil', 'sqlite3')
+
+
+def _import(module: str) -> tuple[int, set[str]]:
+    """Import module in a fresh interpreter: (microseconds, modules)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         f'import sys, {module}; print(*sys.modules)'],
+        capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue  # e.g. a warning
+        _, cumulative, name = line.rsplit('|', 2)
+        if name.strip() == module:
+            return int(cumulative), set(result.stdout.split())
+    raise AssertionError(f'{module} not imported')
+
+
+def test_import_buttons_within_budget():
+    microseconds, _ = _import('psiutils.buttons')
+    assert microseconds < IMPORT_BUDGET_US
+
+
+def test_heavy_dependencies_are_deferred():
+    for module in ('psiutils.buttons', 'psiutils.widgets',
+                   'psiutils.treeview', 'psiutils.utilities',
+                   'psiutils.file_viewer'):
+        _, modules = _import(module)
+        loaded = {name.split('.')[0] for name in modules}
+        assert not loaded & set(HEAVY_MODULES), module
@@ -0,0 +1,75 @@
+import pytest
+
+from psiutils import _line_index
+from psiutils._line_index import LineIndex
+
+
+@pytest.fixture(params=['numpy', 'bytes'], autouse=True)
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(_line_index, 'np', None)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(_line_index, 'CHUNK_BYTES', 7)
+
+
+def index_of(tmp_path, data: bytes) -> LineIndex:
+    path = tmp_path / 'file.txt'
+    path.write_bytes(data)
+    index = LineIndex(path)
+    index.build()
+    return index
+
+
+def test_lines(tmp_path):
+    index = index_of(tmp_path, b'one\ntwo\n\nfour\nfive')
+    assert len(index) == 5
+    assert list(index.starts) == [0, 4, 8, 9, 14]
+    assert index.text(0, 2) == 'one\ntwo'
+    assert index.text(2, 10) == '\nfour\nfive'
+    assert index.text(5, 1) == ''
+    index.close()
+
+
+def test_trailing_newline_and_crlf(tmp_path):
+    index = index_of(tmp_path, b'one\r\ntwo\r\n')
+    assert len(index) == 2
+    assert index.text(1, 1) == 'two'
+    assert index.text(0, 2) == 'one\ntwo'
+    index.close()
+
+
+def test_empty_file(tmp_path):
+    index = index_of(tmp_path, b'')
+    assert len(index) == 0
+    assert index.text(0, 10) == ''
+    index.close()
+
+
+def test_partial_index(tmp_path):
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'a\n' * 100)
+    index = LineIndex(path)
+    index._scan(0, 50)
+    index.scanned = 50
+    assert len(index) == 25
+    assert index.estimate() == 100
+    index.build()
+    assert len(index) == 100
+    index.close()
+
+
+def test_worker_thread(tmp_path):
+    path = tmp_path / 'big.txt'
+    path.write_bytes(b'line\n' * 10_000)
+    index = LineIndex(path)
+    index.start()
+    index._thread.join()
+    assert index.done
+    assert len(index) == 10_000
+    index.close()
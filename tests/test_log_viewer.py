@@ -0,0 +1,90 @@
+import json
+import pytest
+import tkinter as tk
+
+from psiutils.log_viewer import LogTail, LogViewer, parse_line
+
+
+def record(event: str, level: str = 'info', logger: str = 'app') -> str:
+    return json.dumps({
+        'event': event, 'level': level, 'logger': logger,
+        'timestamp': '2025-01-01T00:00:00Z'}) + '\n'
+
+
+def append(path, text: str) -> None:
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(text)
+
+
+def events(lines) -> list[str]:
+    return [line.record['event'] for line in lines]
+
+
+def test_parse_line():
+    line = parse_line(
+        b'{"event": "saved", "level": "warning", "logger": "db", "rows": 3}')
+    assert (line.level, line.logger) == ('warning', 'db')
+    assert line.text == 'WARNING db saved rows=3'
+    assert parse_line(b'not json').text == 'not json'
+
+
+def test_tail_reads_only_new_lines(tmp_path):
+    path = tmp_path / 'app.log'
+    append(path, record('one') + record('two') + record('three'))
+    tail = LogTail(path, backlog=2)
+    assert events(tail.read()) == ['two', 'three']
+    assert tail.read() == []
+
+    append(path, record('four') + '{"event": "fi')
+    assert events(tail.read()) == ['four']
+    append(path, 've"}\n')
+    assert events(tail.read()) == ['five']
+
+
+def test_tail_follows_rotation(tmp_path):
+    path = tmp_path / 'app.log'
+    append(path, record('one'))
+    tail = LogTail(path)
+    tail.read()
+
+    append(path, record('two'))
+    path.rename(tmp_path / 'app.log.1')
+    append(path, record('three'))
+    assert events(tail.read()) == ['two', 'three']
+
+
+def test_tail_follows_truncation(tmp_path):
+    path = tmp_path / 'app.log'
+    append(path, record('one') + record('two'))
+    tail = LogTail(path)
+    tail.read()
+    path.write_text(record('three'), encoding='utf-8')
+    assert events(tail.read()) == ['three']
+
+
+@pytest.fixture
+def app():
+    return tk.Tk()
+
+
+def test_viewer_filters_from_memory(app, tmp_path):
+    path = tmp_path / 'app.log'
+    append(path, record('one') + record('two', 'error', 'db'))
+    viewer = LogViewer(app, path, max_lines=2)
+    viewer._append(viewer._queue.get(timeout=5))
+    assert viewer.text.get('1.0', 'end-1c').count('\n') == 2
+
+    viewer.set_filter(level='warning')
+    assert viewer.text.get('1.0', 'end-1c') == \
+        '2025-01-01T00:00:00Z ERROR db two\n'
+
+    viewer._append([parse_line(record('three', 'critical').encode())])
+    assert events(viewer.lines) == ['two', 'three']
+    viewer.set_filter(logger='app')
+    assert 'three' in viewer.text.get('1.0', 'end')
+    assert 'two' not in viewer.text.get('1.0', 'end')
+
+
+def test_viewer_needs_path_or_app_name():
+    with pytest.raises(ValueError):
+        LogViewer(None)
@@ -154,3 +154,10 @@ def test_rotating_file_handler_rotation(tmp_path):
     # Check that at least one backup file exists
     backup_exists = any(tmp_path.glob("app.log.*"))
     assert backup_exists
+
+
+def test_utilities_serves_logger_lazily():
+    from psiutils import utilities
+    from psiutils._logger import psi_logger
+    assert utilities.psi_logger is psi_logger
+    assert utilities.logger is psi_logger
@@ -0,0 +1,71 @@
+import pytest
+import tkinter as tk
+
+from psiutils.menus import Menu, MenuItem
+
+
+@pytest.fixture
+def app():
+    return tk.Tk()
+
+
+def test_items_are_updated_by_index(app):
+    items = [MenuItem(f'Item {number}', None, dimmable=number % 2 == 0)
+             for number in range(80)]
+    menu = Menu(app, items)
+    assert [item.index for item in items[:2]] == [
+        menu.index('Item 0'), menu.index('Item 1')]
+
+    menu.enable(False)
+    assert menu.entrycget(items[0].index, 'state') == tk.DISABLED
+    assert menu.entrycget(items[1].index, 'state') == tk.NORMAL
+
+    menu.set_states({items[0]: True, items[1]: False})
+    assert menu.entrycget(items[0].index, 'state') == tk.NORMAL
+    assert menu.entrycget(items[1].index, 'state') == tk.DISABLED
+
+
+def test_disabled_item(app):
+    item = MenuItem('Save', None, dimmable=True, disabled=True)
+    menu = Menu(app, [item])
+    assert menu.entrycget(item.index, 'state') == tk.DISABLED
+    item.enable()
+    assert menu.entrycget(item.index, 'state') == tk.NORMAL
+
+
+def test_lazy_menu(app):
+    builds = []
+    files = ['a.txt', 'b.txt']
+    version = [0]
+
+    def provider():
+        builds.append(version[0])
+        return [MenuItem(file, None) for file in files]
+
+    menu = Menu(app, provider=provider, version=lambda: version[0])
+    assert builds == []
+
+    menu._build()
+    menu._build()
+    assert builds == [0]
+    assert menu.entrycget(menu.menu_items[1].index, 'label') == 'b.txt'
+
+    files.append('c.txt')
+    version[0] += 1
+    menu._build()
+    assert builds == [0, 1]
+    assert menu.index(tk.END) == menu.menu_items[-1].index
+    assert len(menu.menu_items) == 3
+
+
+def test_indexes_found_again_after_outside_changes(app):
+    items = [MenuItem(name, None, dimmable=True)
+             for name in ('Open', 'Save', 'Close')]
+    menu = Menu(app, items)
+    menu.insert_command(0, label='New')
+    menu.delete('Close')
+    menu.set_states({items[1]: False, items[2]: False})
+    assert items[1].index == menu.index('Save')
+    assert menu.entrycget('Save', 'state') == tk.DISABLED
+    assert menu.entrycget('Open', 'state') == tk.NORMAL
+    assert items[2].index is None
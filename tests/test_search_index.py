@@ -0,0 +1,57 @@
+from psiutils._search_index import SearchIndex, normalize
+
+ROWS = [
+    ('Alice', 'Zürich'),
+    ('bob', 'Paris'),
+    ('Carol', 'Lisbon'),
+    ('alicia', 'Paris'),
+]
+
+
+def test_normalize_folds_case_and_accents():
+    assert normalize('Zürich') == 'zurich'
+    assert normalize(42) == '42'
+
+
+def test_search_ignores_case_and_accents():
+    index = SearchIndex(ROWS)
+    assert index.search('ALI') == [0, 3]
+    assert index.search('zur') == [0]
+
+
+def test_blank_search_matches_everything():
+    assert SearchIndex(ROWS).search('') is None
+
+
+def test_search_columns():
+    index = SearchIndex(ROWS, columns=[1])
+    assert index.search('paris') == [1, 3]
+    assert index.search('bob') == []
+
+
+def test_match_does_not_span_cells():
+    assert SearchIndex(ROWS).search('bobparis') == []
+
+
+def test_refinement_narrows_previous_matches():
+    index = SearchIndex(ROWS)
+    assert index.search('l') == [0, 2, 3]
+    index.texts[1] = 'lima'  # only the previous matches are rechecked
+    assert index.search('li') == [0, 2, 3]
+    assert index.search('lic') == [0, 3]
+    assert index.search('l') == [0, 2, 3]  # reused on backspace
+
+
+def test_trigram_candidates():
+    index = SearchIndex(ROWS * 100)
+    assert len(index.search('lisb')) == 100
+    assert index.search('xyz') == []
+
+
+def test_extend_updates_grams_and_results():
+    index = SearchIndex(ROWS)
+    assert index.search('pari') == [1, 3]
+    index.extend([('dora', 'Paris')])
+    assert index.search('pari') == [1, 3, 4]
+    assert index.search('paris') == [1, 3, 4]
+    assert index.search('dor') == [4]
@@ -0,0 +1,92 @@
+import sqlite3
+import pytest
+
+from psiutils.treeview import SqliteSource
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE events (user TEXT, score INTEGER)')
+    connection.executemany(
+        'INSERT INTO events VALUES (?, ?)',
+        [(f'user {index % 7}', index) for index in range(1_000)])
+    return connection
+
+
+def test_needs_table_or_query(connection):
+    with pytest.raises(ValueError):
+        SqliteSource(connection)
+    with pytest.raises(ValueError):
+        SqliteSource(connection, query='SELECT * FROM events')
+
+
+def test_default_columns(connection):
+    source = SqliteSource(connection, table='events')
+    assert source.columns == ['user', 'score']
+    assert len(source) == 1_000
+
+
+def test_window_pages(connection):
+    source = SqliteSource(connection, table='events', page_size=50)
+    assert source.window(0, 2) == [('user 0', 0), ('user 1', 1)]
+    assert source.window(998, 5) == [('user 4', 998), ('user 5', 999)]
+    assert source.row_id(998) == 999  # rowids start at 1
+
+
+def test_sort_is_order_by(connection):
+    source = SqliteSource(connection, table='events')
+    source.sort(1, reverse=True)
+    assert source.window(0, 2) == [('user 5', 999), ('user 4', 998)]
+    source.sort(0)
+    assert source.window(0, 2) == [('user 0', 0), ('user 0', 7)]
+
+
+def test_filter_is_where(connection):
+    source = SqliteSource(connection, table='events')
+    source.filter('user = ?', ('user 3',))
+    assert len(source) == 143
+    assert source.window(0, 1) == [('user 3', 3)]
+
+
+def test_find_and_position(connection):
+    source = SqliteSource(connection, table='events')
+    source.sort(1, reverse=True)
+    assert source.find(1, 990) == 9
+    assert source.find(1, '990') == 9
+    assert source.find(1, 5_000) is None
+    assert source.position(source.row_id(42)) == 42
+
+
+def test_lookup_and_values(connection):
+    source = SqliteSource(connection, table='events')
+    keys = source.lookup(1, [3, 5, 700])
+    assert sorted(keys) == [4, 6, 701]
+    source.sort(1, reverse=True)
+    assert source.values(keys) == [('user 0', 700), ('user 5', 5),
+                                   ('user 3', 3)]
+
+
+def test_query_source(connection):
+    source = SqliteSource(
+        connection,
+        query='SELECT rowid AS id, user, score FROM events WHERE score < 10',
+        columns=['user', 'score'],
+        key='id')
+    assert len(source) == 10
+    assert source.row_id(0) == 1
+    assert source.window(9, 5) == [('user 2', 9)]
+
+
+def test_row_ids_are_the_filtered_keys(connection):
+    source = SqliteSource(connection, table='events')
+    assert len(source.row_ids()) == 1_000
+    source.filter('score < 3')
+    assert sorted(source.row_ids()) == [1, 2, 3]
+
+
+def test_values_include_rows_hidden_by_filter(connection):
+    source = SqliteSource(connection, table='events')
+    source.filter('score < 10')
+    assert source.values([701, 4, 6]) == [
+        ('user 3', 3), ('user 5', 5), ('user 0', 700)]
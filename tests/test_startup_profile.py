@@ -0,0 +1,35 @@
+from psiutils.startup_profile import (
+    Profile, compare, parse_importtime, profile)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     PIL._version
+import time:      2000 |       2100 |   PIL
+import time:       500 |       2600 | psiutils.messagebox
+"""
+
+
+def test_parse_importtime():
+    tree = parse_importtime(IMPORTTIME)
+    assert [(entry.name, entry.depth) for entry in tree] == [
+        ('PIL._version', 2), ('PIL', 1), ('psiutils.messagebox', 0)]
+
+
+def test_dependencies_are_attributed():
+    item = Profile('psiutils.messagebox', tree=parse_importtime(IMPORTTIME))
+    assert item.import_us == 2600
+    assert item.dependencies() == {'PIL': 2100}
+
+
+def test_compare_flags_regressions():
+    item = Profile('psiutils.messagebox', tree=parse_importtime(IMPORTTIME))
+    assert not compare([item], {'psiutils.messagebox': {'import_us': 2500}})
+    item.tree[-1].cumulative_us = 20_000
+    assert compare([item], {'psiutils.messagebox': {'import_us': 2500}})
+
+
+def test_profile_in_fresh_interpreter():
+    item = profile('psiutils.text')
+    assert not item.error
+    assert item.import_us > 0
+    assert profile('psiutils.no_such_module').error
@@ -0,0 +1,432 @@
+import pytest
+import sqlite3
+import tkinter as tk
+from types import SimpleNamespace
+
+from psiutils._row_model import RowModel
+from psiutils.treeview import (
+    Treeview, CheckTreeView, ColumnDefn, SqliteSource, TreeviewLoader,
+    CONTROL_MASK)
+
+COLUMN_DEFS = [
+    ColumnDefn('id', '', 20),
+    ColumnDefn('name', 'Name', 100),
+    ColumnDefn('score', 'Score', 50),
+]
+
+ROWS = [
+    ('carol', '3.5'),
+    ('alice', '10'),
+    ('bob', '2'),
+]
+
+
+@pytest.fixture(scope="module")
+def tk_root():
+    root = tk.Tk()
+    root.withdraw()  # hide window
+    yield root
+    root.destroy()
+
+
+def test_model_window():
+    model = RowModel(ROWS)
+    assert len(model) == 3
+    assert model.window(1, 5) == [('alice', '10'), ('bob', '2')]
+
+
+def test_model_sort_keeps_row_ids():
+    model = RowModel(ROWS)
+    model.sort(1)
+    assert model.window(0, 3) == [ROWS[2], ROWS[0], ROWS[1]]
+    assert model.order == [2, 0, 1]
+    assert model.row_id(0) == 2
+
+
+def test_model_sort_text():
+    model = RowModel(ROWS)
+    model.sort(0, reverse=True)
+    assert [row[0] for row in model.window(0, 3)] == ['carol', 'bob', 'alice']
+
+
+def test_model_sort_keys_are_typed_and_cached():
+    model = RowModel(ROWS)
+    keys = model.sort_keys(1)
+    assert keys == [3.5, 10.0, 2.0]
+    assert model.sort_keys(1) is keys
+    assert model.sort_keys(0) == ['carol', 'alice', 'bob']
+
+
+def test_model_reverse_sort():
+    model = RowModel(ROWS)
+    model.sort(1)
+    model.sort(1, reverse=True)
+    assert model.order == [1, 0, 2]
+    model.sort(0)
+    assert model.order == [1, 2, 0]
+
+
+def test_model_load_clears_sort_cache():
+    model = RowModel(ROWS)
+    model.sort(1)
+    model.load([('x', 'b'), ('y', 'a')])
+    assert model.sort_column is None
+    model.sort(1)
+    assert model.order == [1, 0]
+
+
+def test_model_remembers_column_types():
+    model = RowModel([('01/02/2024',), ('13/12/2023',)])
+    model.sort(0)
+    assert model.column_types[0] == 'dmy_date'
+    assert model.order == [1, 0]
+    model.load([('02/02/2024',), ('01/02/2024',)])
+    assert model.column_types[0] == 'dmy_date'
+    model.sort(0)
+    assert model.order == [1, 0]
+
+
+def test_model_find():
+    model = RowModel(ROWS)
+    assert model.find(0, 'bob') == 2
+    assert model.find(0, 'dave') is None
+
+
+def test_model_index_lookup():
+    model = RowModel(ROWS + [('alice', 7)])
+    model.add_index(0)
+    assert sorted(model.lookup(0, ['alice', 'bob'])) == [1, 2, 3]
+    assert model.lookup(1, [7]) == [3]
+    assert model.lookup(1, ['7']) == [3]
+
+
+def test_model_index_rebuilt_on_load():
+    model = RowModel(ROWS)
+    model.add_index(0)
+    model.load([('dave', '1')])
+    assert model.lookup(0, ['dave']) == [0]
+    assert model.lookup(0, ['alice']) == []
+
+
+def test_model_find_returns_first_displayed():
+    model = RowModel([('a', '2'), ('b', '1'), ('a', '0')])
+    model.add_index(0)
+    model.sort(1)
+    assert model.find(0, 'a') == 0
+    assert model.position(0) == 2
+
+
+def test_virtual_populate_materializes_window(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True, height=10)
+    tree.populate([(f'name {i}', str(i)) for i in range(10_000)])
+    assert len(tree.model) == 10_000
+    assert len(tree.get_children()) <= 10 + tree.overscan
+
+
+def test_virtual_select_item_scrolls_to_row(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True, height=10)
+    tree.populate([(f'name {i}', str(i)) for i in range(1_000)])
+    tree.select_item('name', 'name 500')
+    assert tree.selected_rows() == [('name 500', '500')]
+    first, last = tree.yview()
+    assert first <= 0.5 < last
+
+
+def test_virtual_click_replaces_selection(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True, height=10)
+    tree.populate([(f'name {i}', str(i)) for i in range(1_000)])
+    tree.select_item('name', 'name 500')
+    tree._scroll_to(0)
+    first, second = tree.get_children()[:2]
+
+    def click(iid, state=0):
+        tree.identify_row = lambda y: iid
+        tree._on_click(SimpleNamespace(state=state, y=0))
+        tree.selection_add(iid)  # as the class binding would
+        tree._sync_selection()
+
+    click(first)
+    assert tree.selected_rows() == [('name 0', '0')]
+    click(second, CONTROL_MASK)
+    assert tree.selected_rows() == [('name 0', '0'), ('name 1', '1')]
+
+
+def test_virtual_items_are_not_inserted_directly(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True)
+    tree.populate(ROWS)
+    with pytest.raises(ValueError):
+        tree.insert('', 'end', values=('dave', '1'))
+    with pytest.raises(ValueError):
+        tree.delete(tree.get_children()[0])
+
+
+def test_virtual_check_tree_view(tk_root):
+    tree = CheckTreeView(tk_root, COLUMN_DEFS, virtual=True, height=10)
+    tree.populate([(f'name {i}', str(i)) for i in range(1_000)], checked=True)
+    assert len(tree.checked_items()) == 1_000
+
+
+def test_sort_columns_reorders_items(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS)
+    tree.populate(ROWS)
+    tree._sort_columns('score', False)
+    values = [tree.item(iid, 'values')[0] for iid in tree.get_children()]
+    assert values == ['bob', 'carol', 'alice']
+
+
+def test_select_items(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, index_columns=('name',))
+    tree.populate(ROWS)
+    tree.select_items('name', ['alice', 'bob'])
+    selected = {tree.item(iid, 'values')[0] for iid in tree.selection()}
+    assert selected == {'alice', 'bob'}
+
+
+def test_keyed_populate_keeps_unchanged_items(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, key='name')
+    tree.populate(ROWS)
+    iids = {tree.item(iid, 'values')[0]: iid for iid in tree.get_children()}
+    tree.selection_set(iids['alice'])
+
+    tree.populate([('alice', '11'), ('bob', '2'), ('dave', '1')])
+    children = tree.get_children()
+    assert len(children) == 3
+    assert iids['alice'] in children
+    assert iids['carol'] not in children
+    assert tree.item(iids['alice'], 'values')[1] == '11'
+    assert tree.selection() == (iids['alice'],)
+
+
+def test_keyed_populate_keeps_sort(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, key='name')
+    tree.populate(ROWS)
+    tree._sort_columns('name', False)
+    tree.populate([('zoe', '1'), ('alice', '10')])
+    values = [tree.item(iid, 'values')[0] for iid in tree.get_children()]
+    assert values == ['alice', 'zoe']
+
+
+def test_keyed_populate_rejects_duplicate_keys(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, key='name', virtual=True)
+    with pytest.raises(ValueError):
+        tree.populate([('alice', '1'), ('alice', '2')])
+
+
+def test_rejected_keyed_populate_keeps_rows(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, key='name')
+    tree.populate(ROWS)
+    with pytest.raises(ValueError):
+        tree.populate([('alice', '1'), ('alice', '2')])
+    assert tree.model.rows == ROWS
+    tree._sort_columns('name', False)
+    values = [tree.item(iid, 'values')[0] for iid in tree.get_children()]
+    assert values == ['alice', 'bob', 'carol']
+
+
+def test_model_extend_updates_index():
+    model = RowModel(ROWS)
+    model.add_index(0)
+    model.extend([('dave', '1')])
+    assert len(model) == 4
+    assert model.lookup(0, ['dave']) == [3]
+
+
+def test_model_extend_keeps_sort_and_filter():
+    model = RowModel(ROWS)
+    model.sort(0, reverse=True)
+    model.filter([True, True, False])
+    model.extend([('dave', '1'), ('abe', '4')], [True, False])
+    assert model.sort_column == 0
+    assert model.window(0, 10) == [
+        ('dave', '1'), ('carol', '3.5'), ('alice', '10')]
+    model.extend([('bea', '5')])
+    assert model.window(2, 10) == [('bea', '5'), ('alice', '10')]
+
+
+def test_model_extend_merges_into_sort():
+    rows = [(str(index % 13), str(index % 7)) for index in range(200)]
+    model = RowModel()
+    model.sort(0)
+    for start in range(0, len(rows), 30):
+        model.extend(rows[start:start + 30])
+    fresh = RowModel(rows)
+    fresh.sort(0)
+    assert model.order == fresh.order
+    model.extend([('ten', '1')])  # no longer numbers: sorted as text
+    assert model.row(len(model) - 1) == ('ten', '1')
+    assert model.row(0) == ('0', '0')
+
+
+def test_chunked_populate_from_generator(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS)
+    done = []
+    tree.populate(
+        ((f'name {i}', str(i)) for i in range(5_000)),
+        chunked=True, on_done=done.append)
+    assert tree.get_children()
+    while not done:
+        tk_root.update()
+    assert done == [5_000]
+    assert len(tree.get_children()) == 5_000
+
+
+def test_cancel_chunked_populate(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS)
+    cancelled = []
+    tree.populate(
+        ((f'name {i}', str(i)) for i in range(1_000_000)),
+        chunked=True, on_cancel=cancelled.append)
+    tree.cancel_populate()
+    assert cancelled and cancelled[0] < 1_000_000
+
+
+def test_loader_feeds_treeview_from_thread(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True)
+    done = []
+    loader = TreeviewLoader(
+        tree,
+        lambda: ((f'name {i}', str(i)) for i in range(2_000)),
+        batch_size=100,
+        on_done=done.append)
+    loader.start()
+    while not done:
+        tk_root.update()
+    assert done == [2_000]
+    assert len(tree.model) == 2_000
+
+
+def test_loader_reports_producer_errors(tk_root):
+    def producer():
+        yield ('alice', '1')
+        raise OSError('disk')
+
+    tree = Treeview(tk_root, COLUMN_DEFS)
+    errors = []
+    loader = TreeviewLoader(tree, producer, on_error=errors.append)
+    loader.start()
+    while loader.running:
+        tk_root.update()
+    assert isinstance(errors[0], OSError)
+
+
+def test_virtual_treeview_with_sqlite_source(tk_root):
+    import sqlite3
+    from psiutils.treeview import SqliteSource
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE scores (name TEXT, score INTEGER)')
+    connection.executemany(
+        'INSERT INTO scores VALUES (?, ?)',
+        [(f'name {i}', i) for i in range(10_000)])
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True, height=10)
+    tree.set_source(SqliteSource(connection, table='scores'))
+    assert len(tree.get_children()) <= 10 + tree.overscan
+
+    tree._sort_columns('score', True)
+    assert tree.item(tree.get_children()[0], 'values')[0] == 'name 9999'
+    tree.select_item('name', 'name 5000')
+    assert tree.selected_rows() == [('name 5000', 5000)]
+
+
+def test_populate_from_column_arrays(tk_root):
+    column_defs = COLUMN_DEFS[:2] + [ColumnDefn('score', 'Score', 50, 'float')]
+    tree = Treeview(tk_root, column_defs, virtual=True, height=10)
+    tree.populate({
+        'name': [f'name {i}' for i in range(10_000)],
+        'score': [float(i) for i in range(10_000)],
+    })
+    assert len(tree.model) == 10_000
+    tree._sort_columns('score', True)
+    assert tree.item(tree.get_children()[0], 'values')[0] == 'name 9999'
+    tree.model.filter(tree.model.mask(0, lambda name: name.endswith('7')))
+    tree.refresh()
+    assert len(tree.model) == 1_000
+
+
+def test_filter_narrows_rows(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True, height=10)
+    tree.populate([(f'name {i}', str(i)) for i in range(1_000)])
+    tree.filter('NAME 99', delay=0)
+    assert len(tree.model) == 11
+    tree.filter('name 999', delay=0)
+    assert tree.model.window(0, 5) == [('name 999', '999')]
+    tree.populate([('name 999', '1'), ('other', '2')])
+    assert len(tree.model) == 1
+    tree.filter('', delay=0)
+    assert len(tree.model) == 2
+
+
+def test_filter_non_virtual(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS)
+    tree.populate(ROWS)
+    tree.filter('o', delay=0)
+    values = [tree.item(iid, 'values')[0] for iid in tree.get_children()]
+    assert values == ['carol', 'bob']
+
+
+def test_edit_while_filtered_keeps_hidden_rows(tk_root):
+    tree = CheckTreeView(tk_root, COLUMN_DEFS)
+    tree.populate(ROWS, checked=True)
+    tree.filter('o', delay=0)
+    tree.set(tree.get_children()[0], 'score', '4')
+    tree._sort_columns('name', False)
+    values = [tree.item(iid, 'values')[0] for iid in tree.get_children()]
+    assert values == ['bob', 'carol']
+    tree.filter('', delay=0)
+    values = [tree.item(iid, 'values') for iid in tree.get_children()]
+    assert values == [('alice', '10'), ('bob', '2'), ('carol', '4')]
+    assert len(tree.checked_items()) == 3
+
+
+def test_check_tree_view_bulk_checks(tk_root):
+    tree = CheckTreeView(tk_root, COLUMN_DEFS)
+    tree.populate(ROWS)
+    tree.check_all()
+    assert tree.checked_items() == ROWS
+    tree.set_checked('name', ['alice', 'bob'])
+    assert tree.checked_items() == ROWS[1:]
+    tree.invert()
+    assert tree.checked_items() == ROWS[:1]
+    assert tree.tag_has('checked') == (tree.get_children()[0],)
+    tree.uncheck_all()
+    assert tree.checked_items() == []
+
+
+def test_sort_sees_items_edited_in_place(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS)
+    tree.populate(ROWS)
+    first = tree.get_children()[0]
+    tree.item(first, values=('zed', '3.5'))
+    tree.set(tree.get_children()[1], 'score', '99')
+    tree._sort_columns('name', False)
+    values = [tree.item(iid, 'values') for iid in tree.get_children()]
+    assert values == [('alice', '99'), ('bob', '2'), ('zed', '3.5')]
+
+
+def test_check_tree_view_bulk_checks_source(tk_root):
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE people (name TEXT, score TEXT)')
+    connection.executemany('INSERT INTO people VALUES (?, ?)', ROWS)
+    tree = CheckTreeView(tk_root, COLUMN_DEFS, virtual=True)
+    tree.set_source(SqliteSource(connection, table='people'))
+    tree.check_all()
+    assert tree.checked_items() == ROWS
+    tree.set_checked('name', ['alice'])
+    tree.invert()
+    assert tree.checked_items() == [ROWS[0], ROWS[2]]
+    tree.append_rows([('dave', '1')], checked=True)
+    assert tree.checked_items() == [('dave', '1')]
+
+
+def test_append_filters_only_new_rows(tk_root):
+    tree = Treeview(tk_root, COLUMN_DEFS, virtual=True, height=10)
+    tree.populate([(f'name {i}', str(i)) for i in range(1_000)])
+    tree._sort_columns('score', True)
+    tree.filter('name 9', delay=0)
+    tree._offset = 5
+    tree.append_rows([('name 1000', '1000'), ('name 9000', '9000')])
+    assert tree._offset == 5
+    assert tree.model.sort_column == 1
+    assert tree.model.window(0, 2) == [
+        ('name 9000', '9000'), ('name 999', '999')]
+    assert len(tree.model) == 112
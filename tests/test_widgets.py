@@ -0,0 +1,52 @@
+import pytest
+import tkinter as tk
+
+from psiutils.widgets import PsiText
+
+
+@pytest.fixture
+def app():
+    return tk.Tk()
+
+
+def test_text_modified_per_change(app):
+    text = PsiText(app)
+    events = []
+    text.bind('<<TextModified>>', events.append)
+    text.insert('1.0', 'abc')
+    text.delete('1.0')
+    assert len(events) == 2
+
+
+def test_text_modified_coalesced(app):
+    text = PsiText(app, coalesce=True)
+    text.insert('1.0', 'one\ntwo\nthree\nfour\n')
+    app.update_idletasks()
+
+    ranges = []
+    text.bind('<<TextModified>>',
+              lambda event: ranges.append(text.dirty_ranges))
+    text.insert('1.0', 'x')
+    text.insert('1.1', 'y')
+    text.insert('4.0', 'z')
+    text.delete('4.0')
+    assert ranges == []
+
+    app.update_idletasks()
+    assert ranges == [[('1.0', '1.2'), ('4.0', '4.0')]]
+    assert text.get('1.0', '1.end') == 'xyone'
+
+
+def test_separate_edits_merged_when_notified(app):
+    text = PsiText(app, coalesce=True)
+    text.insert('1.0', 'one\ntwo\nthree\nfour\n')
+    app.update_idletasks()
+
+    ranges = []
+    text.bind('<<TextModified>>',
+              lambda event: ranges.append(text.dirty_ranges))
+    text.insert('1.0', 'x')
+    text.insert('4.0', 'z')
+    text.insert('1.1', 'y')  # not next to the latest range
+    app.update_idletasks()
+    assert ranges == [[('1.0', '1.2'), ('4.0', '4.1')]]